@@ -0,0 +1,81 @@
+"""Benchmark the memory held per item by different inventory representations.
+
+Builds synthetic drive items shaped like real Graph responses and reports the
+bytes retained per item by a plain ``list[DriveItemInfo]`` and by
+``DriveItemTable`` with and without URLs.
+
+Usage::
+
+    poetry run python scripts/bench_item_memory.py [items]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.onedrive import _dict_to_drive_item_info  # noqa: E402
+from src.table import DriveItemTable  # noqa: E402
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from src.onedrive import DriveItemInfo
+
+_MIME_TYPES = ("text/csv", "application/pdf", "image/png", "application/zip")
+
+
+def make_items(count: int) -> Iterator[DriveItemInfo]:
+    """Yield *count* items spread over folders of 500 files each."""
+    for i in range(count):
+        yield _dict_to_drive_item_info(
+            {
+                "id": f"01ABCDEF{i:012d}",
+                "name": f"export-{i:08d}.csv",
+                "size": 1024 + i,
+                "file": {"mimeType": _MIME_TYPES[i % len(_MIME_TYPES)]},
+                "createdDateTime": "2024-05-01T10:00:00Z",
+                "lastModifiedDateTime": "2024-05-02T11:30:00.123Z",
+                "webUrl": f"https://contoso.sharepoint.com/Shared%20Documents/export-{i}.csv",
+                "parentReference": {"id": f"01PARENT{i // 500:012d}"},
+                "@microsoft.graph.downloadUrl": f"https://contoso.sharepoint.com/download?id={i}",
+            }
+        )
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated by the object *build* returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    print(f"{count:,} items")
+    for name, build in (
+        ("list[DriveItemInfo]", lambda: list(make_items(count))),
+        ("DriveItemTable", lambda: DriveItemTable(make_items(count))),
+        (
+            "DriveItemTable+urls",
+            lambda: DriveItemTable(make_items(count), keep_urls=True),
+        ),
+    ):
+        print(f"  {name:20s} {measure(build) / count:8.1f} bytes/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark Kiota model parsing against the raw-JSON listing fast path.
+
+Builds a synthetic ``children`` page shaped like a real Graph response and
+times how quickly each path turns it into ``DriveItemInfo`` objects.
+
+Usage::
+
+    poetry run python scripts/bench_listing_parse.py [items_per_page] [pages]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+
+from kiota_serialization_json.json_parse_node_factory import JsonParseNodeFactory
+from msgraph.generated.models.drive_item_collection_response import (
+    DriveItemCollectionResponse,
+)
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.onedrive import _dict_to_drive_item_info, _to_drive_item_info  # noqa: E402
+
+
+def make_page(count: int, *, full: bool) -> bytes:
+    """Return a JSON children page with *count* file items."""
+    items = []
+    for i in range(count):
+        item = {
+            "id": f"01ABCDEF{i:012d}",
+            "name": f"export-{i:06d}.csv",
+            "size": 1024 + i,
+            "file": {
+                "mimeType": "text/csv",
+                "hashes": {"quickXorHash": "A" * 27 + "="},
+            },
+            "createdDateTime": "2024-05-01T10:00:00Z",
+            "lastModifiedDateTime": "2024-05-02T11:30:00.123Z",
+            "webUrl": f"https://contoso.sharepoint.com/Shared%20Documents/export-{i}.csv",
+            "parentReference": {
+                "driveId": "b!xyz",
+                "id": "01PARENT",
+                "path": "/drive/root:",
+            },
+            "@microsoft.graph.downloadUrl": f"https://contoso.sharepoint.com/download?id={i}",
+        }
+        if full:
+            identity = {
+                "user": {"displayName": "Jane Doe", "email": "jane@contoso.com"}
+            }
+            item |= {
+                "eTag": f'"{{{i:08d}-0000-0000-0000-000000000000}},1"',
+                "cTag": f'"c:{{{i:08d}-0000-0000-0000-000000000000}},1"',
+                "createdBy": identity,
+                "lastModifiedBy": identity,
+                "fileSystemInfo": {
+                    "createdDateTime": "2024-05-01T10:00:00Z",
+                    "lastModifiedDateTime": "2024-05-02T11:30:00Z",
+                },
+                "shared": {"scope": "users"},
+            }
+        items.append(item)
+    return json.dumps({"value": items}).encode()
+
+
+def bench_kiota(payload: bytes) -> int:
+    """Parse through Kiota ``DriveItem`` models, as the SDK does."""
+    node = JsonParseNodeFactory().get_root_parse_node("application/json", payload)
+    page = node.get_object_value(DriveItemCollectionResponse)
+    return len([_to_drive_item_info(item) for item in page.value or []])
+
+
+def bench_raw(payload: bytes) -> int:
+    """Decode with ``json.loads`` and build ``DriveItemInfo`` from dicts."""
+    page = json.loads(payload)
+    return len([_dict_to_drive_item_info(item) for item in page["value"]])
+
+
+def main() -> None:
+    per_page = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    pages = int(sys.argv[2]) if len(sys.argv) > 2 else 50  # noqa: PLR2004
+
+    for full in (False, True):
+        payload = make_page(per_page, full=full)
+        label = "full payload" if full else "$select payload"
+        print(
+            f"{label}: {per_page} items/page x {pages} pages, {len(payload)} bytes/page"
+        )
+        for name, func in (("kiota", bench_kiota), ("raw-json", bench_raw)):
+            start = time.perf_counter()
+            total = sum(func(payload) for _ in range(pages))
+            elapsed = time.perf_counter() - start
+            print(f"  {name:9s} {total / elapsed:12,.0f} items/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark quickXorHash throughput against a reference implementation.
+
+The reference is a direct port of Microsoft's published C# algorithm, which
+visits every byte from Python.  It is timed on a small buffer; the other
+modes hash a temporary file of the requested size.
+
+Usage::
+
+    poetry run python scripts/bench_quickxor.py [megabytes] [files]
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src import hashing  # noqa: E402
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def reference_quickxor(data: bytes) -> str:
+    """Port of the C# ``QuickXorHash`` reference, one byte at a time."""
+    cells = [0, 0, 0]
+    index, offset = 0, 0
+    for i in range(min(len(data), 160)):
+        bits = 32 if index == 2 else 64  # noqa: PLR2004
+        folded = 0
+        for j in range(i, len(data), 160):
+            folded ^= data[j]
+        cells[index] ^= (folded << offset) & _MASK64
+        if offset > bits - 8:
+            cells[0 if index == 2 else index + 1] ^= folded >> (bits - offset)  # noqa: PLR2004
+        offset += 11
+        if offset >= bits:
+            offset -= bits
+            index = 0 if index == 2 else index + 1  # noqa: PLR2004
+    digest = bytearray(
+        cells[0].to_bytes(8, "little")
+        + cells[1].to_bytes(8, "little")
+        + (cells[2] & 0xFFFFFFFF).to_bytes(4, "little")
+    )
+    for i, byte in enumerate(len(data).to_bytes(8, "little")):
+        digest[12 + i] ^= byte
+    return base64.b64encode(bytes(digest)).decode("ascii")
+
+
+def report(label: str, nbytes: int, seconds: float) -> None:
+    print(f"{label:28s} {nbytes / seconds / 1e9:8.3f} GB/s")
+
+
+def timed(func, *args, **kwargs):  # noqa: ANN001, ANN002, ANN003, ANN202
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+    files = int(sys.argv[2]) if len(sys.argv) > 2 else 8  # noqa: PLR2004
+    size = megabytes * 1024 * 1024
+
+    sample = os.urandom(4 * 1024 * 1024)
+    expected, elapsed = timed(reference_quickxor, sample)
+    report("reference (C# port)", len(sample), elapsed)
+    assert hashing.hash_bytes(sample, with_sha1=False)[0] == expected
+
+    saved_numpy = hashing.np
+    hashing.np = None
+    _, elapsed = timed(hashing.hash_bytes, sample * 16, with_sha1=False)
+    report("big-integer fold", len(sample) * 16, elapsed)
+    hashing.np = saved_numpy
+    if hashing.np is None:
+        print("numpy not installed; install the 'fast' extra for vectorized modes")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(files):
+            path = Path(tmp) / f"blob-{i}"
+            with path.open("wb") as fh:
+                for _ in range(size // len(sample)):
+                    fh.write(sample)
+            paths.append(path)
+
+        hashing.hash_file(paths[0], with_sha1=False)  # warm the page cache
+        _, elapsed = timed(hashing.hash_file, paths[0], with_sha1=False)
+        report("mmap file", size, elapsed)
+        _, elapsed = timed(hashing.hash_file, paths[0], with_sha1=True)
+        report("mmap file + SHA-1", size, elapsed)
+
+        with paths[0].open("rb") as stream:
+            _, elapsed = timed(hashing.hash_stream, stream, with_sha1=False)
+        report("incremental 4 MiB chunks", size, elapsed)
+
+        _, elapsed = timed(hashing.hash_files, paths, max_workers=1)
+        report(f"{files} files, 1 process", size * files, elapsed)
+        _, elapsed = timed(hashing.hash_files, paths)
+        report(f"{files} files, {os.cpu_count()} processes", size * files, elapsed)
+
+
+if __name__ == "__main__":
+    main()
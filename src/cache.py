@@ -0,0 +1,209 @@
+"""In-process caches for drive item metadata.
+
+``MetadataCache`` keeps recently fetched ``DriveItemInfo`` objects and folder
+listings so repeated lookups of the same item or folder are answered without
+a Graph round trip.  Entries expire after a fixed TTL and the cache is bounded
+by evicting the least recently used entries.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.onedrive import DriveItemInfo
+
+# Key namespaces: a single item vs. the children listing of a folder.
+_ITEM = "item"
+_CHILDREN = "children"
+
+
+class MetadataCache:
+    """TTL + LRU cache of item metadata and folder listings.
+
+    Items are keyed by ``(drive_id, item_id)`` and listings by
+    ``(drive_id, folder_id)``, using the IDs exactly as passed to the client
+    (so ``"root"`` and the root's real ID are tracked as aliases).
+
+    Parameters
+    ----------
+    max_entries:
+        Maximum number of items plus listings kept.  The least recently used
+        entry is evicted when the bound is exceeded.
+    ttl:
+        Seconds an entry stays valid after it was stored.
+    clock:
+        Monotonic time source, overridable for testing.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl: float = 30.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            msg = "max_entries must be at least 1"
+            raise ValueError(msg)
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str, str], tuple[float, Any]] = (
+            OrderedDict()
+        )
+        # Real folder ID -> other IDs its listing was cached under (e.g. "root").
+        self._aliases: dict[tuple[str, str], set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: tuple[str, str, str]) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def _put(self, key: tuple[str, str, str], value: Any) -> None:
+        self._entries[key] = (self._clock() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def get_item(self, drive_id: str, item_id: str) -> DriveItemInfo | None:
+        """Return cached metadata for an item, or ``None`` on a miss."""
+        return self._get((_ITEM, drive_id, item_id))
+
+    def put_item(
+        self, drive_id: str, info: DriveItemInfo, item_id: str | None = None
+    ) -> None:
+        """Store metadata for an item under its ID (or the ID it was requested by)."""
+        self._put((_ITEM, drive_id, item_id or info.id), info)
+        if item_id is not None and item_id != info.id:
+            self._put((_ITEM, drive_id, info.id), info)
+
+    def get_children(self, drive_id: str, folder_id: str) -> list[DriveItemInfo] | None:
+        """Return a cached folder listing, or ``None`` on a miss."""
+        children = self._get((_CHILDREN, drive_id, folder_id))
+        return None if children is None else list(children)
+
+    def put_children(
+        self, drive_id: str, folder_id: str, children: list[DriveItemInfo]
+    ) -> None:
+        """Store a folder listing and the metadata of each child."""
+        self._put((_CHILDREN, drive_id, folder_id), tuple(children))
+        for child in children:
+            self._put((_ITEM, drive_id, child.id), child)
+            if child.parent_id and child.parent_id != folder_id:
+                self._aliases.setdefault((drive_id, child.parent_id), set()).add(
+                    folder_id
+                )
+
+    def invalidate_item(self, drive_id: str, item_id: str) -> None:
+        """Drop an item, its own listing, and the listing of its cached parent."""
+        entry = self._entries.pop((_ITEM, drive_id, item_id), None)
+        if entry is not None and entry[1].parent_id:
+            self.invalidate_children(drive_id, entry[1].parent_id)
+        self.invalidate_children(drive_id, item_id)
+
+    def invalidate_children(self, drive_id: str, folder_id: str) -> None:
+        """Drop the cached listing of a folder, including any aliases of it."""
+        self._entries.pop((_CHILDREN, drive_id, folder_id), None)
+        for alias in self._aliases.pop((drive_id, folder_id), ()):
+            self._entries.pop((_CHILDREN, drive_id, alias), None)
+
+    def invalidate_drive(self, drive_id: str) -> None:
+        """Drop every entry belonging to a drive."""
+        for key in [key for key in self._entries if key[1] == drive_id]:
+            del self._entries[key]
+        for key in [key for key in self._aliases if key[0] == drive_id]:
+            del self._aliases[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._aliases.clear()
+
+
+def _normalize_path(path: str) -> str:
+    """Canonical form of a drive-relative path (OneDrive paths ignore case)."""
+    return "/".join(part for part in path.split("/") if part).casefold()
+
+
+class PathIndex:
+    """Bounded per-drive map from drive-relative paths to item IDs.
+
+    Lets path-based operations skip the ``root:/{path}:`` resolution round
+    trip for folders that were resolved or listed before.  Entries are
+    trusted until Graph reports the ID as missing (404), at which point the
+    caller should :meth:`discard` it and resolve again.
+
+    Parameters
+    ----------
+    max_entries_per_drive:
+        Maximum number of paths remembered per drive.  The least recently
+        used path is evicted when the bound is exceeded.
+    """
+
+    def __init__(self, max_entries_per_drive: int = 10_000) -> None:
+        if max_entries_per_drive < 1:
+            msg = "max_entries_per_drive must be at least 1"
+            raise ValueError(msg)
+        self._max_entries = max_entries_per_drive
+        self._drives: dict[str, OrderedDict[str, str]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(paths) for paths in self._drives.values())
+
+    def get(self, drive_id: str, path: str) -> str | None:
+        """Return the item ID last seen at *path*, or ``None``."""
+        paths = self._drives.get(drive_id)
+        if paths is None:
+            return None
+        key = _normalize_path(path)
+        item_id = paths.get(key)
+        if item_id is not None:
+            paths.move_to_end(key)
+        return item_id
+
+    def put(self, drive_id: str, path: str, item_id: str) -> None:
+        """Record that *path* currently resolves to *item_id*."""
+        paths = self._drives.setdefault(drive_id, OrderedDict())
+        key = _normalize_path(path)
+        paths[key] = item_id
+        paths.move_to_end(key)
+        while len(paths) > self._max_entries:
+            paths.popitem(last=False)
+
+    def discard(self, drive_id: str, path: str) -> None:
+        """Forget *path* and everything indexed beneath it."""
+        paths = self._drives.get(drive_id)
+        if not paths:
+            return
+        key = _normalize_path(path)
+        prefix = f"{key}/"
+        for stale in [p for p in paths if p == key or p.startswith(prefix)]:
+            del paths[stale]
+
+    def discard_id(self, drive_id: str, item_id: str) -> None:
+        """Forget every path that resolves to *item_id*, and their descendants."""
+        paths = self._drives.get(drive_id)
+        if not paths:
+            return
+        for path in [p for p, i in paths.items() if i == item_id]:
+            self.discard(drive_id, path)
@@ -0,0 +1,220 @@
+"""Content-addressed on-disk cache of downloaded files.
+
+``DownloadCache`` keeps a copy of every file downloaded through a
+``OneDriveClient`` under a key derived from the item's SHA-1 (or, failing
+that, its drive, ID and ``cTag``) and size.  A later download of unchanged
+content is served from the cache by reflink, hardlink or local copy instead
+of going over the network.  Total size is capped by evicting the least
+recently used files.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+if TYPE_CHECKING:
+    from src.onedrive import DriveItemInfo
+
+logger = logging.getLogger(__name__)
+
+# ioctl request that clones a file's extents (Btrfs, XFS, ...) on Linux.
+_FICLONE = 0x40049409
+
+
+def _clone(source: Path, target: Path, *, allow_hardlink: bool) -> None:
+    """Create *target* as a reflink, else a hardlink, else a copy of *source*."""
+    if fcntl is not None:
+        try:
+            with source.open("rb") as src, target.open("xb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            target.unlink(missing_ok=True)
+        else:
+            return
+    if allow_hardlink:
+        try:
+            os.link(source, target)
+        except OSError:
+            pass
+        else:
+            return
+    shutil.copyfile(source, target)
+
+
+class DownloadCache:
+    """Size-capped LRU cache of file contents in a local directory.
+
+    Entries are keyed by :meth:`key_for`.  Files enter the cache as
+    read-only reflinks or copies, never as links to the source.  With
+    *allow_hardlinks* a destination served from the cache may share the
+    cached file's inode, and is then read-only as well: replace it rather
+    than modifying it in place.  Recency is tracked in the cached files'
+    access times, so using an entry never changes the modification time
+    of destinations linked to it.  The cache is meant to be used by one
+    process at a time; :meth:`fetch` and :meth:`store` may be called from
+    several threads.
+
+    Parameters
+    ----------
+    directory:
+        Where cached files are kept.  Existing entries are picked up, so
+        the cache survives restarts.
+    max_bytes:
+        Upper bound on the total size of cached files.
+    allow_hardlinks:
+        Whether to fall back to hardlinks when the filesystem cannot
+        reflink.  When False the fallback is a full local copy.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = 10 * 1024**3,
+        *,
+        allow_hardlinks: bool = True,
+    ) -> None:
+        if max_bytes < 1:
+            msg = "max_bytes must be at least 1"
+            raise ValueError(msg)
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._allow_hardlinks = allow_hardlinks
+        # Entry file name -> size, least recently used first.
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total = 0
+        existing = [
+            (entry.stat(), entry.name)
+            for entry in self._directory.iterdir()
+            if entry.is_file() and not entry.name.startswith(".")
+        ]
+        for stat, name in sorted(existing, key=lambda pair: pair[0].st_atime):
+            self._entries[name] = stat.st_size
+            self._total += stat.st_size
+        self.hits = 0
+        self.misses = 0
+        # fetch() and store() run in worker threads; this guards the entries.
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the cached files."""
+        return self._total
+
+    @staticmethod
+    def key_for(drive_id: str, info: DriveItemInfo) -> str | None:
+        """Return the cache key for an item's content, or ``None`` if it has none.
+
+        SHA-1 plus size identifies content across items and drives.  Items
+        without a SHA-1 fall back to their drive, ID and ``cTag``, which
+        changes whenever the content does.  quickXorHash is deliberately
+        not used: it is an XOR checksum, and distinct contents that
+        collide are easy to produce.
+        """
+        if info.size is None:
+            return None
+        if info.sha1_hash:
+            return f"sha1:{info.sha1_hash.lower()}:{info.size}"
+        if info.c_tag:
+            return f"ctag:{drive_id}:{info.id}:{info.c_tag}:{info.size}"
+        return None
+
+    def _path(self, name: str) -> Path:
+        return self._directory / name
+
+    @staticmethod
+    def _name(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def fetch(self, key: str, destination: Path) -> bool:
+        """Place the cached content for *key* at *destination*; False on a miss."""
+        name = self._name(key)
+        with self._lock:
+            if name not in self._entries:
+                self.misses += 1
+                return False
+        cached = self._path(name)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=destination.parent, prefix=f".{destination.name}.", suffix=".part"
+        )
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        tmp_path.unlink()
+        try:
+            _clone(cached, tmp_path, allow_hardlink=self._allow_hardlinks)
+            tmp_path.replace(destination)
+        except FileNotFoundError:
+            # Removed behind our back (or just evicted); report a miss.
+            with self._lock:
+                self._total -= self._entries.pop(name, 0)
+                self.misses += 1
+            return False
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        with self._lock:
+            if name in self._entries:
+                self._entries.move_to_end(name)
+            self.hits += 1
+        # Only the access time: a hardlinked destination shares this inode.
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(cached, (time.time(), cached.stat().st_mtime))
+        return True
+
+    def store(self, key: str, source: Path) -> None:
+        """Add the file at *source* under *key*, evicting old entries if needed."""
+        name = self._name(key)
+        size = source.stat().st_size
+        with self._lock:
+            if name in self._entries or size > self._max_bytes:
+                return
+        # Unique per thread, as the same content may be stored concurrently.
+        tmp_path = self._directory / f".{name}.{threading.get_ident()}.part"
+        tmp_path.unlink(missing_ok=True)
+        try:
+            _clone(source, tmp_path, allow_hardlink=False)
+            tmp_path.chmod(0o444)
+            tmp_path.replace(self._path(name))
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        with self._lock:
+            if name not in self._entries:
+                self._entries[name] = size
+                self._total += size
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._total > self._max_bytes and self._entries:
+            name, size = self._entries.popitem(last=False)
+            self._path(name).unlink(missing_ok=True)
+            self._total -= size
+            logger.debug("Evicted %s (%d bytes) from download cache", name, size)
+
+    def clear(self) -> None:
+        """Delete every cached file."""
+        with self._lock:
+            for name in self._entries:
+                self._path(name).unlink(missing_ok=True)
+            self._entries.clear()
+            self._total = 0
@@ -0,0 +1,426 @@
+"""Persistent on-disk index of drive contents.
+
+``DriveIndex`` stores ``DriveItemInfo`` fields (including ETags, cTags and
+content hashes), parent IDs and drive-relative paths in a SQLite database
+(WAL mode), so an inventory built by a full walk survives process restarts
+and can be kept current from delta changes.
+Lookups by ID, path, parent, name prefix and modification time are all
+served from indexes without touching Graph.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from src.delta import ChangeType
+from src.onedrive import DriveItemInfo
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Iterable
+    from pathlib import Path
+
+    from src.delta import DeltaChange
+    from src.onedrive import OneDriveClient
+
+logger = logging.getLogger(__name__)
+
+# Rows written per transaction while loading walks and delta changes.
+_WRITE_BATCH = 1000
+
+_COLUMNS = (
+    "item_id, name, size, mime_type, is_folder, created_at, modified_at,"
+    " web_url, parent_id, path, e_tag, c_tag, quick_xor_hash, sha1_hash"
+)
+
+# Columns added after the first release, with their types; databases created
+# before them are migrated in place by ``DriveIndex.__init__``.
+_ADDED_COLUMNS = (
+    ("e_tag", "TEXT"),
+    ("c_tag", "TEXT"),
+    ("quick_xor_hash", "TEXT"),
+    ("sha1_hash", "TEXT"),
+)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS items ("
+    " drive_id TEXT NOT NULL,"
+    " item_id TEXT NOT NULL,"
+    " name TEXT NOT NULL COLLATE NOCASE,"
+    " size INTEGER,"
+    " mime_type TEXT,"
+    " is_folder INTEGER NOT NULL,"
+    " created_at REAL,"
+    " modified_at REAL,"
+    " web_url TEXT,"
+    " parent_id TEXT,"
+    " path TEXT COLLATE NOCASE,"
+    " e_tag TEXT,"
+    " c_tag TEXT,"
+    " quick_xor_hash TEXT,"
+    " sha1_hash TEXT,"
+    " PRIMARY KEY (drive_id, item_id))",
+    "CREATE INDEX IF NOT EXISTS items_path ON items (drive_id, path)",
+    # Folder listings filter on the parent and sort by name, so both are
+    # keyed; indexes created by earlier versions on the parent alone are
+    # dropped, as the planner preferred items_name over them.
+    "DROP INDEX IF EXISTS items_parent",
+    "CREATE INDEX IF NOT EXISTS items_parent_name ON items (drive_id, parent_id, name)",
+    "CREATE INDEX IF NOT EXISTS items_name ON items (drive_id, name)",
+    "CREATE INDEX IF NOT EXISTS items_modified ON items (drive_id, modified_at)",
+)
+
+
+def _clean_path(path: str) -> str:
+    """Drive-relative path without leading, trailing or doubled slashes."""
+    return "/".join(part for part in path.split("/") if part)
+
+
+def _join_path(parent: str, name: str) -> str:
+    return f"{parent}/{name}" if parent else name
+
+
+def _escape_like(value: str) -> str:
+    """Escape ``LIKE`` wildcards so *value* matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _to_timestamp(value: datetime | None) -> float | None:
+    return value.timestamp() if value is not None else None
+
+
+def _from_timestamp(value: float | None) -> datetime | None:
+    return datetime.fromtimestamp(value, UTC) if value is not None else None
+
+
+def _row_to_info(row: tuple) -> DriveItemInfo:
+    (
+        item_id,
+        name,
+        size,
+        mime_type,
+        is_folder,
+        created,
+        modified,
+        web_url,
+        parent,
+        _path,
+        e_tag,
+        c_tag,
+        quick_xor_hash,
+        sha1_hash,
+    ) = row
+    return DriveItemInfo(
+        id=item_id,
+        name=name,
+        size=size,
+        mime_type=mime_type,
+        is_folder=bool(is_folder),
+        created_at=_from_timestamp(created),
+        modified_at=_from_timestamp(modified),
+        web_url=web_url,
+        parent_id=parent,
+        e_tag=e_tag,
+        c_tag=c_tag,
+        quick_xor_hash=quick_xor_hash,
+        sha1_hash=sha1_hash,
+    )
+
+
+class DriveIndex:
+    """SQLite-backed inventory of drive items keyed by drive and item ID.
+
+    Paths are relative to the drive root, use ``/`` as the separator and
+    are matched case-insensitively, as OneDrive does.  The drive root itself
+    is stored with the empty path.  Pre-authenticated download URLs expire
+    and are never stored.
+
+    Fill the index with :meth:`build` (a full walk) and keep it current with
+    :meth:`apply_changes` fed from :meth:`src.delta.DeltaSync.changes`.
+
+    Parameters
+    ----------
+    path:
+        Database file path, or ``":memory:"``.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._migrate()
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def _migrate(self) -> None:
+        """Add columns missing from an ``items`` table made by an older version."""
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(items)")}
+        if not existing:
+            return  # Fresh database; the schema creates every column.
+        for name, kind in _ADDED_COLUMNS:
+            if name not in existing:
+                self._conn.execute(f"ALTER TABLE items ADD COLUMN {name} {kind}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def count(self, drive_id: str) -> int:
+        """Return the number of items indexed for *drive_id*."""
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM items WHERE drive_id = ?", (drive_id,)
+        ).fetchone()[0]
+
+    def _select(self, where: str, params: tuple) -> list[DriveItemInfo]:
+        rows = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM items WHERE drive_id = ? AND {where}",  # noqa: S608
+            params,
+        )
+        return [_row_to_info(row) for row in rows]
+
+    def get(self, drive_id: str, item_id: str) -> DriveItemInfo | None:
+        """Return the indexed item with *item_id*, or ``None``."""
+        items = self._select("item_id = ?", (drive_id, item_id))
+        return items[0] if items else None
+
+    def get_by_path(self, drive_id: str, path: str) -> DriveItemInfo | None:
+        """Return the indexed item at *path* (``""`` is the root), or ``None``."""
+        items = self._select("path = ?", (drive_id, _clean_path(path)))
+        return items[0] if items else None
+
+    def path_of(self, drive_id: str, item_id: str) -> str | None:
+        """Return the indexed path of *item_id*, or ``None`` if it is unknown."""
+        row = self._conn.execute(
+            "SELECT path FROM items WHERE drive_id = ? AND item_id = ?",
+            (drive_id, item_id),
+        ).fetchone()
+        return row[0] if row else None
+
+    def children(self, drive_id: str, folder_id: str) -> list[DriveItemInfo]:
+        """Return the indexed children of the folder with *folder_id*."""
+        return self._select("parent_id = ? ORDER BY name", (drive_id, folder_id))
+
+    def children_by_path(self, drive_id: str, path: str) -> list[DriveItemInfo]:
+        """Return the indexed children of the folder at *path*.
+
+        Raises
+        ------
+        FileNotFoundError
+            If no folder is indexed at *path*.
+        """
+        folder = self.get_by_path(drive_id, path)
+        if folder is None or not folder.is_folder:
+            msg = f"Folder not indexed at path: {path}"
+            raise FileNotFoundError(msg)
+        return self.children(drive_id, folder.id)
+
+    def find_by_name_prefix(
+        self, drive_id: str, prefix: str, *, limit: int = 1000
+    ) -> list[DriveItemInfo]:
+        """Return up to *limit* items whose name starts with *prefix* (any case)."""
+        return self._select(
+            "name LIKE ? ESCAPE '\\' ORDER BY name LIMIT ?",
+            (drive_id, f"{_escape_like(prefix)}%", limit),
+        )
+
+    def modified_between(
+        self,
+        drive_id: str,
+        since: datetime,
+        until: datetime | None = None,
+    ) -> list[DriveItemInfo]:
+        """Return items last modified at or after *since* (and before *until*)."""
+        if until is None:
+            return self._select(
+                "modified_at >= ? ORDER BY modified_at",
+                (drive_id, since.timestamp()),
+            )
+        return self._select(
+            "modified_at >= ? AND modified_at < ? ORDER BY modified_at",
+            (drive_id, since.timestamp(), until.timestamp()),
+        )
+
+    def _upsert_rows(
+        self, drive_id: str, entries: Iterable[tuple[str | None, DriveItemInfo]]
+    ) -> None:
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO items (drive_id, {_COLUMNS})"  # noqa: S608
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    drive_id,
+                    info.id,
+                    info.name,
+                    info.size,
+                    info.mime_type,
+                    info.is_folder,
+                    _to_timestamp(info.created_at),
+                    _to_timestamp(info.modified_at),
+                    info.web_url,
+                    info.parent_id,
+                    path,
+                    info.e_tag,
+                    info.c_tag,
+                    info.quick_xor_hash,
+                    info.sha1_hash,
+                )
+                for path, info in entries
+            ],
+        )
+
+    def put(self, drive_id: str, info: DriveItemInfo, path: str | None) -> None:
+        """Store or replace one item, with its path if known."""
+        with self._conn:
+            self._upsert_rows(
+                drive_id, [(None if path is None else _clean_path(path), info)]
+            )
+
+    async def load_walk(
+        self,
+        drive_id: str,
+        entries: AsyncIterable[tuple[str, DriveItemInfo]],
+        *,
+        base_path: str = "",
+    ) -> int:
+        """Store the ``(path, item)`` pairs produced by :meth:`OneDriveClient.walk`.
+
+        Parameters
+        ----------
+        drive_id:
+            The drive (document library) identifier.
+        entries:
+            The walk to consume.
+        base_path:
+            Drive-relative path of the folder the walk started from.
+
+        Returns
+        -------
+        int
+            The number of items stored.
+        """
+        base_path = _clean_path(base_path)
+        batch: list[tuple[str | None, DriveItemInfo]] = []
+        count = 0
+        async for path, info in entries:
+            batch.append((_join_path(base_path, path), info))
+            if len(batch) >= _WRITE_BATCH:
+                with self._conn:
+                    self._upsert_rows(drive_id, batch)
+                count += len(batch)
+                batch.clear()
+        with self._conn:
+            self._upsert_rows(drive_id, batch)
+        return count + len(batch)
+
+    async def build(
+        self,
+        client: OneDriveClient,
+        drive_id: str,
+        folder_id: str = "root",
+        *,
+        path: str = "",
+        max_concurrency: int = 8,
+    ) -> int:
+        """Replace the index of a folder tree with a fresh concurrent walk.
+
+        Parameters
+        ----------
+        client:
+            The ``OneDriveClient`` used to walk the drive.
+        drive_id:
+            The drive (document library) identifier.
+        folder_id:
+            The item ID of the folder to index.  Use ``"root"`` for the
+            whole drive.
+        path:
+            Drive-relative path of *folder_id*.
+        max_concurrency:
+            Maximum number of folders being listed at once.
+
+        Returns
+        -------
+        int
+            The number of items stored, including the folder itself.
+        """
+        path = _clean_path(path)
+        folder = await client.get_item(drive_id, folder_id)
+        with self._conn:
+            self._delete_subtree(drive_id, folder.id, path)
+            self._upsert_rows(drive_id, [(path, folder)])
+        count = await self.load_walk(
+            drive_id,
+            client.walk(drive_id, folder.id, max_concurrency=max_concurrency),
+            base_path=path,
+        )
+        logger.info("Indexed %d items of drive %s under /%s", count, drive_id, path)
+        return count + 1
+
+    def _delete_subtree(self, drive_id: str, item_id: str, path: str | None) -> None:
+        self._conn.execute(
+            "DELETE FROM items WHERE drive_id = ? AND item_id = ?", (drive_id, item_id)
+        )
+        if path is None:
+            return
+        if not path:
+            self._conn.execute("DELETE FROM items WHERE drive_id = ?", (drive_id,))
+            return
+        self._conn.execute(
+            "DELETE FROM items WHERE drive_id = ? AND path LIKE ? ESCAPE '\\'",
+            (drive_id, f"{_escape_like(path)}/%"),
+        )
+
+    def _move_subtree(self, drive_id: str, old_path: str, new_path: str) -> None:
+        self._conn.execute(
+            "UPDATE items SET path = ? || substr(path, ?)"
+            " WHERE drive_id = ? AND path LIKE ? ESCAPE '\\'",
+            (new_path, len(old_path) + 1, drive_id, f"{_escape_like(old_path)}/%"),
+        )
+
+    def _apply_change(self, drive_id: str, change: DeltaChange) -> None:
+        info = change.item
+        old_path = self.path_of(drive_id, info.id)
+        if change.change_type is ChangeType.DELETED:
+            self._delete_subtree(drive_id, info.id, old_path)
+            return
+        if info.parent_id is None:
+            path: str | None = ""  # Only the drive root has no parent.
+        else:
+            parent_path = self.path_of(drive_id, info.parent_id)
+            path = None if parent_path is None else _join_path(parent_path, info.name)
+        if info.is_folder and old_path and path is not None and path != old_path:
+            self._move_subtree(drive_id, old_path, path)
+        self._upsert_rows(drive_id, [(path, info)])
+
+    async def apply_changes(
+        self, drive_id: str, changes: AsyncIterable[DeltaChange]
+    ) -> int:
+        """Apply delta changes, e.g. from :meth:`src.delta.DeltaSync.changes`.
+
+        Paths are derived from the indexed parent, and renamed or moved
+        folders carry their descendants' paths along.  Items whose parent
+        is not indexed are stored without a path.
+
+        Returns
+        -------
+        int
+            The number of changes applied.
+        """
+        batch: list[DeltaChange] = []
+        count = 0
+        async for change in changes:
+            batch.append(change)
+            if len(batch) >= _WRITE_BATCH:
+                self._apply_batch(drive_id, batch)
+                count += len(batch)
+                batch.clear()
+        self._apply_batch(drive_id, batch)
+        return count + len(batch)
+
+    def _apply_batch(self, drive_id: str, changes: list[DeltaChange]) -> None:
+        with self._conn:
+            for change in changes:
+                self._apply_change(drive_id, change)
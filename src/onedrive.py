@@ -6,25 +6,84 @@ in OneDrive / SharePoint document libraries via the Microsoft Graph SDK.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import fnmatch
+import hashlib
+import io
+import json
 import logging
+import os
+import shutil
+import tempfile
+import time
+from collections import defaultdict
 from dataclasses import dataclass
-from functools import lru_cache
+from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
+from urllib.parse import quote
 
+import httpx
 from azure.identity.aio import DefaultAzureCredential
+from kiota_abstractions.api_error import APIError
+from kiota_abstractions.base_request_configuration import RequestConfiguration
+from kiota_abstractions.method import Method
+from kiota_abstractions.request_information import RequestInformation
+from kiota_authentication_azure.azure_identity_authentication_provider import (
+    AzureIdentityAuthenticationProvider,
+)
+from kiota_http.middleware.options import RetryHandlerOption
 from msgraph import GraphServiceClient
+from msgraph.generated.drives.item.items.item.children.children_request_builder import (
+    ChildrenRequestBuilder,
+)
+from msgraph.generated.drives.item.items.item.create_upload_session.create_upload_session_post_request_body import (
+    CreateUploadSessionPostRequestBody,
+)
+from msgraph.generated.drives.item.items.item.delta.delta_request_builder import (
+    DeltaRequestBuilder,
+)
+from msgraph.generated.drives.item.items.item.drive_item_item_request_builder import (
+    DriveItemItemRequestBuilder,
+)
 from msgraph.generated.models.drive_item import DriveItem
+from msgraph.generated.models.drive_item_uploadable_properties import (
+    DriveItemUploadableProperties,
+)
 from msgraph.generated.models.folder import Folder
+from msgraph.generated.models.o_data_errors.o_data_error import ODataError
+from msgraph.graph_request_adapter import GraphRequestAdapter
+from msgraph.graph_request_adapter import options as _GRAPH_ADAPTER_OPTIONS
+from msgraph_core import GraphClientFactory
+
+from src.cache import MetadataCache, PathIndex
+from src.download_cache import DownloadCache
+from src.hashing import QuickXorHash, hash_bytes, hash_file, hash_stream
+from src.throttle import (
+    TENANT_BUCKET,
+    AdaptiveLimiter,
+    RequestScheduler,
+    retry_after,
+    throttle_delay,
+)
 
 
 if TYPE_CHECKING:
-    from datetime import datetime
+    from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+    from typing import BinaryIO
 
+T = TypeVar("T")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class DriveItemInfo:
-    """Represents metadata about a file or folder in OneDrive."""
+    """Represents metadata about a file or folder in OneDrive.
+
+    Slotted, so instances carry no per-instance ``__dict__``.  For very large
+    inventories store items in a :class:`src.table.DriveItemTable` instead.
+    """
 
     id: str
     name: str
@@ -35,6 +94,11 @@ class DriveItemInfo:
     modified_at: datetime | None = None
     web_url: str | None = None
     download_url: str | None = None
+    parent_id: str | None = None
+    e_tag: str | None = None
+    c_tag: str | None = None
+    quick_xor_hash: str | None = None
+    sha1_hash: str | None = None
 
     @property
     def is_file(self) -> bool:
@@ -52,6 +116,15 @@ class FolderInfo:
     web_url: str | None = None
 
 
+@dataclass(frozen=True)
+class DeltaPage:
+    """One page of results from the drive delta API."""
+
+    items: list[DriveItemInfo]
+    deleted_ids: frozenset[str]
+    delta_link: str | None = None
+
+
 @dataclass(frozen=True)
 class SiteInfo:
     """Represents metadata about a SharePoint site."""
@@ -62,6 +135,27 @@ class SiteInfo:
     web_url: str | None = None
 
 
+@dataclass(frozen=True)
+class TreeTransferReport:
+    """Summary of a whole-tree transfer such as :meth:`OneDriveClient.upload_tree`."""
+
+    files_transferred: int
+    bytes_transferred: int
+    files_skipped: int
+    folders_created: int
+    failures: dict[str, Exception]
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        """Return True if every file (and folder) was transferred or skipped."""
+        return not self.failures
+
+
+class DownloadVerificationError(RuntimeError):
+    """Downloaded bytes do not match the hash Graph reports for the file."""
+
+
 if TYPE_CHECKING:
     from azure.core.credentials import TokenCredential
     from azure.core.credentials_async import AsyncTokenCredential
@@ -70,9 +164,98 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_SCOPES: list[str] = ["https://graph.microsoft.com/.default"]
 
+# ``$select`` projection covering every field ``DriveItemInfo`` reads.  Pass
+# ``select=None`` to a method to fetch full ``driveItem`` payloads instead.
+DEFAULT_SELECT: tuple[str, ...] = (
+    "id",
+    "name",
+    "size",
+    "file",
+    "folder",
+    "createdDateTime",
+    "lastModifiedDateTime",
+    "webUrl",
+    "parentReference",
+    "eTag",
+    "cTag",
+    "@microsoft.graph.downloadUrl",
+)
+
+# Downloads are streamed to disk in chunks of this size.
+_DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Parallel downloads fetch byte ranges of this size.
+_DOWNLOAD_RANGE_SIZE = 16 * 1024 * 1024
+_DOWNLOAD_MAX_RETRIES = 5
+_DOWNLOAD_VERIFY_RETRIES = 1
+
+# Pre-authenticated transfer URLs can be slow to produce the next chunk of a
+# very large file, so allow generous read timeouts.
+_TRANSFER_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Upload-session fragments must be a multiple of 320 KiB and at most 60 MiB.
+_UPLOAD_FRAGMENT_UNIT = 320 * 1024
+_UPLOAD_MAX_FRAGMENT = 192 * _UPLOAD_FRAGMENT_UNIT
+_UPLOAD_CHUNK_SIZE = 32 * _UPLOAD_FRAGMENT_UNIT  # 10 MiB
+_UPLOAD_MAX_RETRIES = 5
+
+_HTTP_NOT_MODIFIED = 304
+_HTTP_NOT_FOUND = 404
+_HTTP_CONFLICT = 409
+_HTTP_THROTTLED = (429, 503)
+_HTTP_RETRYABLE = (429, 500, 502, 503, 504)
+_HTTP_EXPIRED_URL = (401, 403)
+
+# Graph accepts at most 20 sub-requests per JSON $batch request.
+_BATCH_MAX_REQUESTS = 20
+_BATCH_CONCURRENCY = 4
+_BATCH_MAX_RETRIES = 5
+# Status recorded for sub-requests missing from the $batch reply, or whose
+# whole $batch request failed (the body then holds the exception).
+_BATCH_NO_RESPONSE = 0
+
+# Tree walks buffer at most this many discovered items ahead of the consumer.
+_WALK_BUFFER = 1000
+_WALK_CONCURRENCY = 8
+
+# Tree uploads send files up to this size with a single PUT and larger ones
+# through upload sessions, as Graph recommends above 4 MB.
+_SIMPLE_UPLOAD_MAX = 4 * 1024 * 1024
+_TREE_CONCURRENCY = 8
+
+# Local and remote modification times within this many seconds count as
+# equal; FAT-family filesystems store times at two-second resolution.
+_MTIME_TOLERANCE = 2.0
+
+
+def _graph_client(
+    credential: TokenCredential | AsyncTokenCredential,
+    scopes: list[str],
+    *,
+    sdk_retries: bool,
+) -> GraphServiceClient:
+    """Build a ``GraphServiceClient``, optionally without SDK-level retries.
+
+    Without *sdk_retries* the default middleware pipeline is kept but its
+    ``RetryHandler`` never retries, so throttling responses surface to the
+    caller as ``APIError``.
+    """
+    if sdk_retries:
+        return GraphServiceClient(credentials=credential, scopes=scopes)
+    options = {
+        **_GRAPH_ADAPTER_OPTIONS,
+        RetryHandlerOption.get_key(): RetryHandlerOption(max_retries=0),
+    }
+    adapter = GraphRequestAdapter(
+        AzureIdentityAuthenticationProvider(credential, scopes=scopes),
+        client=GraphClientFactory.create_with_default_middleware(options=options),
+    )
+    return GraphServiceClient(request_adapter=adapter)
+
 
 def _to_drive_item_info(item: DriveItem) -> DriveItemInfo:
     """Convert a Graph SDK ``DriveItem`` to our ``DriveItemInfo`` model."""
+    hashes = item.file.hashes if item.file else None
     return DriveItemInfo(
         id=item.id or "",
         name=item.name or "",
@@ -83,9 +266,225 @@ def _to_drive_item_info(item: DriveItem) -> DriveItemInfo:
         modified_at=item.last_modified_date_time,
         web_url=item.web_url,
         download_url=item.additional_data.get("@microsoft.graph.downloadUrl"),
+        parent_id=item.parent_reference.id if item.parent_reference else None,
+        e_tag=item.e_tag,
+        c_tag=item.c_tag,
+        quick_xor_hash=hashes.quick_xor_hash if hashes else None,
+        sha1_hash=hashes.sha1_hash if hashes else None,
+    )
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """Parse an ISO 8601 timestamp as returned in Graph JSON payloads."""
+    return datetime.fromisoformat(value) if value else None
+
+
+def _dict_to_drive_item_info(data: dict) -> DriveItemInfo:
+    """Convert a raw Graph ``driveItem`` JSON object to ``DriveItemInfo``."""
+    file_facet = data.get("file")
+    hashes = file_facet.get("hashes") if file_facet else None
+    parent = data.get("parentReference")
+    return DriveItemInfo(
+        id=data.get("id") or "",
+        name=data.get("name") or "",
+        size=data.get("size"),
+        mime_type=file_facet.get("mimeType") if file_facet else None,
+        is_folder="folder" in data,
+        created_at=_parse_datetime(data.get("createdDateTime")),
+        modified_at=_parse_datetime(data.get("lastModifiedDateTime")),
+        web_url=data.get("webUrl"),
+        download_url=data.get("@microsoft.graph.downloadUrl"),
+        parent_id=parent.get("id") if parent else None,
+        e_tag=data.get("eTag"),
+        c_tag=data.get("cTag"),
+        quick_xor_hash=hashes.get("quickXorHash") if hashes else None,
+        sha1_hash=hashes.get("sha1Hash") if hashes else None,
+    )
+
+
+def _is_not_found(exc: BaseException) -> bool:
+    """Return True if *exc* is a Graph error response with status 404."""
+    return isinstance(exc, APIError) and exc.response_status_code == _HTTP_NOT_FOUND
+
+
+def _batch_failed(status: int) -> bool:
+    """Return True if a ``$batch`` sub-request failed or got no response."""
+    return status >= 400 or status == _BATCH_NO_RESPONSE
+
+
+def _batch_error(status: int, body: Any, subject: str) -> Exception:
+    """Build the exception reported for a failed ``$batch`` sub-request."""
+    if status == _BATCH_NO_RESPONSE:
+        if isinstance(body, Exception):
+            error = RuntimeError(f"$batch request for {subject} failed: {body}")
+            error.__cause__ = body
+            return error
+        return RuntimeError(f"No response for {subject} in the $batch reply")
+    message = ""
+    if isinstance(body, dict):
+        message = body.get("error", {}).get("message", "")
+    if status == _HTTP_NOT_FOUND:
+        return FileNotFoundError(f"Item not found: {subject}")
+    return RuntimeError(f"Request for {subject} failed with status {status}: {message}")
+
+
+def _item_url(drive_id: str, item_id: str) -> str:
+    """Relative Graph URL of a drive item, as used inside ``$batch`` requests."""
+    return f"/drives/{quote(drive_id, safe='!')}/items/{quote(item_id, safe='!:/')}"
+
+
+def _select_list(select: Sequence[str] | None) -> list[str] | None:
+    """Convert a ``select`` argument to the SDK's ``$select`` query value."""
+    return list(select) if select is not None else None
+
+
+def _is_complete(select: Sequence[str] | None) -> bool:
+    """Return True if a ``$select`` projection fills every ``DriveItemInfo`` field.
+
+    Only such results are cached, so a cached entry can serve any caller
+    regardless of the projection it asked for.
+    """
+    return select is None or set(DEFAULT_SELECT) <= set(select)
+
+
+def _select_key(select: Sequence[str] | None) -> tuple[str, ...] | None:
+    """Hashable form of a ``select`` argument, for request coalescing keys."""
+    return tuple(select) if select is not None else None
+
+
+def _item_request_config(
+    *,
+    select: Sequence[str] | None = None,
+    expand: list[str] | None = None,
+) -> RequestConfiguration:
+    """Build a request configuration for ``GET`` on a single drive item."""
+    return RequestConfiguration(
+        query_parameters=DriveItemItemRequestBuilder.DriveItemItemRequestBuilderGetQueryParameters(
+            select=_select_list(select),
+            expand=expand,
+        ),
+    )
+
+
+def _raw_get_request(url: str) -> RequestInformation:
+    """Build a ``GET`` for an absolute Graph URL such as an ``@odata.nextLink``."""
+    request_info = RequestInformation(Method.GET)
+    request_info.url = url
+    request_info.headers.try_add("Accept", "application/json")
+    return request_info
+
+
+def _hash_from(
+    stream: BinaryIO, start: int, *, with_sha1: bool
+) -> tuple[str, str | None]:
+    """Hash *stream* from *start* to the end, leaving it positioned at *start*."""
+    stream.seek(start)
+    try:
+        return hash_stream(stream, with_sha1=with_sha1)
+    finally:
+        stream.seek(start)
+
+
+def _combined_quick_xor(parts: dict[int, QuickXorHash]) -> str:
+    """Base64 quickXorHash of content hashed piecewise with ``update_at``."""
+    total = QuickXorHash()
+    for part in parts.values():
+        total.merge(part)
+    return total.b64digest()
+
+
+def _transfer_retry_delay(
+    exc: httpx.HTTPStatusError, attempt: int, *, max_backoff: float
+) -> float | None:
+    """Seconds to wait before retry *attempt* of a transfer that raised *exc*.
+
+    Returns ``None`` for statuses that are not worth retrying.  Throttling
+    responses honour ``Retry-After``; other server errors back off
+    exponentially up to *max_backoff*.
+    """
+    if exc.response.status_code not in _HTTP_RETRYABLE:
+        return None
+    backoff = min(2**attempt, max_backoff)
+    delay = throttle_delay(exc, backoff)
+    return backoff if delay is None else delay
+
+
+def _join_path(parent: str, name: str) -> str:
+    return f"{parent}/{name}" if parent else name
+
+
+def _matches_any(path: str, patterns: Sequence[str]) -> bool:
+    """Return True if *path* or its last segment matches any glob in *patterns*."""
+    name = path.rpartition("/")[2]
+    return any(
+        fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(name, pattern)
+        for pattern in patterns
+    )
+
+
+def _scan_local_tree(
+    root: Path, include: Sequence[str] | None, exclude: Sequence[str]
+) -> tuple[list[str], list[tuple[str, int]]]:
+    """List the folders and ``(path, size)`` files under *root* to upload.
+
+    Paths are relative to *root* and use ``/``.  Excluded folders are not
+    descended into; *include*, when given, filters files only.
+    """
+    folders: list[str] = []
+    files: list[tuple[str, int]] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        parent = "" if current == root else current.relative_to(root).as_posix()
+        dirnames[:] = sorted(
+            name
+            for name in dirnames
+            if not _matches_any(_join_path(parent, name), exclude)
+        )
+        folders.extend(_join_path(parent, name) for name in dirnames)
+        for name in sorted(filenames):
+            path = _join_path(parent, name)
+            if _matches_any(path, exclude):
+                continue
+            if include is not None and not _matches_any(path, include):
+                continue
+            files.append((path, (current / name).stat().st_size))
+    return folders, files
+
+
+def _set_mtime(path: Path, mtime: float) -> None:
+    """Set *path*'s modification time, first unsharing it if it is hardlinked.
+
+    A file served from the download cache by hardlink shares its inode, and
+    so its timestamps, with the cache entry and every other such file.
+    """
+    if path.stat().st_nlink > 1:
+        private = path.with_name(f".{path.name}.unshared")
+        shutil.copyfile(path, private)
+        private.replace(path)
+    os.utime(path, (mtime, mtime))
+
+
+def _is_local_copy(path: Path, item: DriveItemInfo) -> bool:
+    """Return True if *path* has the size and modification time of *item*."""
+    if item.modified_at is None:
+        return False
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    return (
+        stat.st_size == (item.size or 0)
+        and abs(stat.st_mtime - item.modified_at.timestamp()) <= _MTIME_TOLERANCE
     )
 
 
+def _next_expected_offset(ranges: list[str] | None) -> int | None:
+    """Return the first missing byte offset from ``nextExpectedRanges``."""
+    if not ranges:
+        return None
+    return int(ranges[0].split("-", 1)[0])
+
+
 class OneDriveClient:
     """High-level client for OneDrive / SharePoint file operations.
 
@@ -101,6 +500,55 @@ class OneDriveClient:
         *credential* and *scopes* arguments are ignored.  This is useful for
         testing and for advanced scenarios where the caller wants full control
         over the HTTP pipeline.
+    http_client:
+        Optional ``httpx.AsyncClient`` used for transfers against
+        pre-authenticated URLs (such as ``@microsoft.graph.downloadUrl``).
+        When omitted a client is created on first use and closed by
+        :meth:`close`.
+    metadata_cache:
+        Optional ``MetadataCache`` consulted by :meth:`get_item`,
+        :meth:`list_items` and :meth:`get_folder_info`.  Only results
+        fetched with a ``select`` covering :data:`DEFAULT_SELECT` (or
+        ``None``) are cached, so narrow projections never reach other
+        callers.  Uploads, folder creation and deletes made through this
+        client invalidate the affected entries.
+    path_index:
+        Optional ``PathIndex`` of folder paths to item IDs, used by
+        :meth:`list_items_by_path` and :meth:`ensure_path` to skip
+        resolving paths they have already seen.
+    scheduler:
+        Optional ``RequestScheduler`` that every Graph request is routed
+        through.  It bounds concurrency per drive and, when Graph throttles
+        a request, pauses the whole drive (or tenant) for the
+        ``Retry-After`` duration before retrying.  Share one scheduler
+        between clients that hit the same tenant.
+
+        When a scheduler or *limiter* is given and the client is built from
+        *credential*, the SDK's own ``RetryHandler`` is told not to retry,
+        so every 429/503 reaches the scheduler (and limiter) instead of
+        being retried per request behind their back.  A caller-supplied
+        *graph_client* is used as is: disable its retries the same way
+        (``RetryHandlerOption(max_retries=0)``) for the same effect.
+    raw_json:
+        When True, listing and delta pages are decoded straight from JSON
+        into ``DriveItemInfo`` instead of through the SDK's Kiota models.
+        This is several times cheaper in CPU for large crawls (see
+        ``scripts/bench_listing_parse.py``).
+    limiter:
+        Optional ``AdaptiveLimiter`` that every Graph request acquires a
+        slot from.  Bulk operations (:meth:`walk` and the ``$batch``
+        helpers) then run at the concurrency the tenant sustains, up to
+        their own ``max_concurrency``.  Inside a scheduler, the limiter
+        sees each throttled attempt before the scheduler retries it.
+    download_cache:
+        Optional ``DownloadCache``.  Downloads of content it already holds
+        (same SHA-1 and size, or same item, ``cTag`` and size) are served
+        from local disk, and every completed download is added to it.
+
+    Identical concurrent reads (:meth:`get_item`, :meth:`list_items` and
+    :meth:`get_folder_info` with the same arguments) share a single
+    in-flight Graph request, and every caller receives its result or
+    exception.
     """
 
     def __init__(
@@ -109,28 +557,116 @@ class OneDriveClient:
         scopes: list[str] | None = None,
         *,
         graph_client: GraphServiceClient | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        metadata_cache: MetadataCache | None = None,
+        path_index: PathIndex | None = None,
+        scheduler: RequestScheduler | None = None,
+        raw_json: bool = False,
+        limiter: AdaptiveLimiter | None = None,
+        download_cache: DownloadCache | None = None,
     ) -> None:
         if graph_client is not None:
             self._client = graph_client
         elif credential is not None:
-            self._client = GraphServiceClient(
-                credentials=credential,
-                scopes=scopes or _DEFAULT_SCOPES,
+            self._client = _graph_client(
+                credential,
+                scopes or _DEFAULT_SCOPES,
+                sdk_retries=scheduler is None and limiter is None,
             )
         else:
             msg = "Either 'credential' or 'graph_client' must be provided."
             raise ValueError(msg)
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self._cache = metadata_cache
+        self._paths = path_index
+        # Folders resolved or created by ensure_path and upload_tree.
+        self._folder_paths = path_index if path_index is not None else PathIndex()
+        self._scheduler = scheduler
+        self._raw_json = raw_json
+        self._limiter = limiter
+        self._downloads = download_cache
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+
+    async def _call(self, bucket: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Run a Graph request, through the scheduler and limiter if configured."""
+        if self._limiter is not None:
+            call = partial(self._limiter.run, call)
+        if self._scheduler is None:
+            return await call()
+        return await self._scheduler.run(bucket, call)
+
+    async def _coalesce(
+        self, key: tuple[Any, ...], call: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run ``call()`` once for all concurrent callers that pass the same *key*.
+
+        The shared request runs in its own task, so one caller being
+        cancelled does not cancel it for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._finish_inflight, key))
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: tuple[Any, ...], task: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the outcome as retrieved even if every waiter was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def _transfer_client(self) -> httpx.AsyncClient:
+        """HTTP client for pre-authenticated transfer URLs (no Graph auth)."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=_TRANSFER_TIMEOUT,
+                follow_redirects=True,
+            )
+        return self._http_client
+
+    def _record_write(
+        self,
+        drive_id: str,
+        info: DriveItemInfo,
+        parent_folder_id: str | None = None,
+    ) -> DriveItemInfo:
+        """Invalidate cache entries made stale by a write that produced *info*."""
+        if self._cache is not None:
+            self._cache.invalidate_item(drive_id, info.id)
+            if parent_folder_id is not None:
+                self._cache.invalidate_children(drive_id, parent_folder_id)
+            if info.parent_id is not None:
+                self._cache.invalidate_children(drive_id, info.parent_id)
+            self._cache.put_item(drive_id, info)
+        return info
+
+    def _forget_paths(self, drive_id: str, item_id: str) -> None:
+        """Drop a deleted item, and everything beneath it, from the path indexes."""
+        if self._paths is not None:
+            self._paths.discard_id(drive_id, item_id)
+        if self._folder_paths is not self._paths:
+            self._folder_paths.discard_id(drive_id, item_id)
+
+    async def close(self) -> None:
+        """Close the transfer HTTP client if this instance created it."""
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     async def get_user_display_name(self) -> str:
         """Return the authenticated user's display name from Microsoft Graph."""
-        user = await self._client.me.get()
+        user = await self._call(TENANT_BUCKET, self._client.me.get)
         if user is None or user.display_name is None:
             return "User"
         return user.display_name
 
     async def get_my_drive_id(self) -> str:
         """Get the drive ID of the authenticated user's OneDrive."""
-        drive = await self._client.me.drive.get()
+        drive = await self._call(TENANT_BUCKET, self._client.me.drive.get)
         if drive is None or drive.id is None:
             msg = "Could not resolve the current user's OneDrive drive ID."
             raise FileNotFoundError(msg)
@@ -138,7 +674,7 @@ class OneDriveClient:
 
     async def list_followed_sites(self) -> list[SiteInfo]:
         """Return the SharePoint sites the current user is following."""
-        result = await self._client.me.followed_sites.get()
+        result = await self._call(TENANT_BUCKET, self._client.me.followed_sites.get)
         if result is None or result.value is None:
             return []
         return [
@@ -159,7 +695,9 @@ class OneDriveClient:
         site_id:
             The site identifier (e.g. ``"contoso.sharepoint.com,guid,guid"``).
         """
-        drive = await self._client.sites.by_site_id(site_id).drive.get()
+        drive = await self._call(
+            TENANT_BUCKET, self._client.sites.by_site_id(site_id).drive.get
+        )
         if drive is None or drive.id is None:
             msg = f"Default drive not found for site {site_id}"
             raise FileNotFoundError(msg)
@@ -175,37 +713,120 @@ class OneDriveClient:
         site_path:
             Server-relative path, e.g. ``"/sites/my-team"``
         """
-        site = await self._client.sites.by_site_id(f"{hostname}:{site_path}").get()
+        site = await self._call(
+            TENANT_BUCKET, self._client.sites.by_site_id(f"{hostname}:{site_path}").get
+        )
         if site is None:
             msg = f"Site not found: {hostname}:{site_path}"
             raise FileNotFoundError(msg)
 
-        drive = await self._client.sites.by_site_id(site.id or "").drive.get()
+        drive = await self._call(
+            TENANT_BUCKET, self._client.sites.by_site_id(site.id or "").drive.get
+        )
         if drive is None:
             msg = f"Default drive not found for site {hostname}:{site_path}"
             raise FileNotFoundError(msg)
         return drive.id or ""
 
+    async def iter_items(
+        self,
+        drive_id: str,
+        folder_id: str = "root",
+        *,
+        page_size: int | None = None,
+        select: Sequence[str] | None = DEFAULT_SELECT,
+    ) -> AsyncIterator[DriveItemInfo]:
+        """Iterate over the immediate children of a folder, page by page.
+
+        Follows ``@odata.nextLink`` until the listing is exhausted, yielding
+        each item as soon as its page arrives.  Only one page is held in
+        memory at a time.
+
+        Parameters
+        ----------
+        drive_id:
+            The drive (document library) identifier.
+        folder_id:
+            The item ID of the folder.  Use ``"root"`` for the drive root.
+        page_size:
+            Optional ``$top`` value controlling how many items Graph returns
+            per page.  Defaults to the server's page size.
+        select:
+            Fields to request via ``$select``.  Defaults to
+            :data:`DEFAULT_SELECT`; ``None`` fetches every field.
+        """
+        children = (
+            self._client.drives.by_drive_id(drive_id)
+            .items.by_drive_item_id(folder_id)
+            .children
+        )
+        config = RequestConfiguration(
+            query_parameters=ChildrenRequestBuilder.ChildrenRequestBuilderGetQueryParameters(
+                top=page_size,
+                select=_select_list(select),
+            ),
+        )
+        if self._raw_json:
+            pages = self._iter_raw_pages(
+                drive_id, children.to_get_request_information(config)
+            )
+            async for raw_page in pages:
+                for data in raw_page.get("value", []):
+                    yield _dict_to_drive_item_info(data)
+            return
+
+        page = await self._call(
+            drive_id, partial(children.get, request_configuration=config)
+        )
+        while page is not None:
+            for item in page.value or []:
+                yield _to_drive_item_info(item)
+            if not page.odata_next_link:
+                break
+            page = await self._call(
+                drive_id, children.with_url(page.odata_next_link).get
+            )
+
     async def list_items(
-        self, drive_id: str, folder_id: str = "root"
+        self,
+        drive_id: str,
+        folder_id: str = "root",
+        *,
+        select: Sequence[str] | None = DEFAULT_SELECT,
     ) -> list[DriveItemInfo]:
         """List immediate children of a folder in a drive.
 
+        All pages are fetched; use :meth:`iter_items` to stream large folders.
+
         Parameters
         ----------
         drive_id:
             The drive (document library) identifier.
         folder_id:
             The item ID of the folder.  Use ``"root"`` for the drive root.
+        select:
+            Fields to request via ``$select``.  Defaults to
+            :data:`DEFAULT_SELECT`; ``None`` fetches every field.
         """
-        result = await (
-            self._client.drives.by_drive_id(drive_id)
-            .items.by_drive_item_id(folder_id)
-            .children.get()
+        if self._cache is not None:
+            cached = self._cache.get_children(drive_id, folder_id)
+            if cached is not None:
+                return cached
+        items = await self._coalesce(
+            ("children", drive_id, folder_id, _select_key(select)),
+            partial(self._fetch_children, drive_id, folder_id, select),
         )
-        if result is None or result.value is None:
-            return []
-        return [_to_drive_item_info(item) for item in result.value]
+        return list(items)
+
+    async def _fetch_children(
+        self, drive_id: str, folder_id: str, select: Sequence[str] | None
+    ) -> list[DriveItemInfo]:
+        items = [
+            item async for item in self.iter_items(drive_id, folder_id, select=select)
+        ]
+        if self._cache is not None and _is_complete(select):
+            self._cache.put_children(drive_id, folder_id, items)
+        return items
 
     async def list_items_by_path(self, drive_id: str, path: str) -> list[DriveItemInfo]:
         """List children of a folder identified by its path relative to the drive root.
@@ -217,18 +838,56 @@ class OneDriveClient:
         path:
             Path relative to the drive root, e.g. ``"Documents/Reports"``.
         """
-        # Resolve the folder first, then list children.
-        folder_item = await (
-            self._client.drives.by_drive_id(drive_id)
-            .items.by_drive_item_id(f"root:/{path}:")
-            .get()
+        if self._paths is not None:
+            folder_id = self._paths.get(drive_id, path)
+            if folder_id is not None:
+                try:
+                    children = await self.list_items(drive_id, folder_id)
+                except APIError as exc:
+                    if not _is_not_found(exc):
+                        raise
+                    # The cached ID is gone (moved or deleted); resolve afresh.
+                    self._paths.discard(drive_id, path)
+                else:
+                    self._index_children(drive_id, path, children)
+                    return children
+
+        # Resolve the folder first (only its ID is needed), then list children.
+        folder_item = await self._call(
+            drive_id,
+            partial(
+                self._client.drives.by_drive_id(drive_id)
+                .items.by_drive_item_id(f"root:/{path}:")
+                .get,
+                request_configuration=_item_request_config(select=["id"]),
+            ),
         )
         if folder_item is None:
             msg = f"Folder not found at path: {path}"
             raise FileNotFoundError(msg)
-        return await self.list_items(drive_id, folder_item.id or "root")
+        children = await self.list_items(drive_id, folder_item.id or "root")
+        if self._paths is not None:
+            self._paths.put(drive_id, path, folder_item.id or "root")
+            self._index_children(drive_id, path, children)
+        return children
+
+    def _index_children(
+        self, drive_id: str, path: str, children: list[DriveItemInfo]
+    ) -> None:
+        """Record the paths of a folder's child folders in the path index."""
+        if self._paths is None:
+            return
+        for child in children:
+            if child.is_folder:
+                self._paths.put(drive_id, f"{path}/{child.name}", child.id)
 
-    async def get_item(self, drive_id: str, item_id: str) -> DriveItemInfo:
+    async def get_item(
+        self,
+        drive_id: str,
+        item_id: str,
+        *,
+        select: Sequence[str] | None = DEFAULT_SELECT,
+    ) -> DriveItemInfo:
         """Get metadata for a single drive item.
 
         Parameters
@@ -237,175 +896,1909 @@ class OneDriveClient:
             The drive (document library) identifier.
         item_id:
             The drive item identifier.
+        select:
+            Fields to request via ``$select``.  Defaults to
+            :data:`DEFAULT_SELECT`; ``None`` fetches every field.
         """
-        item = await (
-            self._client.drives.by_drive_id(drive_id)
-            .items.by_drive_item_id(item_id)
-            .get()
+        if self._cache is not None:
+            cached = self._cache.get_item(drive_id, item_id)
+            if cached is not None:
+                return cached
+        return await self._coalesce(
+            ("item", drive_id, item_id, _select_key(select)),
+            partial(self._fetch_item, drive_id, item_id, select),
+        )
+
+    async def _fetch_item(
+        self, drive_id: str, item_id: str, select: Sequence[str] | None
+    ) -> DriveItemInfo:
+        item = await self._call(
+            drive_id,
+            partial(
+                self._client.drives.by_drive_id(drive_id)
+                .items.by_drive_item_id(item_id)
+                .get,
+                request_configuration=_item_request_config(select=select),
+            ),
         )
         if item is None:
             msg = f"Item not found: {item_id}"
             raise FileNotFoundError(msg)
-        return _to_drive_item_info(item)
+        info = _to_drive_item_info(item)
+        if self._cache is not None and _is_complete(select):
+            self._cache.put_item(drive_id, info, item_id)
+        return info
 
-    async def download_file(
+    async def get_item_if_changed(
         self,
         drive_id: str,
         item_id: str,
-        destination: str | Path,
-    ) -> Path:
-        """Download a file from OneDrive to the local filesystem.
+        e_tag: str,
+        *,
+        select: Sequence[str] | None = DEFAULT_SELECT,
+    ) -> DriveItemInfo | None:
+        """Revalidate an item's metadata with a conditional ``GET``.
+
+        Sends ``If-None-Match: e_tag``; when the item is unchanged Graph
+        answers ``304 Not Modified`` with no body.  The metadata cache is
+        bypassed, and refreshed when the item did change.
 
         Parameters
         ----------
         drive_id:
             The drive (document library) identifier.
         item_id:
-            The drive item identifier for the file.
-        destination:
-            Local path (file or directory).  If a directory, the remote
-            file name is preserved.
+            The drive item identifier.
+        e_tag:
+            The ``e_tag`` of the copy of the metadata the caller holds.
+        select:
+            Fields to request via ``$select``.  Defaults to
+            :data:`DEFAULT_SELECT`; ``None`` fetches every field.
 
         Returns
         -------
-        Path
-            The local path of the downloaded file.
+        DriveItemInfo | None
+            Fresh metadata, or ``None`` if the item is unchanged.
         """
-        destination = Path(destination)
-
-        # If destination is a directory, resolve the filename from Graph.
-        if destination.is_dir():
-            meta = await self.get_item(drive_id, item_id)
-            destination = destination / meta.name
-
-        content: bytes | None = await (
-            self._client.drives.by_drive_id(drive_id)
-            .items.by_drive_item_id(item_id)
-            .content.get()
-        )
-        if content is None:
-            msg = f"No content returned for item {item_id}"
-            raise FileNotFoundError(msg)
-
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        destination.write_bytes(content)
-        logger.info("Downloaded %s to %s", item_id, destination)
-        return destination
+        config = _item_request_config(select=select)
+        config.headers.add("If-None-Match", e_tag)
+        try:
+            item = await self._call(
+                drive_id,
+                partial(
+                    self._client.drives.by_drive_id(drive_id)
+                    .items.by_drive_item_id(item_id)
+                    .get,
+                    request_configuration=config,
+                ),
+            )
+        except APIError as exc:
+            # Older kiota-http versions raise on 304 instead of returning None.
+            if exc.response_status_code == _HTTP_NOT_MODIFIED:
+                return None
+            raise
+        if item is None:
+            # The SDK answers a bodiless 304 with no item.
+            return None
+        info = _to_drive_item_info(item)
+        if self._cache is not None and _is_complete(select):
+            self._cache.put_item(drive_id, info, item_id)
+        return info
 
-    async def upload_file(
+    async def walk(
         self,
         drive_id: str,
-        parent_folder_id: str,
-        filename: str,
-        content: bytes,
-    ) -> DriveItemInfo:
-        """Upload (or replace) a small file (≤ 250 MB) into a folder.
+        folder_id: str = "root",
+        *,
+        max_concurrency: int = _WALK_CONCURRENCY,
+        max_depth: int | None = None,
+        prune: Callable[[str, DriveItemInfo], bool] | None = None,
+        page_size: int | None = None,
+        select: Sequence[str] | None = DEFAULT_SELECT,
+    ) -> AsyncIterator[tuple[str, DriveItemInfo]]:
+        """Recursively iterate over a folder tree, listing folders concurrently.
+
+        Folders are listed breadth-first by a pool of ``max_concurrency``
+        workers, and ``(path, item)`` pairs are yielded as soon as they are
+        discovered, so results from different folders interleave.  Paths are
+        relative to *folder_id* and use ``/`` as the separator.
 
         Parameters
         ----------
         drive_id:
             The drive (document library) identifier.
-        parent_folder_id:
-            The item ID of the destination folder.
-        filename:
-            The desired filename in OneDrive.
-        content:
-            Raw bytes of the file.
-
-        Returns
-        -------
-        DriveItemInfo
-            Metadata of the newly created / updated drive item.
+        folder_id:
+            The item ID of the folder to start from.  Use ``"root"`` for the
+            drive root.
+        max_concurrency:
+            Maximum number of folders being listed at once.
+        max_depth:
+            Deepest level to list, at least ``1``; ``1`` yields only the
+            immediate children of *folder_id*.  ``None`` walks the whole
+            tree.
+        prune:
+            Optional ``prune(path, item)`` predicate.  Folders for which it
+            returns True are yielded but not descended into.
+        page_size:
+            Optional ``$top`` value passed to each listing.
+        select:
+            Fields to request via ``$select``.  Defaults to
+            :data:`DEFAULT_SELECT`; ``None`` fetches every field.
         """
-        # Use the Graph SDK to PUT raw bytes at the path-based content endpoint.
-        result: DriveItem | None = await (
-            self._client.drives.by_drive_id(drive_id)
-            .items.by_drive_item_id(f"{parent_folder_id}:/{filename}:")
-            .content.put(content)
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+        if max_depth is not None and max_depth < 1:
+            msg = "max_depth must be at least 1"
+            raise ValueError(msg)
+        folders: asyncio.Queue[tuple[str, str, int]] = asyncio.Queue()
+        results: asyncio.Queue[tuple[str, DriveItemInfo] | BaseException | None] = (
+            asyncio.Queue(maxsize=_WALK_BUFFER)
         )
-        if result is None:
-            msg = f"Upload returned no metadata for {filename}"
-            raise RuntimeError(msg)
-        return _to_drive_item_info(result)
+        folders.put_nowait((folder_id, "", 1))
 
-    async def upload_file_by_path(
+        async def worker() -> None:
+            while True:
+                current_id, current_path, depth = await folders.get()
+                try:
+                    async for item in self.iter_items(
+                        drive_id, current_id, page_size=page_size, select=select
+                    ):
+                        path = (
+                            f"{current_path}/{item.name}" if current_path else item.name
+                        )
+                        await results.put((path, item))
+                        if (
+                            item.is_folder
+                            and (max_depth is None or depth < max_depth)
+                            and not (prune is not None and prune(path, item))
+                        ):
+                            folders.put_nowait((item.id, path, depth + 1))
+                except Exception as exc:  # noqa: BLE001 - re-raised by the consumer
+                    await results.put(exc)
+                finally:
+                    folders.task_done()
+
+        async def finish() -> None:
+            await folders.join()
+            await results.put(None)
+
+        tasks = [asyncio.create_task(worker()) for _ in range(max_concurrency)]
+        tasks.append(asyncio.create_task(finish()))
+        try:
+            while (result := await results.get()) is not None:
+                if isinstance(result, BaseException):
+                    raise result
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def iter_delta(
         self,
         drive_id: str,
-        remote_path: str,
-        content: bytes,
-    ) -> DriveItemInfo:
-        """Upload (or replace) a file using a path relative to the drive root.
+        delta_link: str | None = None,
+        *,
+        select: Sequence[str] | None = DEFAULT_SELECT,
+    ) -> AsyncIterator[DeltaPage]:
+        """Iterate over pages of changes reported by the drive delta API.
+
+        Without *delta_link* the whole drive is enumerated.  The final page
+        carries the ``@odata.deltaLink`` to pass next time to receive only
+        the changes made since.
 
         Parameters
         ----------
         drive_id:
             The drive (document library) identifier.
-        remote_path:
-            Full path relative to root, e.g. ``"Documents/report.pdf"``.
-        content:
-            Raw bytes of the file.
+        delta_link:
+            The ``@odata.deltaLink`` returned by a previous enumeration.
+        select:
+            Fields to request via ``$select`` (``deleted`` is always added).
+            Defaults to :data:`DEFAULT_SELECT`; ``None`` fetches every field.
+            Ignored when resuming from *delta_link*, which keeps the
+            projection of the enumeration that produced it.
         """
-        result: DriveItem | None = await (
+        delta = (
             self._client.drives.by_drive_id(drive_id)
-            .items.by_drive_item_id(f"root:/{remote_path}:")
-            .content.put(content)
+            .items.by_drive_item_id("root")
+            .delta
         )
-        if result is None:
-            msg = f"Upload returned no metadata for {remote_path}"
-            raise RuntimeError(msg)
-        return _to_drive_item_info(result)
+        fields = None if select is None else [*select, "deleted"]
+        config = RequestConfiguration(
+            query_parameters=DeltaRequestBuilder.DeltaRequestBuilderGetQueryParameters(
+                select=fields,
+            ),
+        )
+        if self._raw_json:
+            request_info = (
+                _raw_get_request(delta_link)
+                if delta_link
+                else delta.to_get_request_information(config)
+            )
+            async for raw_page in self._iter_raw_pages(drive_id, request_info):
+                values = raw_page.get("value", [])
+                yield DeltaPage(
+                    items=[_dict_to_drive_item_info(data) for data in values],
+                    deleted_ids=frozenset(
+                        data["id"] for data in values if "deleted" in data
+                    ),
+                    delta_link=raw_page.get("@odata.deltaLink"),
+                )
+            return
 
-    async def create_folder(
-        self,
-        drive_id: str,
-        parent_folder_id: str,
-        folder_name: str,
-    ) -> DriveItemInfo:
-        """Create a new folder inside a parent folder.
+        if delta_link:
+            page = await self._call(drive_id, delta.with_url(delta_link).get)
+        else:
+            page = await self._call(
+                drive_id, partial(delta.get, request_configuration=config)
+            )
+        while page is not None:
+            items = page.value or []
+            yield DeltaPage(
+                items=[_to_drive_item_info(item) for item in items],
+                deleted_ids=frozenset(
+                    item.id for item in items if item.deleted and item.id
+                ),
+                delta_link=page.odata_delta_link,
+            )
+            if not page.odata_next_link:
+                break
+            page = await self._call(drive_id, delta.with_url(page.odata_next_link).get)
+
+    async def get_latest_delta_link(self, drive_id: str) -> str:
+        """Return a delta link that reports only changes made from now on.
 
         Parameters
         ----------
         drive_id:
             The drive (document library) identifier.
-        parent_folder_id:
-            Item ID of the parent folder (use ``"root"`` for the drive root).
-        folder_name:
-            Name of the new folder.
         """
-        new_folder = DriveItem(
-            name=folder_name,
-            folder=Folder(),
-            additional_data={"@microsoft.graph.conflictBehavior": "rename"},
-        )
-        result = await (
+        result = await self._call(
+            drive_id,
             self._client.drives.by_drive_id(drive_id)
-            .items.by_drive_item_id(parent_folder_id)
-            .children.post(new_folder)
+            .items.by_drive_item_id("root")
+            .delta_with_token("latest")
+            .get,
         )
-        if result is None:
-            msg = f"Folder creation returned no metadata for {folder_name}"
+        if result is None or result.odata_delta_link is None:
+            msg = f"Delta API returned no delta link for drive {drive_id}"
             raise RuntimeError(msg)
-        return _to_drive_item_info(result)
+        return result.odata_delta_link
 
-    async def delete_item(self, drive_id: str, item_id: str) -> None:
-        """Delete a file or folder (moves it to the recycle bin).
+    async def download_file(
+        self,
+        drive_id: str,
+        item_id: str,
+        destination: str | Path,
+        *,
+        chunk_size: int = _DOWNLOAD_CHUNK_SIZE,
+        max_connections: int = 1,
+        range_size: int = _DOWNLOAD_RANGE_SIZE,
+        limiter: AdaptiveLimiter | None = None,
+        verify: bool = True,
+        verify_retries: int = _DOWNLOAD_VERIFY_RETRIES,
+    ) -> Path:
+        """Download a file from OneDrive to the local filesystem.
 
-        Parameters
-        ----------
+        The body is streamed from the item's pre-authenticated download URL
+        in ``chunk_size`` pieces into a temporary file next to
+        *destination*, which is then renamed into place.  Memory use is
+        bounded by the chunk size regardless of the file size, and a failed
+        download never leaves a partial file at *destination*.
+
+        With ``max_connections > 1`` files larger than ``range_size`` are
+        split into byte ranges that are fetched concurrently with HTTP
+        ``Range`` requests and written at their offsets into a preallocated
+        file.  This saturates high-latency links that a single stream cannot.
+
+        With *verify* the content is hashed as it is written, with no second
+        read pass, and compared with the item's quickXorHash (or SHA-1 for
+        single-stream downloads of items that only report that).  On a
+        mismatch a single-stream download is repeated, while a ranged
+        download re-fetches ranges one at a time into memory and writes
+        back only those whose content differs, stopping as soon as the
+        file verifies.
+
+        Parameters
+        ----------
+        drive_id:
+            The drive (document library) identifier.
+        item_id:
+            The drive item identifier for the file.
+        destination:
+            Local path (file or directory).  If a directory, the remote
+            file name is preserved.
+        chunk_size:
+            Number of bytes read from the response per write.
+        max_connections:
+            Maximum number of ranges in flight at once.
+        range_size:
+            Size in bytes of each ranged request in parallel mode.
+        limiter:
+            Optional ``AdaptiveLimiter`` that replaces the fixed
+            *max_connections* bound: ranges are fetched in parallel and the
+            number in flight adapts to throttling and latency.
+        verify:
+            Whether to check the content against the remote hash.
+        verify_retries:
+            How many repair attempts are made before giving up.
+
+        Returns
+        -------
+        Path
+            The local path of the downloaded file.
+
+        Raises
+        ------
+        DownloadVerificationError
+            If the content still does not match after *verify_retries*
+            attempts.  No file is left at *destination*.
+        httpx.HTTPError
+            If the content still cannot be fetched after retrying
+            throttling, 5xx responses and interrupted transfers (which
+            resume from the last byte written), in single-stream and
+            ranged mode alike.  Ranged downloads raise the first failing
+            range's error as is.
+        """
+        if max_connections < 1:
+            msg = "max_connections must be at least 1"
+            raise ValueError(msg)
+        meta = await self.get_item(drive_id, item_id)
+        return await self._download_item(
+            drive_id,
+            meta,
+            Path(destination),
+            chunk_size=chunk_size,
+            max_connections=max_connections,
+            range_size=range_size,
+            limiter=limiter,
+            verify=verify,
+            verify_retries=verify_retries,
+        )
+
+    async def download_file_if_changed(
+        self,
+        drive_id: str,
+        item_id: str,
+        destination: str | Path,
+        c_tag: str,
+        *,
+        chunk_size: int = _DOWNLOAD_CHUNK_SIZE,
+        max_connections: int = 1,
+        range_size: int = _DOWNLOAD_RANGE_SIZE,
+        limiter: AdaptiveLimiter | None = None,
+        verify: bool = True,
+        verify_retries: int = _DOWNLOAD_VERIFY_RETRIES,
+    ) -> Path | None:
+        """Download a file only if its content changed since *c_tag*.
+
+        Fresh metadata is fetched (bypassing the metadata cache) and its
+        ``cTag``, which changes only when the content does, is compared with
+        *c_tag*.  An unchanged file costs one small metadata request and no
+        transfer.  Other parameters are as for :meth:`download_file`.
+
+        Returns
+        -------
+        Path | None
+            The local path of the downloaded file, or ``None`` if the
+            content is unchanged.
+        """
+        if max_connections < 1:
+            msg = "max_connections must be at least 1"
+            raise ValueError(msg)
+        meta = await self._coalesce(
+            ("item", drive_id, item_id, _select_key(DEFAULT_SELECT)),
+            partial(self._fetch_item, drive_id, item_id, DEFAULT_SELECT),
+        )
+        if meta.c_tag is not None and meta.c_tag == c_tag:
+            return None
+        return await self._download_item(
+            drive_id,
+            meta,
+            Path(destination),
+            chunk_size=chunk_size,
+            max_connections=max_connections,
+            range_size=range_size,
+            limiter=limiter,
+            verify=verify,
+            verify_retries=verify_retries,
+        )
+
+    async def download_tree(
+        self,
+        drive_id: str,
+        folder_id: str,
+        local_dir: str | Path,
+        *,
+        include: Sequence[str] | None = None,
+        exclude: Sequence[str] = (),
+        max_concurrency: int = _TREE_CONCURRENCY,
+        list_concurrency: int = _WALK_CONCURRENCY,
+        chunk_size: int = _DOWNLOAD_CHUNK_SIZE,
+        max_connections: int = 1,
+        range_size: int = _DOWNLOAD_RANGE_SIZE,
+        limiter: AdaptiveLimiter | None = None,
+        verify: bool = True,
+    ) -> TreeTransferReport:
+        """Mirror a remote folder tree into a local directory.
+
+        The tree is listed with :meth:`walk` while a pool of
+        ``max_concurrency`` workers downloads the files already discovered,
+        so transfers start with the first listing page rather than after
+        the whole tree is known.  Local directories are created only when
+        a file is written into them, and each file's modification time is
+        set to the remote ``lastModifiedDateTime``.  Files that already
+        exist locally with the remote size and modification time are
+        skipped, so an interrupted mirror can simply be run again.  A failed
+        file is recorded in the report and does not stop the others; a
+        failed listing stops the mirror and is raised as is.
+
+        Parameters
+        ----------
+        drive_id:
+            The drive (document library) identifier.
+        folder_id:
+            The item ID of the folder to mirror (``"root"`` for the drive
+            root).  Its contents are placed directly in *local_dir*.
+        local_dir:
+            The local directory to download into.
+        include:
+            Optional glob patterns; only files whose relative path or name
+            matches one of them are downloaded.
+        exclude:
+            Glob patterns for files and folders to leave out, matched
+            against the relative path and the name.  Excluded folders are
+            not listed.
+        max_concurrency:
+            Maximum number of files being downloaded at once.
+        list_concurrency:
+            Maximum number of folders being listed at once.
+        chunk_size, max_connections, range_size, limiter, verify:
+            Passed to each file download (see :meth:`download_file`).  One
+            *limiter* is shared by the ranges of every file in the tree.
+
+        Returns
+        -------
+        TreeTransferReport
+            Counts of downloaded and skipped files, bytes received, local
+            directories created, and the exception for each file that
+            failed, keyed by relative path.
+        """
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+        if max_connections < 1:
+            msg = "max_connections must be at least 1"
+            raise ValueError(msg)
+        root = Path(local_dir)
+        started = time.monotonic()
+        # Discovered files wait here; a full queue pauses the listing.
+        queue: asyncio.Queue[tuple[str, DriveItemInfo] | None] = asyncio.Queue(
+            maxsize=max_concurrency * 4
+        )
+        made: set[str] = set()
+        folders_created = transferred = skipped = received = 0
+        failures: dict[str, Exception] = {}
+
+        def make_dir(path: str) -> None:
+            nonlocal folders_created
+            if path in made:
+                return
+            if path:
+                make_dir(path.rpartition("/")[0])
+                try:
+                    (root / path).mkdir()
+                except FileExistsError:
+                    pass
+                else:
+                    folders_created += 1
+            else:
+                root.mkdir(parents=True, exist_ok=True)
+            made.add(path)
+
+        async def produce() -> None:
+            async for path, item in self.walk(
+                drive_id,
+                folder_id,
+                max_concurrency=list_concurrency,
+                prune=lambda path, _: _matches_any(path, exclude),
+            ):
+                if item.is_folder or _matches_any(path, exclude):
+                    continue
+                if include is not None and not _matches_any(path, include):
+                    continue
+                await queue.put((path, item))
+            for _ in range(max_concurrency):
+                await queue.put(None)
+
+        async def download_worker() -> None:
+            nonlocal transferred, skipped, received
+            while (entry := await queue.get()) is not None:
+                path, item = entry
+                target = root / path
+                if _is_local_copy(target, item):
+                    skipped += 1
+                    continue
+                try:
+                    make_dir(path.rpartition("/")[0])
+                    await self._download_tree_file(
+                        drive_id,
+                        item,
+                        target,
+                        chunk_size=chunk_size,
+                        max_connections=max_connections,
+                        range_size=range_size,
+                        limiter=limiter,
+                        verify=verify,
+                    )
+                except Exception as exc:  # noqa: BLE001 - reported to the caller
+                    logger.warning("Failed to download %s: %s", path, exc)
+                    failures[path] = exc
+                    continue
+                transferred += 1
+                received += item.size or 0
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(produce())
+                for _ in range(max_concurrency):
+                    group.create_task(download_worker())
+        except ExceptionGroup as exc:
+            # Only the listing can fail here; raise its error itself.
+            raise exc.exceptions[0] from None
+
+        report = TreeTransferReport(
+            files_transferred=transferred,
+            bytes_transferred=received,
+            files_skipped=skipped,
+            folders_created=folders_created,
+            failures=failures,
+            elapsed=time.monotonic() - started,
+        )
+        logger.info(
+            "Downloaded %s to %s: %d files (%d bytes), %d skipped, %d failed in %.1fs",
+            folder_id,
+            root,
+            transferred,
+            received,
+            skipped,
+            len(failures),
+            report.elapsed,
+        )
+        return report
+
+    async def _download_tree_file(
+        self,
+        drive_id: str,
+        item: DriveItemInfo,
+        target: Path,
+        *,
+        chunk_size: int,
+        max_connections: int,
+        range_size: int,
+        limiter: AdaptiveLimiter | None,
+        verify: bool,
+    ) -> None:
+        """Download one file for :meth:`download_tree` and set its mtime."""
+        download = partial(
+            self._download_item,
+            drive_id,
+            destination=target,
+            chunk_size=chunk_size,
+            max_connections=max_connections,
+            range_size=range_size,
+            limiter=limiter,
+            verify=verify,
+            verify_retries=_DOWNLOAD_VERIFY_RETRIES,
+        )
+        if item.download_url is None:
+            item = await self._fetch_item(drive_id, item.id, DEFAULT_SELECT)
+        try:
+            await download(item)
+        except httpx.HTTPStatusError as exc:
+            # Download URLs from the listing expire; fetch a fresh one once.
+            if exc.response.status_code not in _HTTP_EXPIRED_URL:
+                raise
+            item = await self._fetch_item(drive_id, item.id, DEFAULT_SELECT)
+            await download(item)
+        if item.modified_at is not None:
+            await asyncio.to_thread(_set_mtime, target, item.modified_at.timestamp())
+
+    async def _download_item(
+        self,
+        drive_id: str,
+        meta: DriveItemInfo,
+        destination: Path,
+        *,
+        chunk_size: int,
+        max_connections: int,
+        range_size: int,
+        limiter: AdaptiveLimiter | None,
+        verify: bool,
+        verify_retries: int,
+    ) -> Path:
+        """Stream the file described by *meta* to *destination* via a temp file."""
+        item_id = meta.id
+        if meta.download_url is None:
+            msg = f"No download URL returned for item {item_id}"
+            raise FileNotFoundError(msg)
+
+        # If destination is a directory, keep the remote filename.
+        if destination.is_dir():
+            destination = destination / meta.name
+        destination.parent.mkdir(parents=True, exist_ok=True)
+
+        cache_key = None
+        if self._downloads is not None:
+            cache_key = DownloadCache.key_for(drive_id, meta)
+            if cache_key is not None and await asyncio.to_thread(
+                self._downloads.fetch, cache_key, destination
+            ):
+                logger.info("Served %s from the download cache", item_id)
+                return destination
+
+        fd, tmp_name = tempfile.mkstemp(
+            dir=destination.parent, prefix=f".{destination.name}.", suffix=".part"
+        )
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        size = meta.size or 0
+        quick_xor = meta.quick_xor_hash if verify else None
+        sha1 = meta.sha1_hash.upper() if verify and meta.sha1_hash else None
+        try:
+            if (max_connections > 1 or limiter is not None) and size > range_size:
+                await self._download_ranges(
+                    meta.download_url,
+                    tmp_path,
+                    size,
+                    chunk_size=chunk_size,
+                    max_connections=max_connections,
+                    range_size=range_size,
+                    limiter=limiter,
+                    quick_xor=quick_xor,
+                    verify_retries=verify_retries,
+                )
+            else:
+                await self._download_whole(
+                    meta.download_url,
+                    tmp_path,
+                    chunk_size=chunk_size,
+                    quick_xor=quick_xor,
+                    sha1=None if quick_xor else sha1,
+                    verify_retries=verify_retries,
+                )
+            tmp_path.replace(destination)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        if self._downloads is not None and cache_key is not None:
+            await asyncio.to_thread(self._downloads.store, cache_key, destination)
+        logger.info("Downloaded %s to %s", item_id, destination)
+        return destination
+
+    async def _download_whole(
+        self,
+        url: str,
+        path: Path,
+        *,
+        chunk_size: int,
+        quick_xor: str | None,
+        sha1: str | None,
+        verify_retries: int,
+    ) -> None:
+        """Stream *url* into *path*, checking it against the expected hash."""
+        for attempt in range(verify_retries + 1):
+            quick_xor_hasher, sha1_hasher = await self._stream_whole(
+                url,
+                path,
+                chunk_size=chunk_size,
+                quick_xor=bool(quick_xor),
+                sha1=bool(sha1),
+            )
+            if quick_xor_hasher is not None:
+                actual, expected = quick_xor_hasher.b64digest(), quick_xor
+            elif sha1_hasher is not None:
+                actual, expected = sha1_hasher.hexdigest().upper(), sha1
+            else:
+                return
+            if actual == expected:
+                return
+            logger.warning(
+                "Downloaded content of %s has hash %s, expected %s (attempt %d)",
+                path.name,
+                actual,
+                expected,
+                attempt + 1,
+            )
+        msg = f"Downloaded content does not match the remote hash {expected}"
+        raise DownloadVerificationError(msg)
+
+    async def _stream_whole(
+        self, url: str, path: Path, *, chunk_size: int, quick_xor: bool, sha1: bool
+    ) -> tuple[QuickXorHash | None, Any]:
+        """Write the whole body of *url* to *path* and return its hashers.
+
+        Throttling and 5xx responses are retried after their delay, and
+        transport failures resume with a ``Range`` request from the last
+        byte written, up to ``_DOWNLOAD_MAX_RETRIES`` times in all.
+        """
+        quick_xor_hasher = QuickXorHash() if quick_xor else None
+        sha1_hasher = hashlib.sha1() if sha1 else None  # noqa: S324 - Graph's sha1Hash
+        written = 0
+        attempt = 0
+        with path.open("wb") as fh:
+            while True:
+                headers = {"Range": f"bytes={written}-"} if written else None
+                try:
+                    async with self._transfer_client.stream(
+                        "GET", url, headers=headers
+                    ) as response:
+                        response.raise_for_status()
+                        if written and response.status_code != 206:
+                            # The Range was ignored: the body starts over.
+                            fh.seek(0)
+                            fh.truncate()
+                            written = 0
+                            quick_xor_hasher = QuickXorHash() if quick_xor else None
+                            sha1_hasher = hashlib.sha1() if sha1 else None  # noqa: S324
+                        async for chunk in response.aiter_bytes(chunk_size):
+                            fh.write(chunk)
+                            written += len(chunk)
+                            if quick_xor_hasher is not None:
+                                quick_xor_hasher.update(chunk)
+                            if sha1_hasher is not None:
+                                sha1_hasher.update(chunk)
+                except httpx.TransportError as exc:
+                    attempt += 1
+                    if attempt > _DOWNLOAD_MAX_RETRIES:
+                        raise
+                    delay = min(2**attempt, 30)
+                    logger.warning(
+                        "Download of %s interrupted at %d (%s); resuming in %.1fs",
+                        path.name,
+                        written,
+                        exc,
+                        delay,
+                    )
+                except httpx.HTTPStatusError as exc:
+                    attempt += 1
+                    delay = _transfer_retry_delay(exc, attempt, max_backoff=30)
+                    if delay is None or attempt > _DOWNLOAD_MAX_RETRIES:
+                        raise
+                    logger.warning(
+                        "Download of %s failed (HTTP %d); retrying in %.1fs",
+                        path.name,
+                        exc.response.status_code,
+                        delay,
+                    )
+                else:
+                    return quick_xor_hasher, sha1_hasher
+                await asyncio.sleep(delay)
+
+    async def _download_ranges(
+        self,
+        url: str,
+        path: Path,
+        size: int,
+        *,
+        chunk_size: int,
+        max_connections: int,
+        range_size: int,
+        limiter: AdaptiveLimiter | None = None,
+        quick_xor: str | None = None,
+        verify_retries: int = _DOWNLOAD_VERIFY_RETRIES,
+    ) -> None:
+        """Fetch ``size`` bytes from *url* as concurrent ranges into *path*.
+
+        With *quick_xor* each range is hashed as it is written.  If the
+        combined hash does not match, ranges are re-fetched one by one into
+        memory and only those whose hash changed are written to *path*,
+        until the file verifies.
+        """
+        # Preallocate so every range can be written at its final offset.
+        with path.open("r+b") as fh:
+            fh.truncate(size)
+
+        slots = asyncio.Semaphore(max_connections)
+        ranges = {
+            start: min(start + range_size, size) - 1
+            for start in range(0, size, range_size)
+        }
+        hashers: dict[int, QuickXorHash] = {}
+
+        async def fetch_range(
+            start: int, end: int, buffer: io.BytesIO | None = None
+        ) -> QuickXorHash | None:
+            attempt = 0
+            while True:
+                hasher = QuickXorHash() if quick_xor else None
+                download = partial(
+                    self._download_range,
+                    url,
+                    path if buffer is None else buffer,
+                    start,
+                    end,
+                    chunk_size,
+                    hasher,
+                )
+                try:
+                    if limiter is not None:
+                        await limiter.run(download)
+                    else:
+                        async with slots:
+                            await download()
+                except httpx.HTTPStatusError as exc:
+                    # Retried out here so the limiter sees every throttled attempt.
+                    attempt += 1
+                    delay = _transfer_retry_delay(exc, attempt, max_backoff=30)
+                    if delay is None or attempt > _DOWNLOAD_MAX_RETRIES:
+                        raise
+                    logger.warning(
+                        "Range %d-%d failed (HTTP %d); retrying in %.1fs",
+                        start,
+                        end,
+                        exc.response.status_code,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    return hasher
+
+        async def fetch(start: int, end: int) -> None:
+            hasher = await fetch_range(start, end)
+            if hasher is not None:
+                hashers[start] = hasher
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for start, end in ranges.items():
+                    group.create_task(fetch(start, end))
+        except ExceptionGroup as exc:
+            # Fail like a single-stream download: with the first error itself.
+            raise exc.exceptions[0] from None
+
+        if quick_xor is None or _combined_quick_xor(hashers) == quick_xor:
+            return
+        for _ in range(verify_retries):
+            for start, end in ranges.items():
+                buffer = io.BytesIO()
+                hasher = await fetch_range(start, end, buffer)
+                if hasher is None or hasher.digest() == hashers[start].digest():
+                    continue
+                with path.open("r+b") as fh:
+                    fh.seek(start)
+                    fh.write(buffer.getbuffer())
+                logger.warning(
+                    "Range %d-%d of %s was corrupt; rewrote it", start, end, path.name
+                )
+                hashers[start] = hasher
+                if _combined_quick_xor(hashers) == quick_xor:
+                    return
+        msg = f"Downloaded content does not match the remote hash {quick_xor}"
+        raise DownloadVerificationError(msg)
+
+    async def _download_range(
+        self,
+        url: str,
+        target: Path | BinaryIO,
+        start: int,
+        end: int,
+        chunk_size: int,
+        hasher: QuickXorHash | None = None,
+    ) -> None:
+        """Write bytes ``start..end`` (inclusive) of *url* at their offset in *target*.
+
+        *target* is the destination file, or an in-memory buffer that
+        receives the range at its own offset 0.  Transport failures resume
+        from the last byte written.  Written bytes are also fed to *hasher*
+        at their offsets.
+        """
+        offset = start
+        attempt = 0
+        if isinstance(target, Path):
+            base, opened = 0, target.open("r+b")
+        else:
+            base, opened = start, contextlib.nullcontext(target)
+        with opened as fh:
+            while offset <= end:
+                fh.seek(offset - base)
+                try:
+                    async with self._transfer_client.stream(
+                        "GET", url, headers={"Range": f"bytes={offset}-{end}"}
+                    ) as response:
+                        response.raise_for_status()
+                        if response.status_code != 206:
+                            msg = f"Server ignored Range request for {url}"
+                            raise RuntimeError(msg)
+                        async for chunk in response.aiter_bytes(chunk_size):
+                            fh.write(chunk)
+                            if hasher is not None:
+                                hasher.update_at(offset, chunk)
+                            offset += len(chunk)
+                except httpx.TransportError:
+                    if attempt >= _DOWNLOAD_MAX_RETRIES:
+                        raise
+                    attempt += 1
+                    logger.warning(
+                        "Range %d-%d interrupted at %d; retrying", start, end, offset
+                    )
+                    await asyncio.sleep(min(2**attempt, 30))
+
+    async def upload_file(
+        self,
+        drive_id: str,
+        parent_folder_id: str,
+        filename: str,
+        content: bytes,
+        *,
+        skip_unchanged: bool = False,
+    ) -> DriveItemInfo:
+        """Upload (or replace) a small file (≤ 250 MB) into a folder.
+
+        Use :meth:`upload_large_file` for larger files.
+
+        Parameters
+        ----------
+        drive_id:
+            The drive (document library) identifier.
+        parent_folder_id:
+            The item ID of the destination folder.
+        filename:
+            The desired filename in OneDrive.
+        content:
+            Raw bytes of the file.
+        skip_unchanged:
+            When True, first compare the size and content hash of the
+            existing remote file, and skip the upload if they match.
+
+        Returns
+        -------
+        DriveItemInfo
+            Metadata of the newly created / updated drive item, or of the
+            existing item when an unchanged upload was skipped.
+        """
+        target = f"{parent_folder_id}:/{filename}:"
+        if skip_unchanged:
+            remote = await self._unchanged_remote(
+                drive_id, target, len(content), partial(hash_bytes, content)
+            )
+            if remote is not None:
+                return remote
+        # Use the Graph SDK to PUT raw bytes at the path-based content endpoint.
+        result: DriveItem | None = await self._call(
+            drive_id,
+            partial(
+                self._client.drives.by_drive_id(drive_id)
+                .items.by_drive_item_id(target)
+                .content.put,
+                content,
+            ),
+        )
+        if result is None:
+            msg = f"Upload returned no metadata for {filename}"
+            raise RuntimeError(msg)
+        return self._record_write(
+            drive_id, _to_drive_item_info(result), parent_folder_id
+        )
+
+    async def upload_file_by_path(
+        self,
+        drive_id: str,
+        remote_path: str,
+        content: bytes,
+        *,
+        skip_unchanged: bool = False,
+    ) -> DriveItemInfo:
+        """Upload (or replace) a file using a path relative to the drive root.
+
+        Parameters
+        ----------
+        drive_id:
+            The drive (document library) identifier.
+        remote_path:
+            Full path relative to root, e.g. ``"Documents/report.pdf"``.
+        content:
+            Raw bytes of the file.
+        skip_unchanged:
+            When True, skip the upload if the remote file already has the
+            same size and content hash (see :meth:`upload_file`).
+        """
+        target = f"root:/{remote_path}:"
+        if skip_unchanged:
+            remote = await self._unchanged_remote(
+                drive_id, target, len(content), partial(hash_bytes, content)
+            )
+            if remote is not None:
+                return remote
+        result: DriveItem | None = await self._call(
+            drive_id,
+            partial(
+                self._client.drives.by_drive_id(drive_id)
+                .items.by_drive_item_id(target)
+                .content.put,
+                content,
+            ),
+        )
+        if result is None:
+            msg = f"Upload returned no metadata for {remote_path}"
+            raise RuntimeError(msg)
+        info = _to_drive_item_info(result)
+        if self._paths is not None:
+            self._paths.put(drive_id, remote_path, info.id)
+        return self._record_write(drive_id, info)
+
+    async def upload_large_file(
+        self,
+        drive_id: str,
+        parent_folder_id: str,
+        filename: str,
+        source: str | Path | BinaryIO,
+        *,
+        chunk_size: int = _UPLOAD_CHUNK_SIZE,
+        skip_unchanged: bool = False,
+    ) -> DriveItemInfo:
+        """Upload (or replace) a file of any size using a resumable upload session.
+
+        Parameters
+        ----------
+        drive_id:
+            The drive (document library) identifier.
+        parent_folder_id:
+            The item ID of the destination folder.
+        filename:
+            The desired filename in OneDrive.
+        source:
+            Local file path or a seekable binary stream.
+        chunk_size:
+            Bytes sent per request.  Must be a multiple of 320 KiB and no
+            larger than 60 MiB.
+        skip_unchanged:
+            When True, first compare the size and content hash of the
+            existing remote file, and skip the upload if they match.  The
+            local hash is only computed when the sizes are equal.
+
+        Returns
+        -------
+        DriveItemInfo
+            Metadata of the newly created / updated drive item, or of the
+            existing item when an unchanged upload was skipped.
+        """
+        info = await self._upload_via_session(
+            drive_id,
+            f"{parent_folder_id}:/{filename}:",
+            source,
+            chunk_size,
+            skip_unchanged=skip_unchanged,
+        )
+        return self._record_write(drive_id, info, parent_folder_id)
+
+    async def upload_large_file_by_path(
+        self,
+        drive_id: str,
+        remote_path: str,
+        source: str | Path | BinaryIO,
+        *,
+        chunk_size: int = _UPLOAD_CHUNK_SIZE,
+        skip_unchanged: bool = False,
+    ) -> DriveItemInfo:
+        """Upload (or replace) a file of any size at a path relative to the drive root.
+
+        Parameters
+        ----------
+        drive_id:
+            The drive (document library) identifier.
+        remote_path:
+            Full path relative to root, e.g. ``"Backups/2024.tar"``.
+        source:
+            Local file path or a seekable binary stream.
+        chunk_size:
+            Bytes sent per request.  Must be a multiple of 320 KiB and no
+            larger than 60 MiB.
+        skip_unchanged:
+            When True, skip the upload if the remote file already has the
+            same size and content hash (see :meth:`upload_large_file`).
+        """
+        info = await self._upload_via_session(
+            drive_id,
+            f"root:/{remote_path}:",
+            source,
+            chunk_size,
+            skip_unchanged=skip_unchanged,
+        )
+        if self._paths is not None:
+            self._paths.put(drive_id, remote_path, info.id)
+        return self._record_write(drive_id, info)
+
+    async def upload_tree(
+        self,
+        local_dir: str | Path,
+        drive_id: str,
+        remote_path: str = "",
+        *,
+        include: Sequence[str] | None = None,
+        exclude: Sequence[str] = (),
+        max_concurrency: int = _TREE_CONCURRENCY,
+        simple_upload_max: int = _SIMPLE_UPLOAD_MAX,
+        chunk_size: int = _UPLOAD_CHUNK_SIZE,
+        skip_unchanged: bool = False,
+    ) -> TreeTransferReport:
+        """Upload a local directory tree, mirroring its folders in the drive.
+
+        The remote folder hierarchy is created first, one depth at a time
+        with up to ``max_concurrency`` requests in flight; existing folders
+        are reused.  Files are then uploaded by a pool of
+        ``max_concurrency`` workers: small ones with a single PUT, larger
+        ones through resumable upload sessions.  A failed file is recorded
+        in the report and does not stop the others.  So is a folder that
+        cannot be created: the files under it are reported with its error
+        and the rest of the tree is still uploaded.
+
+        Parameters
+        ----------
+        local_dir:
+            The local directory whose contents are uploaded.
+        drive_id:
+            The drive (document library) identifier.
+        remote_path:
+            Destination folder relative to the drive root, created if
+            missing.  ``""`` uploads into the root itself.
+        include:
+            Optional glob patterns; only files whose relative path or name
+            matches one of them are uploaded.
+        exclude:
+            Glob patterns for files and folders to leave out, matched
+            against the relative path and the name.  Excluded folders are
+            not descended into.
+        max_concurrency:
+            Maximum number of folder creations, or file uploads, at once.
+        simple_upload_max:
+            Files up to this many bytes are sent with a single PUT.
+        chunk_size:
+            Upload-session chunk size for larger files (see
+            :meth:`upload_large_file`).
+        skip_unchanged:
+            When True, files whose remote copy has the same size and content
+            hash are skipped (see :meth:`upload_large_file`).
+
+        Returns
+        -------
+        TreeTransferReport
+            Counts of uploaded and skipped files, bytes sent, folders
+            created, and the exception for each file or folder that failed,
+            keyed by relative path.
+        """
+        root = Path(local_dir)
+        if not root.is_dir():
+            msg = f"Not a directory: {root}"
+            raise NotADirectoryError(msg)
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+        started = time.monotonic()
+        folders, files = await asyncio.to_thread(
+            _scan_local_tree, root, include, exclude
+        )
+
+        remote_root = remote_path.strip("/")
+        folders_created = 0
+        failures: dict[str, Exception] = {}
+        # Relative local folder path -> remote item ID; each is created once.
+        # Check the destination exists, as a remembered ID may be stale.
+        destination = await self._in_folder(
+            drive_id,
+            remote_root,
+            lambda folder_id: self._fetch_item(drive_id, folder_id, ("id",)),
+        )
+        folder_ids: dict[str, str] = {"": destination.id}
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def make_folder(path: str) -> bool:
+            parent, _, name = path.rpartition("/")
+            if parent not in folder_ids:
+                failures[path] = failures[parent]
+                return False
+            try:
+                async with semaphore:
+                    info, created = await self._get_or_create_folder(
+                        drive_id, folder_ids[parent], name
+                    )
+            except Exception as exc:  # noqa: BLE001 - reported to the caller
+                logger.warning("Failed to create folder %s: %s", path, exc)
+                failures[path] = exc
+                return False
+            folder_ids[path] = info.id
+            self._folder_paths.put(drive_id, _join_path(remote_root, path), info.id)
+            return created
+
+        by_depth: defaultdict[int, list[str]] = defaultdict(list)
+        for path in folders:
+            by_depth[path.count("/")].append(path)
+        # A folder's parent must exist first, so each depth waits for the last.
+        for depth in sorted(by_depth):
+            results = await asyncio.gather(*map(make_folder, by_depth[depth]))
+            folders_created += sum(results)
+
+        transferred = skipped = sent = 0
+        pending = iter(files)
+
+        async def upload_worker() -> None:
+            nonlocal transferred, skipped, sent
+            for path, size in pending:
+                parent, _, name = path.rpartition("/")
+                if parent not in folder_ids:
+                    # Its folder could not be created; share that error.
+                    failures[path] = failures[parent]
+                    continue
+                try:
+                    uploaded = await self._upload_tree_file(
+                        drive_id,
+                        folder_ids[parent],
+                        name,
+                        root / path,
+                        size,
+                        simple_upload_max=simple_upload_max,
+                        chunk_size=chunk_size,
+                        skip_unchanged=skip_unchanged,
+                    )
+                except Exception as exc:  # noqa: BLE001 - reported to the caller
+                    logger.warning("Failed to upload %s: %s", path, exc)
+                    failures[path] = exc
+                    continue
+                if uploaded:
+                    transferred += 1
+                    sent += size
+                else:
+                    skipped += 1
+
+        async with asyncio.TaskGroup() as group:
+            for _ in range(min(max_concurrency, len(files))):
+                group.create_task(upload_worker())
+
+        report = TreeTransferReport(
+            files_transferred=transferred,
+            bytes_transferred=sent,
+            files_skipped=skipped,
+            folders_created=folders_created,
+            failures=failures,
+            elapsed=time.monotonic() - started,
+        )
+        logger.info(
+            "Uploaded %s to %s: %d files (%d bytes), %d skipped, %d failed in %.1fs",
+            root,
+            remote_root or "/",
+            transferred,
+            sent,
+            skipped,
+            len(failures),
+            report.elapsed,
+        )
+        return report
+
+    async def _upload_tree_file(
+        self,
+        drive_id: str,
+        parent_folder_id: str,
+        filename: str,
+        path: Path,
+        size: int,
+        *,
+        simple_upload_max: int,
+        chunk_size: int,
+        skip_unchanged: bool,
+    ) -> bool:
+        """Upload one file for :meth:`upload_tree`; False if it was unchanged."""
+        if skip_unchanged:
+            remote = await self._unchanged_remote(
+                drive_id,
+                f"{parent_folder_id}:/{filename}:",
+                size,
+                partial(hash_file, path),
+            )
+            if remote is not None:
+                return False
+        if size <= simple_upload_max:
+            content = await asyncio.to_thread(path.read_bytes)
+            await self.upload_file(drive_id, parent_folder_id, filename, content)
+        else:
+            await self.upload_large_file(
+                drive_id, parent_folder_id, filename, path, chunk_size=chunk_size
+            )
+        return True
+
+    async def _upload_via_session(
+        self,
+        drive_id: str,
+        target: str,
+        source: str | Path | BinaryIO,
+        chunk_size: int,
+        *,
+        skip_unchanged: bool = False,
+    ) -> DriveItemInfo:
+        """Open *source* and push it through a ``createUploadSession`` upload."""
+        if chunk_size <= 0 or chunk_size % _UPLOAD_FRAGMENT_UNIT:
+            msg = f"chunk_size must be a positive multiple of {_UPLOAD_FRAGMENT_UNIT}"
+            raise ValueError(msg)
+        if chunk_size > _UPLOAD_MAX_FRAGMENT:
+            msg = f"chunk_size must not exceed {_UPLOAD_MAX_FRAGMENT} bytes"
+            raise ValueError(msg)
+
+        if isinstance(source, (str, Path)):
+            with Path(source).open("rb") as stream:
+                return await self._upload_stream(
+                    drive_id, target, stream, chunk_size, skip_unchanged=skip_unchanged
+                )
+        if not source.seekable():
+            msg = "Upload streams must be seekable so failed chunks can be resent."
+            raise ValueError(msg)
+        return await self._upload_stream(
+            drive_id, target, source, chunk_size, skip_unchanged=skip_unchanged
+        )
+
+    async def _upload_stream(
+        self,
+        drive_id: str,
+        target: str,
+        stream: BinaryIO,
+        chunk_size: int,
+        *,
+        skip_unchanged: bool = False,
+    ) -> DriveItemInfo:
+        """Upload a seekable stream, resuming from ``nextExpectedRanges`` on failure."""
+        start = stream.tell()
+        total = stream.seek(0, os.SEEK_END) - start
+        stream.seek(start)
+        if skip_unchanged:
+            remote = await self._unchanged_remote(
+                drive_id, target, total, partial(_hash_from, stream, start)
+            )
+            if remote is not None:
+                return remote
+        if total == 0:
+            # Upload sessions reject empty files; a simple PUT handles them.
+            result: DriveItem | None = await self._call(
+                drive_id,
+                partial(
+                    self._client.drives.by_drive_id(drive_id)
+                    .items.by_drive_item_id(target)
+                    .content.put,
+                    b"",
+                ),
+            )
+            if result is None:
+                msg = f"Upload returned no metadata for {target}"
+                raise RuntimeError(msg)
+            return _to_drive_item_info(result)
+
+        session = await self._call(
+            drive_id,
+            partial(
+                self._client.drives.by_drive_id(drive_id)
+                .items.by_drive_item_id(target)
+                .create_upload_session.post,
+                CreateUploadSessionPostRequestBody(
+                    item=DriveItemUploadableProperties(
+                        additional_data={
+                            "@microsoft.graph.conflictBehavior": "replace"
+                        },
+                    ),
+                ),
+            ),
+        )
+        if session is None or session.upload_url is None:
+            msg = f"Could not create an upload session for {target}"
+            raise RuntimeError(msg)
+        upload_url = session.upload_url
+
+        offset = 0
+        attempt = 0
+        while True:
+            stream.seek(start + offset)
+            chunk = stream.read(min(chunk_size, total - offset))
+            end = offset + len(chunk) - 1
+            try:
+                # The upload URL is pre-authenticated: no Graph auth header.
+                response = await self._transfer_client.put(
+                    upload_url,
+                    content=chunk,
+                    headers={"Content-Range": f"bytes {offset}-{end}/{total}"},
+                )
+                response.raise_for_status()
+            except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+                attempt += 1
+                if isinstance(exc, httpx.HTTPStatusError):
+                    delay = _transfer_retry_delay(exc, attempt, max_backoff=60)
+                else:
+                    delay = min(2**attempt, 60)
+                if delay is None or attempt > _UPLOAD_MAX_RETRIES:
+                    # Best effort: a failed cleanup must not mask the error.
+                    with contextlib.suppress(httpx.HTTPError):
+                        await self._transfer_client.delete(upload_url)
+                    raise
+                logger.warning(
+                    "Upload chunk %d-%d of %s failed (%s); resuming in %ss",
+                    offset,
+                    end,
+                    target,
+                    exc,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                offset = await self._resume_offset(upload_url, offset)
+                continue
+
+            attempt = 0
+            if response.status_code in (200, 201):
+                return _dict_to_drive_item_info(response.json())
+            next_offset = _next_expected_offset(
+                response.json().get("nextExpectedRanges")
+            )
+            offset = end + 1 if next_offset is None else next_offset
+
+    async def _unchanged_remote(
+        self,
+        drive_id: str,
+        target: str,
+        size: int,
+        local_hashes: Callable[..., tuple[str, str | None]],
+    ) -> DriveItemInfo | None:
+        """Return the remote file at *target* if its content matches the local one.
+
+        Sizes are compared first; ``local_hashes(with_sha1=...)`` (returning
+        the local quickXorHash and SHA-1) only runs, in a worker thread,
+        when they match.  The quickXorHash is preferred when the remote
+        reports one, and SHA-1 is then not computed at all.
+        """
+        try:
+            remote = await self._fetch_item(drive_id, target, DEFAULT_SELECT)
+        except APIError as exc:
+            if _is_not_found(exc):
+                return None
+            raise
+        if remote.is_folder or remote.size != size:
+            return None
+        if not (remote.quick_xor_hash or remote.sha1_hash):
+            return None
+        quick_xor, sha1 = await asyncio.to_thread(
+            partial(local_hashes, with_sha1=not remote.quick_xor_hash)
+        )
+        if remote.quick_xor_hash:
+            unchanged = remote.quick_xor_hash == quick_xor
+        else:
+            unchanged = (remote.sha1_hash or "").upper() == sha1
+        if not unchanged:
+            return None
+        logger.info("Skipped upload of unchanged file %s", target)
+        return remote
+
+    async def _resume_offset(self, upload_url: str, fallback: int) -> int:
+        """Ask the upload session which byte the server expects next."""
+        try:
+            response = await self._transfer_client.get(upload_url)
+            response.raise_for_status()
+        except (httpx.TransportError, httpx.HTTPStatusError):
+            return fallback
+        next_offset = _next_expected_offset(response.json().get("nextExpectedRanges"))
+        return fallback if next_offset is None else next_offset
+
+    async def ensure_path(self, drive_id: str, path: str) -> str:
+        """Return the ID of the folder at *path*, creating any missing folders.
+
+        Like ``mkdir -p``: existing folders along the path are reused and
+        only the missing ones are created, so repeated and concurrent calls
+        never produce renamed duplicates.  Resolved folders are remembered
+        (in the client's ``path_index`` if it has one), so later calls for
+        the same path or its descendants skip the lookups, and concurrent
+        calls that need the same folder share one set of requests.  A
+        remembered folder that turns out to be gone (Graph answers 404) is
+        forgotten and its path resolved afresh.
+
+        Parameters
+        ----------
+        drive_id:
+            The drive (document library) identifier.
+        path:
+            Folder path relative to the drive root, e.g. ``"Reports/2024/Q1"``.
+            ``""`` is the root itself.
+
+        Raises
+        ------
+        NotADirectoryError
+            If a file exists where a folder on the path should be.
+        """
+        path = "/".join(part for part in path.split("/") if part)
+        if not path:
+            return "root"
+        folder_id = self._folder_paths.get(drive_id, path)
+        if folder_id is not None:
+            return folder_id
+        # OneDrive paths ignore case, so "A/b" and "a/B" share one request.
+        return await self._coalesce(
+            ("ensure", drive_id, path.casefold()),
+            partial(self._ensure_path, drive_id, path),
+        )
+
+    async def _ensure_path(self, drive_id: str, path: str) -> str:
+        """Resolve *path*, or create it under its (recursively ensured) parent."""
+        try:
+            info = await self._fetch_item(drive_id, f"root:/{path}:", DEFAULT_SELECT)
+        except APIError as exc:
+            if not _is_not_found(exc):
+                raise
+            parent, _, name = path.rpartition("/")
+            info, _ = await self._in_folder(
+                drive_id,
+                parent,
+                lambda parent_id: self._get_or_create_folder(drive_id, parent_id, name),
+            )
+        else:
+            if not info.is_folder:
+                msg = f"Not a folder: {path}"
+                raise NotADirectoryError(msg)
+        self._folder_paths.put(drive_id, path, info.id)
+        return info.id
+
+    async def _in_folder(
+        self, drive_id: str, path: str, action: Callable[[str], Awaitable[T]]
+    ) -> T:
+        """Run ``action(folder_id)`` for the folder at *path*, ensuring it exists.
+
+        A remembered folder ID goes stale when the folder is deleted.  If
+        *action* then fails with 404, the path is forgotten, resolved again
+        and *action* retried once with the fresh ID.
+        """
+        folder_id = await self.ensure_path(drive_id, path)
+        try:
+            return await action(folder_id)
+        except APIError as exc:
+            if not _is_not_found(exc):
+                raise
+        logger.info("Folder %s is gone from /%s; resolving it again", folder_id, path)
+        self._folder_paths.discard(drive_id, path)
+        return await action(await self.ensure_path(drive_id, path))
+
+    async def create_folder(
+        self,
+        drive_id: str,
+        parent_folder_id: str,
+        folder_name: str,
+        *,
+        conflict_behavior: str = "rename",
+    ) -> DriveItemInfo:
+        """Create a new folder inside a parent folder.
+
+        Use :meth:`ensure_path` to reuse a folder that may already exist.
+
+        Parameters
+        ----------
+        drive_id:
+            The drive (document library) identifier.
+        parent_folder_id:
+            Item ID of the parent folder (use ``"root"`` for the drive root).
+        folder_name:
+            Name of the new folder.
+        conflict_behavior:
+            What Graph does if the name is taken: ``"rename"`` (create
+            ``"name 1"``), ``"replace"`` or ``"fail"`` (raise a 409
+            ``APIError``).
+        """
+        new_folder = DriveItem(
+            name=folder_name,
+            folder=Folder(),
+            additional_data={"@microsoft.graph.conflictBehavior": conflict_behavior},
+        )
+        result = await self._call(
+            drive_id,
+            partial(
+                self._client.drives.by_drive_id(drive_id)
+                .items.by_drive_item_id(parent_folder_id)
+                .children.post,
+                new_folder,
+            ),
+        )
+        if result is None:
+            msg = f"Folder creation returned no metadata for {folder_name}"
+            raise RuntimeError(msg)
+        return self._record_write(
+            drive_id, _to_drive_item_info(result), parent_folder_id
+        )
+
+    async def _get_or_create_folder(
+        self, drive_id: str, parent_folder_id: str, folder_name: str
+    ) -> tuple[DriveItemInfo, bool]:
+        """Return the named child folder, creating it if it does not exist.
+
+        The second element is True if the folder was created by this call.
+        """
+        try:
+            info = await self.create_folder(
+                drive_id, parent_folder_id, folder_name, conflict_behavior="fail"
+            )
+        except APIError as exc:
+            if exc.response_status_code != _HTTP_CONFLICT:
+                raise
+            existing = await self._fetch_item(
+                drive_id, f"{parent_folder_id}:/{folder_name}:", DEFAULT_SELECT
+            )
+            if not existing.is_folder:
+                msg = f"{folder_name} exists in {parent_folder_id} and is not a folder"
+                raise NotADirectoryError(msg) from exc
+            return existing, False
+        return info, True
+
+    async def delete_item(self, drive_id: str, item_id: str) -> None:
+        """Delete a file or folder (moves it to the recycle bin).
+
+        Parameters
+        ----------
         drive_id:
             The drive (document library) identifier.
         item_id:
             The drive item identifier to delete.
         """
-        await (
+        await self._call(
+            drive_id,
             self._client.drives.by_drive_id(drive_id)
             .items.by_drive_item_id(item_id)
-            .delete()
+            .delete,
         )
+        if self._cache is not None:
+            self._cache.invalidate_item(drive_id, item_id)
+        self._forget_paths(drive_id, item_id)
         logger.info("Deleted item %s from drive %s", item_id, drive_id)
 
+    async def get_items(
+        self,
+        drive_id: str,
+        item_ids: list[str],
+        *,
+        max_concurrency: int = _BATCH_CONCURRENCY,
+    ) -> list[DriveItemInfo | Exception]:
+        """Get metadata for many drive items using JSON ``$batch`` requests.
+
+        Parameters
+        ----------
+        drive_id:
+            The drive (document library) identifier.
+        item_ids:
+            The drive item identifiers to fetch.
+        max_concurrency:
+            Maximum number of ``$batch`` requests in flight at once.
+
+        Returns
+        -------
+        list[DriveItemInfo | Exception]
+            One entry per ID, in input order: the item's metadata, or a
+            ``FileNotFoundError`` / ``RuntimeError`` describing why that
+            item could not be fetched.
+        """
+        responses = await self._batch(
+            [{"method": "GET", "url": _item_url(drive_id, i)} for i in item_ids],
+            drive_id,
+            max_concurrency,
+        )
+        results: list[DriveItemInfo | Exception] = []
+        for item_id, (status, body) in zip(item_ids, responses, strict=True):
+            if _batch_failed(status):
+                results.append(_batch_error(status, body, item_id))
+                continue
+            info = _dict_to_drive_item_info(body)
+            if self._cache is not None:
+                self._cache.put_item(drive_id, info, item_id)
+            results.append(info)
+        return results
+
+    async def delete_items(
+        self,
+        drive_id: str,
+        item_ids: list[str],
+        *,
+        max_concurrency: int = _BATCH_CONCURRENCY,
+    ) -> list[Exception | None]:
+        """Delete many files or folders using JSON ``$batch`` requests.
+
+        Parameters
+        ----------
+        drive_id:
+            The drive (document library) identifier.
+        item_ids:
+            The drive item identifiers to delete.
+        max_concurrency:
+            Maximum number of ``$batch`` requests in flight at once.
+
+        Returns
+        -------
+        list[Exception | None]
+            One entry per ID, in input order: ``None`` if the item was
+            deleted, otherwise a ``FileNotFoundError`` / ``RuntimeError``.
+        """
+        responses = await self._batch(
+            [{"method": "DELETE", "url": _item_url(drive_id, i)} for i in item_ids],
+            drive_id,
+            max_concurrency,
+        )
+        results: list[Exception | None] = []
+        for item_id, (status, body) in zip(item_ids, responses, strict=True):
+            if _batch_failed(status):
+                results.append(_batch_error(status, body, item_id))
+                continue
+            if self._cache is not None:
+                self._cache.invalidate_item(drive_id, item_id)
+            self._forget_paths(drive_id, item_id)
+            results.append(None)
+        logger.info("Batch-deleted %d items from drive %s", len(item_ids), drive_id)
+        return results
+
+    async def create_folders(
+        self,
+        drive_id: str,
+        folders: list[tuple[str, str]],
+        *,
+        max_concurrency: int = _BATCH_CONCURRENCY,
+    ) -> list[DriveItemInfo | Exception]:
+        """Create many folders using JSON ``$batch`` requests.
+
+        Parameters
+        ----------
+        drive_id:
+            The drive (document library) identifier.
+        folders:
+            ``(parent_folder_id, folder_name)`` pairs.
+        max_concurrency:
+            Maximum number of ``$batch`` requests in flight at once.
+
+        Returns
+        -------
+        list[DriveItemInfo | Exception]
+            One entry per folder, in input order: the new folder's metadata,
+            or a ``FileNotFoundError`` / ``RuntimeError``.
+        """
+        requests = [
+            {
+                "method": "POST",
+                "url": f"{_item_url(drive_id, parent_id)}/children",
+                "headers": {"Content-Type": "application/json"},
+                "body": {
+                    "name": name,
+                    "folder": {},
+                    "@microsoft.graph.conflictBehavior": "rename",
+                },
+            }
+            for parent_id, name in folders
+        ]
+        responses = await self._batch(requests, drive_id, max_concurrency)
+        results: list[DriveItemInfo | Exception] = []
+        for (parent_id, name), (status, body) in zip(folders, responses, strict=True):
+            if _batch_failed(status):
+                results.append(_batch_error(status, body, f"{parent_id}/{name}"))
+                continue
+            results.append(
+                self._record_write(drive_id, _dict_to_drive_item_info(body), parent_id)
+            )
+        return results
+
+    async def _batch(
+        self, requests: list[dict[str, Any]], drive_id: str, max_concurrency: int
+    ) -> list[tuple[int, Any]]:
+        """Send sub-requests through ``$batch`` and return ``(status, body)`` pairs.
+
+        Requests are grouped 20 at a time and the groups are sent
+        concurrently.  Sub-requests that Graph throttles (429/503) are
+        resent after their ``Retry-After`` delay, which also pauses the
+        drive's scheduler bucket when a scheduler is configured.  When a
+        group's ``$batch`` request itself fails, its sub-requests are
+        recorded with status ``_BATCH_NO_RESPONSE`` and the exception as
+        body; the other groups are unaffected.
+        """
+        results: list[tuple[int, Any]] = [(_BATCH_NO_RESPONSE, None)] * len(requests)
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def send(indices: list[int]) -> None:
+            for attempt in range(_BATCH_MAX_RETRIES + 1):
+                try:
+                    async with slots:
+                        payload = await self._send_json(
+                            drive_id,
+                            Method.POST,
+                            f"{self._client.request_adapter.base_url}/$batch",
+                            {
+                                "requests": [
+                                    {"id": str(i), **requests[i]} for i in indices
+                                ],
+                            },
+                        )
+                except Exception as exc:  # noqa: BLE001 - reported per sub-request
+                    logger.warning(
+                        "$batch request for %d items failed: %s", len(indices), exc
+                    )
+                    for index in indices:
+                        results[index] = (_BATCH_NO_RESPONSE, exc)
+                    return
+                throttled: list[int] = []
+                delay = 0
+                for response in (payload or {}).get("responses", []):
+                    index = int(response["id"])
+                    status = int(response["status"])
+                    results[index] = (status, response.get("body"))
+                    if status in _HTTP_THROTTLED and attempt < _BATCH_MAX_RETRIES:
+                        throttled.append(index)
+                        headers = response.get("headers") or {}
+                        delay = max(delay, retry_after(headers, 2**attempt))
+                if not throttled:
+                    return
+                indices = throttled
+                if self._scheduler is not None:
+                    self._scheduler.pause(drive_id, delay)
+                    continue
+                logger.warning(
+                    "%d batched requests throttled; retrying in %ss",
+                    len(throttled),
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+        async with asyncio.TaskGroup() as group:
+            for start in range(0, len(requests), _BATCH_MAX_REQUESTS):
+                end = min(start + _BATCH_MAX_REQUESTS, len(requests))
+                group.create_task(send(list(range(start, end))))
+        return results
+
+    async def _send_json(
+        self,
+        bucket: str,
+        method: Method,
+        url: str,
+        body: dict[str, Any] | None = None,
+    ) -> Any:
+        """Send a raw JSON request through the Graph pipeline and decode the reply.
+
+        The request uses the client's authentication and middleware (retries,
+        redirects), but skips Kiota model deserialization.
+        """
+        request_info = RequestInformation(method)
+        request_info.url = url
+        request_info.headers.try_add("Accept", "application/json")
+        if body is not None:
+            request_info.set_stream_content(
+                json.dumps(body).encode(), "application/json"
+            )
+        return await self._send_request(bucket, request_info)
+
+    async def _send_request(self, bucket: str, request_info: RequestInformation) -> Any:
+        """Send a prepared request and return its JSON body as plain Python data."""
+        content = await self._call(
+            bucket,
+            partial(
+                self._client.request_adapter.send_primitive_async,
+                request_info,
+                "bytes",
+                {"XXX": ODataError},
+            ),
+        )
+        return json.loads(content) if content else None
+
+    async def _iter_raw_pages(
+        self, bucket: str, request_info: RequestInformation
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield JSON pages of a collection request, following ``@odata.nextLink``."""
+        while True:
+            page = await self._send_request(bucket, request_info)
+            if page is None:
+                return
+            yield page
+            next_link = page.get("@odata.nextLink")
+            if not next_link:
+                return
+            request_info = _raw_get_request(next_link)
+
     async def get_folder_info(
-        self, drive_id: str, folder_id: str = "root"
+        self,
+        drive_id: str,
+        folder_id: str = "root",
+        *,
+        select: Sequence[str] | None = DEFAULT_SELECT,
     ) -> FolderInfo:
         """Get folder metadata together with its children.
 
@@ -415,9 +2808,67 @@ class OneDriveClient:
             The drive (document library) identifier.
         folder_id:
             The item ID of the folder.  Use ``"root"`` for the drive root.
+        select:
+            Fields to request via ``$select`` for the folder and each child.
+            Defaults to :data:`DEFAULT_SELECT`; ``None`` fetches every field.
         """
-        folder_meta = await self.get_item(drive_id, folder_id)
-        children = await self.list_items(drive_id, folder_id)
+        if self._cache is not None:
+            folder_meta = self._cache.get_item(drive_id, folder_id)
+            children = self._cache.get_children(drive_id, folder_id)
+            if folder_meta is not None and children is not None:
+                return FolderInfo(
+                    id=folder_meta.id,
+                    name=folder_meta.name,
+                    children=children,
+                    web_url=folder_meta.web_url,
+                )
+        folder = await self._coalesce(
+            ("folder", drive_id, folder_id, _select_key(select)),
+            partial(self._fetch_folder_info, drive_id, folder_id, select),
+        )
+        return FolderInfo(
+            id=folder.id,
+            name=folder.name,
+            children=list(folder.children),
+            web_url=folder.web_url,
+        )
+
+    async def _fetch_folder_info(
+        self, drive_id: str, folder_id: str, select: Sequence[str] | None
+    ) -> FolderInfo:
+        # Fetch the folder and its first page of children in one round trip.
+        expand = "children"
+        if select is not None:
+            expand = f"children($select={','.join(select)})"
+        config = _item_request_config(select=select, expand=[expand])
+        item = await self._call(
+            drive_id,
+            partial(
+                self._client.drives.by_drive_id(drive_id)
+                .items.by_drive_item_id(folder_id)
+                .get,
+                request_configuration=config,
+            ),
+        )
+        if item is None:
+            msg = f"Item not found: {folder_id}"
+            raise FileNotFoundError(msg)
+        folder_meta = _to_drive_item_info(item)
+        children = [_to_drive_item_info(child) for child in item.children or []]
+
+        # Expanded children are capped at one page; page the rest normally.
+        child_count = item.folder.child_count if item.folder else None
+        if "children@odata.nextLink" in item.additional_data or (
+            child_count is not None and child_count > len(children)
+        ):
+            children = [
+                child
+                async for child in self.iter_items(drive_id, folder_id, select=select)
+            ]
+
+        if self._cache is not None and _is_complete(select):
+            self._cache.put_item(drive_id, folder_meta, folder_id)
+            self._cache.put_children(drive_id, folder_id, children)
         return FolderInfo(
             id=folder_meta.id,
             name=folder_meta.name,
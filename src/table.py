@@ -0,0 +1,265 @@
+"""Columnar in-memory storage for large drive inventories.
+
+A ``list[DriveItemInfo]`` costs several hundred bytes per item once every
+string, ``datetime`` and object header is counted.  ``DriveItemTable`` keeps
+the same fields in parallel arrays instead: sizes and timestamps are packed
+machine values, MIME types and parent IDs are interned, and URLs are only
+kept on request.  ETags, cTags and content hashes are always kept, as they
+are what revalidation and change detection compare against.
+``DriveItemInfo`` objects are built on demand when a row is read.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from src.onedrive import DriveItemInfo
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Iterable, Iterator, Sequence
+
+# Sentinels for missing values in the packed columns.
+_NO_SIZE = -1
+_NO_VALUE = 0
+
+
+def _pack_datetime(value: datetime | None) -> float:
+    """Encode a timestamp as POSIX seconds, ``NaN`` standing in for ``None``."""
+    return value.timestamp() if value is not None else math.nan
+
+
+def _unpack_datetime(value: float) -> datetime | None:
+    """Inverse of :func:`_pack_datetime`; timestamps come back in UTC."""
+    return None if math.isnan(value) else datetime.fromtimestamp(value, UTC)
+
+
+class _InternPool:
+    """Map repeated strings to small integer codes (``0`` means ``None``)."""
+
+    def __init__(self) -> None:
+        self._values: list[str | None] = [None]
+        self._codes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._values) - 1
+
+    def code(self, value: str | None) -> int:
+        if value is None:
+            return _NO_VALUE
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._values)
+            self._values.append(value)
+        return code
+
+    def find(self, value: str) -> int | None:
+        return self._codes.get(value)
+
+    def value(self, code: int) -> str | None:
+        return self._values[code]
+
+
+class DriveItemTable:
+    """Memory-compact, mutable collection of drive item metadata.
+
+    Rows keep their insertion order until an item is removed, at which point
+    the last row is moved into the gap.  Lookups by item ID build an ID index
+    on first use, which is then maintained by every mutation.
+
+    Parameters
+    ----------
+    items:
+        Optional initial items.
+    keep_urls:
+        When True ``web_url`` and ``download_url`` are stored as well.  They
+        are dropped by default: they dominate per-item memory and download
+        URLs expire within the hour anyway.
+    """
+
+    def __init__(
+        self, items: Iterable[DriveItemInfo] = (), *, keep_urls: bool = False
+    ) -> None:
+        self._ids: list[str] = []
+        self._names: list[str] = []
+        self._sizes = array("q")
+        self._created = array("d")
+        self._modified = array("d")
+        self._folders = bytearray()
+        self._mime_codes = array("I")
+        self._parent_codes = array("I")
+        self._e_tags: list[str | None] = []
+        self._c_tags: list[str | None] = []
+        self._quick_xor_hashes: list[str | None] = []
+        self._sha1_hashes: list[str | None] = []
+        self._mime_types = _InternPool()
+        self._parents = _InternPool()
+        self._keep_urls = keep_urls
+        self._web_urls: list[str | None] = []
+        self._download_urls: list[str | None] = []
+        self._rows: dict[str, int] | None = None
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, row: int) -> DriveItemInfo:
+        size = self._sizes[row]
+        return DriveItemInfo(
+            id=self._ids[row],
+            name=self._names[row],
+            size=None if size == _NO_SIZE else size,
+            mime_type=self._mime_types.value(self._mime_codes[row]),
+            is_folder=bool(self._folders[row]),
+            created_at=_unpack_datetime(self._created[row]),
+            modified_at=_unpack_datetime(self._modified[row]),
+            web_url=self._web_urls[row] if self._keep_urls else None,
+            download_url=self._download_urls[row] if self._keep_urls else None,
+            parent_id=self._parents.value(self._parent_codes[row]),
+            e_tag=self._e_tags[row],
+            c_tag=self._c_tags[row],
+            quick_xor_hash=self._quick_xor_hashes[row],
+            sha1_hash=self._sha1_hashes[row],
+        )
+
+    def __iter__(self) -> Iterator[DriveItemInfo]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._index()
+
+    @property
+    def ids(self) -> Sequence[str]:
+        """Item IDs, one per row."""
+        return self._ids
+
+    @property
+    def names(self) -> Sequence[str]:
+        """Item names, one per row."""
+        return self._names
+
+    @property
+    def sizes(self) -> Sequence[int]:
+        """Item sizes in bytes, one per row (``-1`` where Graph reported none)."""
+        return self._sizes
+
+    @property
+    def modified_timestamps(self) -> Sequence[float]:
+        """Last-modified times as POSIX seconds, one per row (``NaN`` if unknown)."""
+        return self._modified
+
+    def _index(self) -> dict[str, int]:
+        if self._rows is None:
+            self._rows = {item_id: row for row, item_id in enumerate(self._ids)}
+        return self._rows
+
+    def _write(self, row: int, info: DriveItemInfo) -> None:
+        """Overwrite every column of an existing *row* with *info*."""
+        self._ids[row] = info.id
+        self._names[row] = info.name
+        self._sizes[row] = _NO_SIZE if info.size is None else info.size
+        self._created[row] = _pack_datetime(info.created_at)
+        self._modified[row] = _pack_datetime(info.modified_at)
+        self._folders[row] = info.is_folder
+        self._mime_codes[row] = self._mime_types.code(info.mime_type)
+        self._parent_codes[row] = self._parents.code(info.parent_id)
+        self._e_tags[row] = info.e_tag
+        self._c_tags[row] = info.c_tag
+        self._quick_xor_hashes[row] = info.quick_xor_hash
+        self._sha1_hashes[row] = info.sha1_hash
+        if self._keep_urls:
+            self._web_urls[row] = info.web_url
+            self._download_urls[row] = info.download_url
+
+    def append(self, info: DriveItemInfo) -> None:
+        """Add *info* as a new row, without checking for an existing ID."""
+        if self._rows is not None:
+            self._rows[info.id] = len(self._ids)
+        self._ids.append(info.id)
+        self._names.append(info.name)
+        self._sizes.append(_NO_SIZE if info.size is None else info.size)
+        self._created.append(_pack_datetime(info.created_at))
+        self._modified.append(_pack_datetime(info.modified_at))
+        self._folders.append(info.is_folder)
+        self._mime_codes.append(self._mime_types.code(info.mime_type))
+        self._parent_codes.append(self._parents.code(info.parent_id))
+        self._e_tags.append(info.e_tag)
+        self._c_tags.append(info.c_tag)
+        self._quick_xor_hashes.append(info.quick_xor_hash)
+        self._sha1_hashes.append(info.sha1_hash)
+        if self._keep_urls:
+            self._web_urls.append(info.web_url)
+            self._download_urls.append(info.download_url)
+
+    def extend(self, items: Iterable[DriveItemInfo]) -> None:
+        """Append every item in *items*."""
+        for info in items:
+            self.append(info)
+
+    async def extend_async(self, items: AsyncIterable[DriveItemInfo]) -> int:
+        """Append every item from an async iterable and return how many were added.
+
+        Fills the table straight from a listing or walk without holding the
+        intermediate ``DriveItemInfo`` objects, e.g.::
+
+            await table.extend_async(item async for _, item in client.walk(drive_id))
+        """
+        count = 0
+        async for info in items:
+            self.append(info)
+            count += 1
+        return count
+
+    def get(self, item_id: str) -> DriveItemInfo | None:
+        """Return the row for *item_id* as a ``DriveItemInfo``, or ``None``."""
+        row = self._index().get(item_id)
+        return None if row is None else self[row]
+
+    def upsert(self, info: DriveItemInfo) -> None:
+        """Replace the row with the same ID as *info*, or append it."""
+        row = self._index().get(info.id)
+        if row is None:
+            self.append(info)
+        else:
+            self._write(row, info)
+
+    def remove(self, item_id: str) -> bool:
+        """Drop the row for *item_id*; return False if it was not present."""
+        rows = self._index()
+        row = rows.pop(item_id, None)
+        if row is None:
+            return False
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self[last]
+            self._write(row, moved)
+            rows[moved.id] = row
+        del self._ids[last]
+        del self._names[last]
+        del self._sizes[last]
+        del self._created[last]
+        del self._modified[last]
+        del self._folders[last]
+        del self._mime_codes[last]
+        del self._parent_codes[last]
+        del self._e_tags[last]
+        del self._c_tags[last]
+        del self._quick_xor_hashes[last]
+        del self._sha1_hashes[last]
+        if self._keep_urls:
+            del self._web_urls[last]
+            del self._download_urls[last]
+        return True
+
+    def children_of(self, folder_id: str) -> Iterator[DriveItemInfo]:
+        """Yield the rows whose parent is *folder_id*."""
+        code = self._parents.find(folder_id)
+        if code is None:
+            return
+        for row, parent_code in enumerate(self._parent_codes):
+            if parent_code == code:
+                yield self[row]
@@ -0,0 +1,366 @@
+"""Coordinated handling of Microsoft Graph throttling.
+
+Graph answers overload with ``429 Too Many Requests`` or ``503 Service
+Unavailable`` plus a ``Retry-After`` header.  When many coroutines share a
+drive, retrying each request independently keeps hammering the service.
+``RequestScheduler`` instead pauses the whole bucket (a drive, or the entire
+tenant) for the advertised delay and bounds how many requests each bucket
+has in flight.
+
+``AdaptiveLimiter`` complements it for bulk work: rather than a fixed bound,
+it grows concurrency while the service keeps up and backs off on
+throttling or rising latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar
+
+import httpx
+from kiota_abstractions.api_error import APIError
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+_THROTTLE_STATUSES = (429, 503)
+
+# Bucket used for every request when throttling is tracked per tenant.
+TENANT_BUCKET = "tenant"
+
+
+def throttle_delay(exc: BaseException, default: float) -> float | None:
+    """Return the ``Retry-After`` delay if *exc* is a throttling response.
+
+    Returns ``None`` when *exc* is not a 429/503 error.  *default* is used
+    when the response carries no usable ``Retry-After`` header.
+    """
+    if isinstance(exc, APIError):
+        status, headers = exc.response_status_code, exc.response_headers
+    elif isinstance(exc, httpx.HTTPStatusError):
+        status, headers = exc.response.status_code, exc.response.headers
+    else:
+        return None
+    if status not in _THROTTLE_STATUSES:
+        return None
+    return retry_after(headers, default)
+
+
+def retry_after(headers: Mapping[str, str] | None, default: float) -> float:
+    """Return the ``Retry-After`` delay in *headers*, or *default*.
+
+    Fractional seconds are honoured; an absent or unparsable value (such as
+    an HTTP date) falls back to *default*.
+    """
+    value = None
+    if headers:
+        value = headers.get("Retry-After") or headers.get("retry-after")
+    try:
+        return max(float(value), 0.0) if value is not None else default
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class BucketStats:
+    """Point-in-time counters for one scheduler bucket."""
+
+    queued: int
+    in_flight: int
+    throttled: int
+    paused_for: float
+
+
+class _Bucket:
+    """Concurrency slots and pause state shared by one drive or tenant."""
+
+    def __init__(self, max_concurrency: int) -> None:
+        self.slots = asyncio.Semaphore(max_concurrency)
+        self.paused_until = 0.0
+        self.queued = 0
+        self.in_flight = 0
+        self.throttled = 0
+
+
+class RequestScheduler:
+    """Shared gate for Graph requests that reacts to throttling as a group.
+
+    Every request acquires a concurrency slot in its bucket.  When any
+    request is throttled the bucket is paused for the ``Retry-After``
+    duration, so queued and retried requests wait instead of piling on, and
+    the throttled request is retried once the pause ends.
+
+    A single scheduler can be shared by several ``OneDriveClient`` instances.
+
+    Parameters
+    ----------
+    max_concurrency:
+        Maximum number of requests in flight per bucket.
+    per_drive:
+        When True (the default) each drive has its own bucket; when False
+        all requests share one tenant-wide bucket.
+    max_retries:
+        How many times a throttled request is retried before the error is
+        raised to the caller.
+    default_retry_after:
+        Pause in seconds used when a throttling response has no
+        ``Retry-After`` header.
+    clock:
+        Monotonic time source, overridable for testing.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        *,
+        per_drive: bool = True,
+        max_retries: int = 5,
+        default_retry_after: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+        self._max_concurrency = max_concurrency
+        self._per_drive = per_drive
+        self._max_retries = max_retries
+        self._default_retry_after = default_retry_after
+        self._clock = clock
+        self._buckets: dict[str, _Bucket] = {}
+
+    def _bucket(self, key: str) -> _Bucket:
+        if not self._per_drive:
+            key = TENANT_BUCKET
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self._max_concurrency)
+        return bucket
+
+    async def _wait_until_open(self, bucket: _Bucket) -> None:
+        while (remaining := bucket.paused_until - self._clock()) > 0:
+            await asyncio.sleep(remaining)
+
+    async def run(self, bucket_key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Run ``call()`` in *bucket_key*, retrying it after throttling pauses.
+
+        Parameters
+        ----------
+        bucket_key:
+            The drive ID the request targets, or :data:`TENANT_BUCKET` for
+            requests not tied to a drive.
+        call:
+            Zero-argument callable returning a fresh awaitable per attempt.
+        """
+        bucket = self._bucket(bucket_key)
+        attempt = 0
+        while True:
+            bucket.queued += 1
+            try:
+                await self._wait_until_open(bucket)
+                await bucket.slots.acquire()
+            finally:
+                bucket.queued -= 1
+            bucket.in_flight += 1
+            try:
+                # A pause may have started while this request was queued.
+                await self._wait_until_open(bucket)
+                return await call()
+            except Exception as exc:
+                delay = throttle_delay(exc, self._default_retry_after)
+                if delay is None:
+                    raise
+                self.pause(bucket_key, delay)
+                if attempt >= self._max_retries:
+                    raise
+                attempt += 1
+            finally:
+                bucket.in_flight -= 1
+                bucket.slots.release()
+
+    def pause(self, bucket_key: str, seconds: float) -> None:
+        """Hold every request in *bucket_key* for at least *seconds*."""
+        bucket = self._bucket(bucket_key)
+        bucket.throttled += 1
+        bucket.paused_until = max(bucket.paused_until, self._clock() + seconds)
+        logger.warning("Graph throttled bucket %s; pausing %.1fs", bucket_key, seconds)
+
+    def stats(self, bucket_key: str) -> BucketStats:
+        """Return queue depth, in-flight and throttle counters for a bucket."""
+        bucket = self._bucket(bucket_key)
+        return BucketStats(
+            queued=bucket.queued,
+            in_flight=bucket.in_flight,
+            throttled=bucket.throttled,
+            paused_for=max(bucket.paused_until - self._clock(), 0.0),
+        )
+
+    def all_stats(self) -> dict[str, BucketStats]:
+        """Return :meth:`stats` for every bucket seen so far."""
+        return {key: self.stats(key) for key in self._buckets}
+
+
+@dataclass(frozen=True)
+class LimitChange:
+    """One adjustment made by an ``AdaptiveLimiter``."""
+
+    at: float
+    limit: int
+    reason: str
+
+
+@dataclass(frozen=True)
+class LimiterStats:
+    """Point-in-time state of an ``AdaptiveLimiter``."""
+
+    limit: int
+    in_flight: int
+    throttled: int
+    latency: float | None
+    baseline_latency: float | None
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that converges to what the service can sustain (AIMD).
+
+    While requests succeed with latency close to the best seen, the limit
+    grows by ``increase`` per round of requests (additive increase).  A
+    throttling response (429/503), or smoothed latency rising above
+    ``latency_tolerance`` times the baseline, cuts it by ``decrease``
+    (multiplicative decrease).  Requests that started before the last cut
+    cannot cut again, so one burst of throttling halves the limit once.
+    The limit only grows while callers actually use all of it.
+
+    Parameters
+    ----------
+    initial:
+        Starting limit.
+    min_limit:
+        The limit never drops below this.
+    max_limit:
+        The limit never grows beyond this.
+    increase:
+        Amount added to the limit per full round of successful requests.
+    decrease:
+        Factor the limit is multiplied by on a congestion signal.
+    latency_tolerance:
+        Ratio of smoothed to baseline latency treated as congestion.
+    history_size:
+        Number of recent :class:`LimitChange` records kept.
+    clock:
+        Monotonic time source, overridable for testing.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        history_size: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_limit <= initial <= max_limit:
+            msg = "Limits must satisfy 1 <= min_limit <= initial <= max_limit"
+            raise ValueError(msg)
+        if not 0 < decrease < 1:
+            msg = "decrease must be between 0 and 1"
+            raise ValueError(msg)
+        self._limit = float(initial)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._increase = increase
+        self._decrease = decrease
+        self._latency_tolerance = latency_tolerance
+        self._clock = clock
+        self._in_flight = 0
+        self._throttled = 0
+        self._latency: float | None = None
+        self._baseline: float | None = None
+        self._last_cut = float("-inf")
+        self._changed = asyncio.Condition()
+        self.history: deque[LimitChange] = deque(maxlen=history_size)
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def max_limit(self) -> int:
+        """The largest limit this limiter can grow to."""
+        return self._max_limit
+
+    def stats(self) -> LimiterStats:
+        """Return the current limit, load and latency estimates."""
+        return LimiterStats(
+            limit=self.limit,
+            in_flight=self._in_flight,
+            throttled=self._throttled,
+            latency=self._latency,
+            baseline_latency=self._baseline,
+        )
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Run ``call()`` once a slot is free, and adapt the limit to the outcome."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+            saturated = self._in_flight >= self.limit
+        started = self._clock()
+        try:
+            result = await call()
+        except Exception as exc:
+            if throttle_delay(exc, 0.0) is not None:
+                self._throttled += 1
+                self._cut(started, "throttled")
+            raise
+        finally:
+            async with self._changed:
+                self._in_flight -= 1
+                self._changed.notify_all()
+        self._observe(started, self._clock() - started, saturated=saturated)
+        return result
+
+    def _observe(self, started: float, latency: float, *, saturated: bool) -> None:
+        """Fold a successful request's latency into the estimates."""
+        if self._latency is None or self._baseline is None:
+            self._latency = self._baseline = latency
+            return
+        self._latency += (latency - self._latency) * 0.2
+        # The baseline follows improvements at once and regressions slowly.
+        if latency < self._baseline:
+            self._baseline = latency
+        else:
+            self._baseline += (latency - self._baseline) * 0.001
+        if self._latency > self._baseline * self._latency_tolerance:
+            self._cut(started, "latency")
+        elif saturated:
+            self._set_limit(self._limit + self._increase / self._limit, "increase")
+
+    def _cut(self, started: float, reason: str) -> None:
+        if started < self._last_cut:
+            return
+        self._last_cut = self._clock()
+        self._set_limit(self._limit * self._decrease, reason)
+
+    def _set_limit(self, value: float, reason: str) -> None:
+        previous = self.limit
+        self._limit = min(max(value, float(self._min_limit)), float(self._max_limit))
+        if self.limit != previous:
+            self.history.append(LimitChange(self._clock(), self.limit, reason))
+            if reason != "increase":
+                logger.info(
+                    "Concurrency limit %d -> %d (%s)", previous, self.limit, reason
+                )
@@ -0,0 +1,239 @@
+"""Shared fixtures: ``OneDriveClient`` instances backed by a mocked transport."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import re
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import pytest
+from kiota_abstractions.authentication import AnonymousAuthenticationProvider
+from msgraph import GraphServiceClient
+from msgraph.graph_request_adapter import GraphRequestAdapter
+
+from src.hashing import hash_bytes
+from src.onedrive import OneDriveClient
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture
+def make_client() -> Callable[..., OneDriveClient]:
+    """Return a factory for clients whose every request is answered by *handler*.
+
+    Graph requests and transfer-URL requests share the handler, so one
+    function can play both the Graph API and the download/upload hosts.
+    """
+
+    def factory(handler: Handler, **kwargs: Any) -> OneDriveClient:
+        transport = httpx.MockTransport(handler)
+        adapter = GraphRequestAdapter(
+            AnonymousAuthenticationProvider(),
+            client=httpx.AsyncClient(transport=transport),
+        )
+        return OneDriveClient(
+            graph_client=GraphServiceClient(request_adapter=adapter),
+            http_client=httpx.AsyncClient(transport=transport),
+            **kwargs,
+        )
+
+    return factory
+
+
+@pytest.fixture
+def no_backoff(monkeypatch) -> list[float]:
+    """Make retry sleeps instant, recording the delays that were requested."""
+    delays: list[float] = []
+    sleep = asyncio.sleep
+
+    async def instant(delay: float, *args: Any) -> None:
+        delays.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", instant)
+    return delays
+
+
+_ITEM_PATH = re.compile(
+    r"/v1\.0/drives/[^/]+/items/(?P<ref>[^/:]+(?::/.*?:)?)"
+    r"(?:/(?P<action>children|content|createUploadSession))?"
+)
+_UPLOAD_HOST = "upload.example"
+
+
+class FakeTree:
+    """An in-memory drive that answers the Graph requests transfers make.
+
+    Supports item lookups by ID or ``parent:/path:`` reference, children
+    listings, folder creation (honouring ``conflictBehavior: fail``),
+    simple uploads, upload sessions and deletes.  Names match
+    case-insensitively.  ``requests`` records ``(method, decoded path)`` for
+    every Graph request, and ``errors`` maps an item name to the status
+    returned for any write of that name.
+    """
+
+    def __init__(self) -> None:
+        self.items: dict[str, dict[str, Any]] = {"root": {"id": "root", "name": "root"}}
+        self.parents: dict[str, str] = {}
+        self.folders = {"root"}
+        self.contents: dict[str, bytes] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.errors: dict[str, int] = {}
+        self._ids = itertools.count(1)
+        self._sessions: dict[str, tuple[str, str, bytearray]] = {}
+
+    def add_folder(self, parent_id: str, name: str) -> str:
+        item_id = self._add(parent_id, name)
+        self.folders.add(item_id)
+        return item_id
+
+    def add_file(
+        self,
+        parent_id: str,
+        name: str,
+        content: bytes = b"",
+        *,
+        hashes: tuple[str, ...] = ("quickXorHash", "sha1Hash"),
+    ) -> str:
+        item_id = self.child(parent_id, name) or self._add(parent_id, name)
+        quick_xor, sha1 = hash_bytes(content, with_sha1=True)
+        known = {"quickXorHash": quick_xor, "sha1Hash": sha1}
+        self.items[item_id]["file"] = {"hashes": {k: known[k] for k in hashes}}
+        self.items[item_id]["size"] = len(content)
+        self.contents[item_id] = content
+        return item_id
+
+    def _add(self, parent_id: str, name: str) -> str:
+        item_id = f"id-{next(self._ids)}"
+        self.items[item_id] = {"id": item_id, "name": name}
+        self.parents[item_id] = parent_id
+        return item_id
+
+    def delete(self, item_id: str) -> None:
+        for child in [c for c, p in self.parents.items() if p == item_id]:
+            self.delete(child)
+        self.items.pop(item_id, None)
+        self.parents.pop(item_id, None)
+        self.folders.discard(item_id)
+
+    def move(self, item_id: str, parent_id: str) -> None:
+        self.parents[item_id] = parent_id
+
+    def child(self, parent_id: str, name: str) -> str | None:
+        for item_id, parent in self.parents.items():
+            if parent == parent_id and self.items[item_id]["name"].casefold() == (
+                name.casefold()
+            ):
+                return item_id
+        return None
+
+    def path_of(self, item_id: str) -> str:
+        parts = []
+        while item_id != "root":
+            parts.append(self.items[item_id]["name"])
+            item_id = self.parents[item_id]
+        return "/".join(reversed(parts))
+
+    def resolve(self, ref: str) -> str | None:
+        base, _, path = ref.partition(":")
+        item_id: str | None = base if base in self.items else None
+        for name in path.strip(":/").split("/") if path.strip(":/") else []:
+            if item_id is None:
+                return None
+            item_id = self.child(item_id, name)
+        return item_id
+
+    def payload(self, item_id: str) -> dict[str, Any]:
+        data = dict(self.items[item_id])
+        if item_id in self.folders:
+            children = sum(1 for p in self.parents.values() if p == item_id)
+            data["folder"] = {"childCount": children}
+        if item_id in self.parents:
+            data["parentReference"] = {"id": self.parents[item_id]}
+        return data
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == _UPLOAD_HOST:
+            return self._upload_chunk(request)
+        self.requests.append((request.method, request.url.path))
+        match = _ITEM_PATH.fullmatch(request.url.path)
+        assert match is not None, request.url.path
+        ref, action = match["ref"], match["action"]
+        if request.method == "PUT" and action == "content":
+            return self._write_file(ref, request.content)
+        if request.method == "POST" and action == "createUploadSession":
+            return self._open_session(ref)
+        item_id = self.resolve(ref)
+        if item_id is None:
+            return _error(404, "itemNotFound")
+        if request.method == "GET" and action is None:
+            return httpx.Response(200, json=self.payload(item_id))
+        if request.method == "GET" and action == "children":
+            children = [c for c, p in self.parents.items() if p == item_id]
+            return httpx.Response(
+                200, json={"value": [self.payload(c) for c in children]}
+            )
+        if request.method == "POST" and action == "children":
+            return self._create_folder(item_id, json.loads(request.content))
+        if request.method == "DELETE":
+            self.delete(item_id)
+            return httpx.Response(204)
+        raise AssertionError(f"Unexpected request {request.method} {request.url}")
+
+    def _create_folder(self, parent_id: str, body: dict[str, Any]) -> httpx.Response:
+        name = body["name"]
+        if name in self.errors:
+            return _error(self.errors[name], "accessDenied")
+        if self.child(parent_id, name) is not None:
+            if body.get("@microsoft.graph.conflictBehavior") == "fail":
+                return _error(409, "nameAlreadyExists")
+        return httpx.Response(201, json=self.payload(self.add_folder(parent_id, name)))
+
+    def _split(self, ref: str) -> tuple[str | None, str]:
+        parent_ref, _, name = ref.rstrip(":").rpartition("/")
+        return self.resolve(parent_ref.rstrip("/") + ":"), name
+
+    def _write_file(self, ref: str, content: bytes) -> httpx.Response:
+        parent_id, name = self._split(ref)
+        if parent_id is None:
+            return _error(404, "itemNotFound")
+        if name in self.errors:
+            return _error(self.errors[name], "accessDenied")
+        item_id = self.add_file(parent_id, name, content)
+        return httpx.Response(201, json=self.payload(item_id))
+
+    def _open_session(self, ref: str) -> httpx.Response:
+        parent_id, name = self._split(ref)
+        if parent_id is None:
+            return _error(404, "itemNotFound")
+        session = f"session-{len(self._sessions)}"
+        self._sessions[session] = (parent_id, name, bytearray())
+        return httpx.Response(
+            200, json={"uploadUrl": f"https://{_UPLOAD_HOST}/{session}"}
+        )
+
+    def _upload_chunk(self, request: httpx.Request) -> httpx.Response:
+        parent_id, name, data = self._sessions[request.url.path.strip("/")]
+        total = int(request.headers["Content-Range"].rpartition("/")[2])
+        data.extend(request.content)
+        if len(data) < total:
+            return httpx.Response(202, json={"nextExpectedRanges": [f"{len(data)}-"]})
+        item_id = self.add_file(parent_id, name, bytes(data))
+        return httpx.Response(201, json=self.payload(item_id))
+
+
+def _error(status: int, code: str) -> httpx.Response:
+    return httpx.Response(status, json={"error": {"code": code, "message": code}})
+
+
+@pytest.fixture
+def tree() -> FakeTree:
+    """An empty in-memory drive; pass it to ``make_client`` as the handler."""
+    return FakeTree()
@@ -0,0 +1,113 @@
+"""JSON ``$batch`` helpers: ``get_items`` and ``delete_items``."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+
+
+class BatchGraph:
+    """Answers ``$batch`` posts, dropping or throttling chosen sub-requests."""
+
+    def __init__(self, *, dropped=(), throttled=(), retry_after="0.5") -> None:
+        self.dropped = set(dropped)
+        self.throttled = set(throttled)
+        self.retry_after = retry_after
+        self.posts = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path.endswith("/$batch")
+        self.posts += 1
+        responses = []
+        for sub in json.loads(request.content)["requests"]:
+            item_id = sub["url"].rsplit("/", 1)[-1]
+            if item_id in self.dropped:
+                continue
+            if item_id in self.throttled:
+                self.throttled.discard(item_id)
+                responses.append(
+                    {
+                        "id": sub["id"],
+                        "status": 429,
+                        "headers": {"Retry-After": self.retry_after},
+                    }
+                )
+            elif sub["method"] == "DELETE":
+                responses.append({"id": sub["id"], "status": 204})
+            else:
+                body = {"id": item_id, "name": f"{item_id}.txt", "size": 1}
+                responses.append({"id": sub["id"], "status": 200, "body": body})
+        return httpx.Response(200, json={"responses": responses})
+
+
+async def test_missing_sub_response_is_an_error(make_client):
+    client = make_client(BatchGraph(dropped={"b"}))
+
+    results = await client.get_items("drive", ["a", "b", "c"])
+
+    assert [r.id for r in (results[0], results[2])] == ["a", "c"]
+    assert isinstance(results[1], RuntimeError)
+    assert "No response for b" in str(results[1])
+
+
+async def test_missing_delete_response_is_not_reported_deleted(make_client):
+    client = make_client(BatchGraph(dropped={"b"}))
+
+    results = await client.delete_items("drive", ["a", "b"])
+
+    assert results[0] is None
+    assert isinstance(results[1], RuntimeError)
+
+
+async def test_throttled_sub_requests_honour_fractional_retry_after(
+    make_client, no_backoff
+):
+    graph = BatchGraph(throttled={"b"})
+    client = make_client(graph)
+
+    results = await client.get_items("drive", ["a", "b"])
+
+    assert [r.id for r in results] == ["a", "b"]
+    assert graph.posts == 2
+    assert no_backoff == [0.5]
+
+
+async def test_unparsable_retry_after_falls_back_to_backoff(make_client, no_backoff):
+    graph = BatchGraph(throttled={"a"}, retry_after="Wed, 21 Oct 2015 07:28:00 GMT")
+    client = make_client(graph)
+
+    results = await client.get_items("drive", ["a"])
+
+    assert results[0].id == "a"
+    assert no_backoff == [1]
+
+
+async def test_failed_group_only_fails_its_own_items(make_client):
+    graph = BatchGraph()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if json.loads(request.content)["requests"][0]["id"] == "20":
+            return httpx.Response(400, json={"error": {"message": "bad batch"}})
+        return graph(request)
+
+    client = make_client(handler)
+    item_ids = [f"i{n}" for n in range(45)]
+
+    results = await client.get_items("drive", item_ids)
+
+    assert len(results) == 45
+    assert [r.id for r in results[:20] + results[40:]] == item_ids[:20] + item_ids[40:]
+    assert all(isinstance(r, RuntimeError) for r in results[20:40])
+    assert "$batch request for i20 failed" in str(results[20])
+
+
+async def test_transport_error_fails_every_group_without_raising(make_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("graph unreachable", request=request)
+
+    client = make_client(handler)
+
+    results = await client.delete_items("drive", ["a", "b"])
+
+    assert all(isinstance(r, RuntimeError) for r in results)
@@ -0,0 +1,119 @@
+"""Coalescing of identical concurrent reads into one Graph request."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from kiota_abstractions.api_error import APIError
+
+
+ITEM = {"id": "item-1", "name": "report.pdf", "size": 3}
+
+
+class GatedGraph:
+    """Holds every request until ``release`` is set, counting them."""
+
+    def __init__(self, response: httpx.Response | None = None) -> None:
+        self.response = response
+        self.requests = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.started.set()
+        await self.release.wait()
+        if self.response is not None:
+            return self.response
+        if request.url.path.endswith("/children"):
+            return httpx.Response(200, json={"value": [ITEM]})
+        return httpx.Response(200, json=ITEM)
+
+
+async def _gather_released(graph: GatedGraph, calls) -> list:
+    tasks = [asyncio.ensure_future(call) for call in calls]
+    await graph.started.wait()
+    graph.release.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def test_concurrent_get_item_sends_one_request(make_client):
+    graph = GatedGraph()
+    client = make_client(graph)
+
+    results = await _gather_released(
+        graph, [client.get_item("drive", "item-1") for _ in range(5)]
+    )
+
+    assert graph.requests == 1
+    assert {item.id for item in results} == {"item-1"}
+
+
+async def test_concurrent_list_items_sends_one_request(make_client):
+    graph = GatedGraph()
+    client = make_client(graph)
+
+    results = await _gather_released(
+        graph, [client.list_items("drive", "folder") for _ in range(5)]
+    )
+
+    assert graph.requests == 1
+    assert all([item.id for item in items] == ["item-1"] for items in results)
+
+
+async def test_different_keys_are_not_coalesced(make_client):
+    graph = GatedGraph()
+    client = make_client(graph)
+
+    await _gather_released(
+        graph,
+        [
+            client.get_item("drive", "item-1"),
+            client.get_item("drive", "item-2"),
+            client.get_item("drive", "item-1", select=["id"]),
+        ],
+    )
+
+    assert graph.requests == 3
+
+
+async def test_every_waiter_gets_the_shared_error(make_client):
+    graph = GatedGraph(httpx.Response(404, json={"error": {"code": "itemNotFound"}}))
+    client = make_client(graph)
+
+    results = await _gather_released(
+        graph, [client.get_item("drive", "item-1") for _ in range(3)]
+    )
+
+    assert graph.requests == 1
+    assert all(isinstance(r, APIError) for r in results)
+
+
+async def test_cancelling_one_waiter_leaves_the_others(make_client):
+    graph = GatedGraph()
+    client = make_client(graph)
+    tasks = [
+        asyncio.ensure_future(client.get_item("drive", "item-1")) for _ in range(3)
+    ]
+    await graph.started.wait()
+
+    tasks[0].cancel()
+    graph.release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await tasks[0]
+    assert [(await t).id for t in tasks[1:]] == ["item-1", "item-1"]
+    assert graph.requests == 1
+
+
+async def test_finished_requests_are_not_reused(make_client):
+    graph = GatedGraph()
+    graph.release.set()
+    client = make_client(graph)
+
+    await client.get_item("drive", "item-1")
+    await client.get_item("drive", "item-1")
+
+    assert graph.requests == 2
@@ -0,0 +1,62 @@
+"""Conditional (``If-None-Match``) item fetches."""
+
+from __future__ import annotations
+
+import httpx
+from kiota_abstractions.api_error import APIError
+from kiota_http.httpx_request_adapter import HttpxRequestAdapter
+
+
+ITEM = {
+    "id": "item-1",
+    "name": "report.pdf",
+    "size": 3,
+    "eTag": '"etag-2"',
+    "cTag": '"ctag-2"',
+    "file": {"mimeType": "application/pdf"},
+}
+
+
+def _conditional(seen: list[str | None], *, changed: bool):
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if changed:
+            return httpx.Response(200, json=ITEM)
+        return httpx.Response(304)
+
+    return handler
+
+
+async def test_unchanged_item_returns_none(make_client):
+    seen: list[str | None] = []
+    client = make_client(_conditional(seen, changed=False))
+
+    assert await client.get_item_if_changed("drive", "item-1", '"etag-1"') is None
+    assert seen == ['"etag-1"']
+
+
+async def test_unchanged_item_when_sdk_raises_on_304(make_client, monkeypatch):
+    # kiota-http releases before 1.14 raise an APIError for 304 responses.
+    original = HttpxRequestAdapter.throw_failed_responses
+
+    async def throw_failed_responses(self, response, *args):
+        if response.status_code == 304:
+            raise APIError("Not Modified", response_status_code=304)
+        return await original(self, response, *args)
+
+    monkeypatch.setattr(
+        HttpxRequestAdapter, "throw_failed_responses", throw_failed_responses
+    )
+    client = make_client(_conditional([], changed=False))
+
+    assert await client.get_item_if_changed("drive", "item-1", '"etag-1"') is None
+
+
+async def test_changed_item_returns_fresh_metadata(make_client):
+    client = make_client(_conditional([], changed=True))
+
+    info = await client.get_item_if_changed("drive", "item-1", '"etag-1"')
+
+    assert info is not None
+    assert info.e_tag == '"etag-2"'
+    assert info.c_tag == '"ctag-2"'
@@ -0,0 +1,173 @@
+"""Incremental change tracking with ``DeltaSync`` and its token stores."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+from kiota_abstractions.api_error import APIError
+
+from src.delta import (
+    ChangeType,
+    DeltaState,
+    DeltaSync,
+    FileDeltaTokenStore,
+    SQLiteDeltaTokenStore,
+)
+from src.table import DriveItemTable
+
+
+DELTA_URL = "https://graph.microsoft.com/v1.0/drives/drive/items/root/delta"
+OLD = "2000-01-01T00:00:00Z"
+FUTURE = "2999-01-01T00:00:00Z"
+
+
+def _item(item_id: str, created: str = OLD) -> dict:
+    return {"id": item_id, "name": f"{item_id}.txt", "createdDateTime": created}
+
+
+class DeltaGraph:
+    """Serves delta pages keyed by a ``token`` query parameter.
+
+    The initial enumeration has two pages linked by ``@odata.nextLink``;
+    token ``L1`` reports later changes, and any token in ``expired``
+    answers 410 Gone.
+    """
+
+    def __init__(self) -> None:
+        self.tokens: list[str | None] = []
+        self.expired = {"stale"}
+        self.pages = {
+            None: (
+                [_item("a"), _item("b")],
+                {"@odata.nextLink": f"{DELTA_URL}?token=p2"},
+            ),
+            "p2": ([_item("c")], {"@odata.deltaLink": f"{DELTA_URL}?token=L1"}),
+            "L1": (
+                [
+                    _item("new", FUTURE),
+                    _item("a"),
+                    {"id": "b", "name": "b.txt", "deleted": {"state": "deleted"}},
+                ],
+                {"@odata.deltaLink": f"{DELTA_URL}?token=L2"},
+            ),
+        }
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert "/root/delta" in request.url.path
+        token = request.url.params.get("token")
+        self.tokens.append(token)
+        if token in self.expired:
+            return httpx.Response(410, json={"error": {"code": "resyncRequired"}})
+        values, links = self.pages[token]
+        return httpx.Response(200, json={"value": values, **links})
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "json":
+        return FileDeltaTokenStore(tmp_path / "tokens.json")
+    return SQLiteDeltaTokenStore(tmp_path / "tokens.db")
+
+
+async def _collect(sync: DeltaSync) -> dict[str, ChangeType]:
+    return {
+        change.item.id: change.change_type async for change in sync.changes("drive")
+    }
+
+
+async def test_first_run_reports_everything_as_created(make_client, store):
+    graph = DeltaGraph()
+    sync = DeltaSync(make_client(graph), store)
+
+    changes = await _collect(sync)
+
+    assert changes == dict.fromkeys("abc", ChangeType.CREATED)
+    assert graph.tokens == [None, "p2"]
+    assert store.load("drive").delta_link == f"{DELTA_URL}?token=L1"
+
+
+async def test_later_runs_classify_created_modified_and_deleted(make_client, store):
+    graph = DeltaGraph()
+    sync = DeltaSync(make_client(graph), store)
+    await _collect(sync)
+
+    changes = await _collect(sync)
+
+    assert changes == {
+        "new": ChangeType.CREATED,
+        "a": ChangeType.MODIFIED,
+        "b": ChangeType.DELETED,
+    }
+    assert store.load("drive").delta_link == f"{DELTA_URL}?token=L2"
+
+
+async def test_link_is_saved_only_after_a_full_run(make_client, store):
+    graph = DeltaGraph()
+    sync = DeltaSync(make_client(graph), store)
+
+    changes = sync.changes("drive")
+    await anext(changes)
+    await changes.aclose()
+
+    assert store.load("drive") is None
+    assert await _collect(sync) == dict.fromkeys("abc", ChangeType.CREATED)
+
+
+async def test_expired_link_triggers_a_full_resync(make_client, store):
+    graph = DeltaGraph()
+    store.save("drive", DeltaState(f"{DELTA_URL}?token=stale", datetime.now(UTC)))
+    sync = DeltaSync(make_client(graph), store)
+
+    changes = await _collect(sync)
+
+    assert graph.tokens == ["stale", None, "p2"]
+    assert changes == dict.fromkeys("abc", ChangeType.CREATED)
+    assert store.load("drive").delta_link == f"{DELTA_URL}?token=L1"
+
+
+async def test_expired_link_without_saved_state_is_raised(make_client, store):
+    graph = DeltaGraph()
+    graph.expired.add(None)
+    sync = DeltaSync(make_client(graph), store)
+
+    with pytest.raises(APIError):
+        await _collect(sync)
+
+
+async def test_apply_to_keeps_a_table_current(make_client, store):
+    sync = DeltaSync(make_client(DeltaGraph()), store)
+    table = DriveItemTable()
+
+    assert await sync.apply_to("drive", table) == 3
+    assert await sync.apply_to("drive", table) == 3
+
+    assert sorted(table.ids) == ["a", "c", "new"]
+
+
+def test_store_round_trip_per_drive(store):
+    synced = datetime(2024, 5, 2, 11, 30, tzinfo=UTC)
+    store.save("one", DeltaState("link-1", synced))
+    store.save("two", DeltaState("link-2", synced))
+    store.save("one", DeltaState("link-3", synced))
+
+    store.clear("two")
+    store.clear("missing")
+
+    assert store.load("one") == DeltaState("link-3", synced)
+    assert store.load("two") is None
+
+
+def test_stores_persist_across_instances(tmp_path):
+    synced = datetime(2024, 5, 2, 11, 30, tzinfo=UTC)
+    for make in (
+        lambda: FileDeltaTokenStore(tmp_path / "nested" / "tokens.json"),
+        lambda: SQLiteDeltaTokenStore(tmp_path / "tokens.db"),
+    ):
+        first = make()
+        first.save("drive", DeltaState("link", synced))
+        if isinstance(first, SQLiteDeltaTokenStore):
+            first.close()
+
+        assert make().load("drive") == DeltaState("link", synced)
@@ -0,0 +1,242 @@
+"""File downloads: single-stream and ranged, against a mocked download host."""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.hashing import hash_bytes
+from src.onedrive import DownloadVerificationError
+from src.throttle import AdaptiveLimiter
+
+
+CONTENT = os.urandom(100_000)
+DOWNLOAD_URL = "https://download.example/blob"
+
+
+class FakeDrive:
+    """Serves one file's metadata from Graph and its bytes from a download URL.
+
+    ``failures`` holds HTTP responses returned, in order, to the next
+    requests for the download URL before it starts serving content.  With
+    ``drop_after`` set, the next full-body response breaks off after that
+    many bytes.  ``corrupt`` maps range starts to how many more times that
+    range is served with its first byte flipped.
+    """
+
+    def __init__(self, content: bytes = CONTENT) -> None:
+        self.content = content
+        self.failures: list[httpx.Response] = []
+        self.drop_after: int | None = None
+        self.corrupt: dict[int, int] = {}
+        self.ranges: list[str | None] = []
+        self.downloads = 0
+        self.metadata_requests = 0
+
+    def metadata(self) -> dict:
+        return {
+            "id": "item-1",
+            "name": "blob.bin",
+            "size": len(self.content),
+            "file": {"hashes": {"quickXorHash": hash_bytes(self.content)[0]}},
+            "@microsoft.graph.downloadUrl": DOWNLOAD_URL,
+        }
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == "graph.microsoft.com":
+            self.metadata_requests += 1
+            return httpx.Response(200, json=self.metadata())
+        self.downloads += 1
+        self.ranges.append(request.headers.get("Range"))
+        if self.failures:
+            return self.failures.pop(0)
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", request.headers.get("Range", ""))
+        if match is None:
+            if self.drop_after is not None:
+                cut, self.drop_after = self.drop_after, None
+                return httpx.Response(200, stream=_Dropped(self.content[:cut]))
+            return httpx.Response(200, content=self.content)
+        start = int(match[1])
+        end = int(match[2]) if match[2] else len(self.content) - 1
+        body = self.content[start : end + 1]
+        if self.corrupt.get(start):
+            self.corrupt[start] -= 1
+            body = bytes([body[0] ^ 0xFF]) + body[1:]
+        return httpx.Response(206, content=body)
+
+
+class _Dropped(httpx.AsyncByteStream):
+    """A response body that breaks off with a read error after *data*."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    async def __aiter__(self):
+        yield self.data
+        raise httpx.ReadError("connection reset")
+
+
+def _throttled() -> httpx.Response:
+    return httpx.Response(429, headers={"Retry-After": "0"})
+
+
+async def test_single_stream_download(make_client, tmp_path):
+    client = make_client(FakeDrive())
+
+    path = await client.download_file("drive", "item-1", tmp_path)
+
+    assert path == tmp_path / "blob.bin"
+    assert path.read_bytes() == CONTENT
+
+
+async def test_single_stream_download_retries_throttling_and_5xx(
+    make_client, tmp_path, no_backoff
+):
+    drive = FakeDrive()
+    drive.failures = [httpx.Response(503), _throttled()]
+    client = make_client(drive)
+
+    path = await client.download_file("drive", "item-1", tmp_path)
+
+    assert path.read_bytes() == CONTENT
+    assert drive.downloads == 3
+    assert no_backoff == [2, 0]
+
+
+async def test_single_stream_download_resumes_after_a_dropped_connection(
+    make_client, tmp_path, no_backoff
+):
+    drive = FakeDrive()
+    drive.drop_after = 40_000
+    client = make_client(drive)
+
+    path = await client.download_file("drive", "item-1", tmp_path, chunk_size=10_000)
+
+    assert path.read_bytes() == CONTENT
+    assert drive.ranges == [None, "bytes=40000-"]
+
+
+async def test_single_stream_download_does_not_retry_client_errors(
+    make_client, tmp_path, no_backoff
+):
+    drive = FakeDrive()
+    drive.failures = [httpx.Response(404)]
+    client = make_client(drive)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.download_file("drive", "item-1", tmp_path)
+    assert drive.downloads == 1
+    assert not (tmp_path / "blob.bin").exists()
+
+
+async def test_ranged_download_with_limiter_retries_throttled_ranges(
+    make_client, tmp_path
+):
+    drive = FakeDrive()
+    drive.failures = [_throttled(), _throttled()]
+    limiter = AdaptiveLimiter(initial=4)
+    client = make_client(drive)
+
+    path = await client.download_file(
+        "drive", "item-1", tmp_path, range_size=16_384, limiter=limiter
+    )
+
+    assert path.read_bytes() == CONTENT
+    assert limiter.stats().throttled == 2
+    assert limiter.limit < 4
+
+
+async def test_ranged_download_gives_up_after_retries(make_client, tmp_path):
+    drive = FakeDrive()
+    drive.failures = [_throttled() for _ in range(100)]
+    client = make_client(drive)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.download_file(
+            "drive",
+            "item-1",
+            tmp_path,
+            range_size=16_384,
+            limiter=AdaptiveLimiter(initial=1, max_limit=1),
+        )
+    assert not (tmp_path / "blob.bin").exists()
+
+
+async def test_ranged_download_retries_server_errors(make_client, tmp_path, no_backoff):
+    drive = FakeDrive()
+    drive.failures = [httpx.Response(502), httpx.Response(504)]
+    client = make_client(drive)
+
+    path = await client.download_file(
+        "drive", "item-1", tmp_path, max_connections=4, range_size=16_384
+    )
+
+    assert path.read_bytes() == CONTENT
+    assert sorted(no_backoff) == [2, 2]
+
+
+async def test_ranged_download_raises_plain_errors(make_client, tmp_path):
+    drive = FakeDrive()
+    drive.failures = [httpx.Response(404)]
+    client = make_client(drive)
+
+    with pytest.raises(httpx.HTTPStatusError) as info:
+        await client.download_file(
+            "drive", "item-1", tmp_path, max_connections=4, range_size=16_384
+        )
+    assert info.value.response.status_code == 404
+
+
+async def test_ranged_download_repairs_a_corrupt_range(make_client, tmp_path):
+    drive = FakeDrive()
+    drive.corrupt = {32_768: 1}
+    client = make_client(drive)
+
+    path = await client.download_file(
+        "drive", "item-1", tmp_path, max_connections=4, range_size=16_384
+    )
+
+    assert path.read_bytes() == CONTENT
+    # Seven ranges, then a repair pass that stops at the corrupt third one.
+    assert drive.downloads == 7 + 3
+
+
+async def test_repair_pass_only_writes_changed_ranges(
+    make_client, tmp_path, monkeypatch
+):
+    drive = FakeDrive()
+    drive.corrupt = {32_768: 1}
+    client = make_client(drive)
+    opened_for_write: list[Path] = []
+    real_open = Path.open
+
+    def tracking_open(self, mode="r", *args, **kwargs):
+        if mode == "r+b":
+            opened_for_write.append(self)
+        return real_open(self, mode, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", tracking_open)
+
+    await client.download_file(
+        "drive", "item-1", tmp_path, max_connections=4, range_size=16_384
+    )
+
+    # Preallocation and seven ranges, then one write-back for the repair
+    # pass, although it re-fetched three ranges.
+    assert len(opened_for_write) == 1 + 7 + 1
+
+
+async def test_persistent_corruption_fails_verification(make_client, tmp_path):
+    drive = FakeDrive()
+    drive.corrupt = {0: 100}
+    client = make_client(drive)
+
+    with pytest.raises(DownloadVerificationError):
+        await client.download_file(
+            "drive", "item-1", tmp_path, max_connections=4, range_size=16_384
+        )
+    assert not (tmp_path / "blob.bin").exists()
@@ -0,0 +1,101 @@
+"""The content-addressed download cache."""
+
+from __future__ import annotations
+
+import os
+
+import httpx
+
+from src.download_cache import DownloadCache
+from src.hashing import hash_bytes
+from src.onedrive import DriveItemInfo
+
+
+CONTENT = os.urandom(20_000)
+QUICK_XOR, SHA1 = hash_bytes(CONTENT)
+
+
+def _item(item_id: str, **fields) -> DriveItemInfo:
+    return DriveItemInfo(id=item_id, name=f"{item_id}.bin", size=100, **fields)
+
+
+def test_key_uses_sha1_and_size_across_items():
+    first = _item("a", sha1_hash="ABC", c_tag="1")
+    second = _item("b", sha1_hash="abc", c_tag="2")
+
+    assert DownloadCache.key_for("d1", first) == DownloadCache.key_for("d2", second)
+    assert DownloadCache.key_for("d1", first) == "sha1:abc:100"
+
+
+def test_key_never_relies_on_quick_xor_alone():
+    info = _item("a", quick_xor_hash="q", c_tag="c1")
+
+    assert DownloadCache.key_for("d", info) == "ctag:d:a:c1:100"
+    assert DownloadCache.key_for("d", _item("a", quick_xor_hash="q")) is None
+
+
+def test_hits_do_not_touch_linked_destinations(tmp_path):
+    source = tmp_path / "source"
+    source.write_bytes(CONTENT)
+    cache = DownloadCache(tmp_path / "cache")
+    cache.store("k", source)
+    first = tmp_path / "first"
+    assert cache.fetch("k", first)
+    os.utime(first, (1_000_000, 1_000_000))
+
+    assert cache.fetch("k", tmp_path / "second")
+
+    assert first.stat().st_mtime == 1_000_000
+    assert first.read_bytes() == CONTENT
+
+
+def test_recency_survives_restart(tmp_path):
+    cache = DownloadCache(tmp_path / "cache", max_bytes=2 * len(CONTENT))
+    source = tmp_path / "source"
+    source.write_bytes(CONTENT)
+    cache.store("old", source)
+    cache.store("new", source)
+    os.utime(cache._path(cache._name("old")), (1_000, 1_000))
+    os.utime(cache._path(cache._name("new")), (2_000, 2_000))
+    assert cache.fetch("old", tmp_path / "out")
+
+    reopened = DownloadCache(tmp_path / "cache", max_bytes=2 * len(CONTENT))
+    reopened.store("third", source)
+
+    assert reopened.fetch("old", tmp_path / "again")
+    assert not reopened.fetch("new", tmp_path / "gone")
+
+
+class TwinDrive:
+    """Two items with the same content; only ``item-1`` sits in the mirrored folder."""
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if "/children" in str(request.url):
+            return httpx.Response(200, json={"value": [self.item("item-1")]})
+        if request.url.host == "graph.microsoft.com":
+            return httpx.Response(200, json=self.item(request.url.path.split("/")[-1]))
+        return httpx.Response(200, content=CONTENT)
+
+    @staticmethod
+    def item(item_id: str) -> dict:
+        return {
+            "id": item_id,
+            "name": f"{item_id}.bin",
+            "size": len(CONTENT),
+            "cTag": f"ctag-{item_id}",
+            "lastModifiedDateTime": "2024-05-02T11:30:00Z",
+            "file": {"hashes": {"quickXorHash": QUICK_XOR, "sha1Hash": SHA1}},
+            "@microsoft.graph.downloadUrl": f"https://download.example/{item_id}",
+        }
+
+
+async def test_cache_hits_keep_mirrored_files_current(make_client, tmp_path):
+    client = make_client(TwinDrive(), download_cache=DownloadCache(tmp_path / "cache"))
+    mirror = tmp_path / "mirror"
+    await client.download_tree("drive", "root", mirror)
+
+    await client.download_file("drive", "item-2", tmp_path / "elsewhere.bin")
+    report = await client.download_tree("drive", "root", mirror)
+
+    assert report.files_skipped == 1
+    assert report.files_transferred == 0
@@ -0,0 +1,87 @@
+"""``ensure_path``: idempotent, single-flight folder creation."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+
+def _creations(tree) -> int:
+    return sum(
+        1
+        for method, path in tree.requests
+        if method == "POST" and path.endswith("/children")
+    )
+
+
+async def test_concurrent_calls_create_each_folder_once(make_client, tree):
+    client = make_client(tree)
+
+    ids = await asyncio.gather(
+        *(client.ensure_path("drive", "A/B/C") for _ in range(5)),
+        client.ensure_path("drive", "a/b"),
+    )
+
+    assert len(set(ids[:5])) == 1
+    assert tree.path_of(ids[0]).casefold() == "a/b/c"
+    assert tree.parents[ids[0]] == ids[5]
+    assert _creations(tree) == 3
+
+
+async def test_existing_folders_are_reused(make_client, tree):
+    a = tree.add_folder("root", "A")
+    b = tree.add_folder(a, "B")
+    client = make_client(tree)
+
+    folder_id = await client.ensure_path("drive", "/a//b/C/")
+
+    assert tree.parents[folder_id] == b
+    assert _creations(tree) == 1
+    assert await client.ensure_path("drive", "A/B") == b
+    assert await client.ensure_path("drive", "") == "root"
+
+
+async def test_remembered_paths_skip_lookups(make_client, tree):
+    client = make_client(tree)
+    await client.ensure_path("drive", "A/B")
+    sent = len(tree.requests)
+
+    await client.ensure_path("drive", "A/B")
+    await client.ensure_path("drive", "A")
+
+    assert len(tree.requests) == sent
+
+
+@pytest.mark.parametrize("path", ["A", "A/B"])
+async def test_a_file_in_the_way_is_rejected(make_client, tree, path):
+    tree.add_file("root", "A", b"not a folder")
+    client = make_client(tree)
+
+    with pytest.raises(NotADirectoryError):
+        await client.ensure_path("drive", path)
+
+
+async def test_deleted_remembered_folder_is_resolved_again(make_client, tree):
+    client = make_client(tree)
+    old = await client.ensure_path("drive", "A/B")
+    tree.delete(tree.parents[old])
+
+    folder_id = await client.ensure_path("drive", "A/B/C")
+
+    assert tree.path_of(folder_id) == "A/B/C"
+    assert tree.resolve("root:/A/B:") != old
+
+
+async def test_upload_tree_recovers_from_a_deleted_destination(
+    make_client, tree, tmp_path
+):
+    (tmp_path / "a.txt").write_bytes(b"a")
+    client = make_client(tree)
+    old = await client.ensure_path("drive", "Out")
+    tree.delete(old)
+
+    report = await client.upload_tree(tmp_path, "drive", "Out")
+
+    assert report.ok
+    assert tree.resolve("root:/Out/a.txt:") is not None
@@ -0,0 +1,86 @@
+"""``get_folder_info``: folder and children in one request when they fit."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+
+CHILDREN = [{"id": f"c{n}", "name": f"file{n}.txt", "size": n} for n in range(5)]
+
+
+class FolderGraph:
+    """Serves folder ``F`` with an expanded first page of ``expanded`` children.
+
+    The full listing is available from ``/children`` in pages of three.
+    """
+
+    def __init__(
+        self, expanded: int, *, next_link: bool = False, child_count: bool = True
+    ) -> None:
+        self.expanded = expanded
+        self.next_link = next_link
+        self.child_count = child_count
+        self.paths: list[str] = []
+        self.expand: str | None = None
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        if request.url.path.endswith("/children"):
+            start = int(request.url.params.get("$skiptoken", "0"))
+            body = {"value": CHILDREN[start : start + 3]}
+            if start + 3 < len(CHILDREN):
+                body["@odata.nextLink"] = str(
+                    request.url.copy_with(params={"$skiptoken": str(start + 3)})
+                )
+            return httpx.Response(200, json=body)
+        self.expand = request.url.params.get("$expand")
+        body = {
+            "id": "F",
+            "name": "Folder",
+            "folder": {"childCount": len(CHILDREN)} if self.child_count else {},
+            "children": CHILDREN[: self.expanded],
+        }
+        if self.next_link:
+            body["children@odata.nextLink"] = (
+                "https://graph.microsoft.com/v1.0/drives/drive/items/F/children"
+                "?$skiptoken=3"
+            )
+        return httpx.Response(200, json=body)
+
+
+def _ids(folder) -> list[str]:
+    return [child.id for child in folder.children]
+
+
+async def test_complete_expansion_needs_one_request(make_client):
+    graph = FolderGraph(expanded=5)
+    client = make_client(graph)
+
+    folder = await client.get_folder_info("drive", "F")
+
+    assert (folder.id, folder.name) == ("F", "Folder")
+    assert _ids(folder) == [child["id"] for child in CHILDREN]
+    assert len(graph.paths) == 1
+    assert graph.expand.startswith("children($select=id,name,")
+
+
+@pytest.mark.parametrize(
+    "graph",
+    [
+        FolderGraph(expanded=3, next_link=True, child_count=False),
+        FolderGraph(expanded=3),
+    ],
+    ids=["next-link", "child-count"],
+)
+async def test_truncated_expansion_falls_back_to_paging(make_client, graph):
+    client = make_client(graph)
+
+    folder = await client.get_folder_info("drive", "F")
+
+    assert _ids(folder) == [child["id"] for child in CHILDREN]
+    assert [path.endswith("/children") for path in graph.paths] == [
+        False,
+        True,
+        True,
+    ]
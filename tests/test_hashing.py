@@ -0,0 +1,67 @@
+"""quickXorHash against known values, with and without NumPy."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from src import hashing
+
+
+@pytest.fixture(params=["numpy", "big-integer"])
+def fold(request, monkeypatch):
+    if request.param == "numpy":
+        if hashing.np is None:
+            pytest.skip("numpy is not installed")
+    else:
+        monkeypatch.setattr(hashing, "np", None)
+    return request.param
+
+
+def test_known_digest(fold):
+    assert hashing.hash_bytes(b"hello world") == (
+        "aCgDG9jwBhDc4Q1yawMZAAAAAAA=",
+        "2AAE6C35C94FCFB415DBE95F408B9CE91EE846ED",
+    )
+
+
+def test_empty_content(fold):
+    assert hashing.hash_bytes(b"", with_sha1=False)[0] == "AAAAAAAAAAAAAAAAAAAAAAAAAAA="
+
+
+def test_pieces_in_any_order_match_whole(fold):
+    data = os.urandom(300_001)
+    whole = hashing.hash_bytes(data, with_sha1=False)[0]
+
+    pieced = hashing.QuickXorHash()
+    for start, end in [(200_000, len(data)), (0, 70_001), (70_001, 200_000)]:
+        pieced.update_at(start, data[start:end])
+
+    assert pieced.b64digest() == whole
+
+
+def test_hash_file_matches_hash_bytes(fold, tmp_path):
+    data = os.urandom(1_000_003)
+    path = tmp_path / "blob"
+    path.write_bytes(data)
+
+    assert hashing.hash_file(path) == hashing.hash_bytes(data)
+    assert hashing.hash_file(tmp_path / "blob", with_sha1=False)[1] is None
+
+
+def test_hash_file_without_numpy_streams(monkeypatch, tmp_path):
+    monkeypatch.setattr(hashing, "np", None)
+    streamed: list[bool] = []
+    hash_stream = hashing.hash_stream
+
+    def spy(stream, **kwargs):
+        streamed.append(True)
+        return hash_stream(stream, **kwargs)
+
+    monkeypatch.setattr(hashing, "hash_stream", spy)
+    (tmp_path / "blob").write_bytes(b"x" * 1000)
+
+    hashing.hash_file(tmp_path / "blob")
+
+    assert streamed == [True]
@@ -0,0 +1,115 @@
+"""The SQLite drive index."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from src.index import DriveIndex
+from src.onedrive import DriveItemInfo
+
+
+async def _entries(items):
+    for entry in items:
+        yield entry
+
+
+@pytest.fixture
+async def index(tmp_path):
+    index = DriveIndex(tmp_path / "index.db")
+    folder = DriveItemInfo(id="F", name="Docs", is_folder=True, parent_id="root")
+    files = [
+        DriveItemInfo(id=f"f{i}", name=name, size=i, parent_id="F")
+        for i, name in enumerate(["b.txt", "A.txt", "c.txt"])
+    ]
+    await index.load_walk(
+        "drive",
+        _entries([("Docs", folder)] + [(f"Docs/{f.name}", f) for f in files]),
+    )
+    return index
+
+
+def _plan(index: DriveIndex, sql: str, params: tuple) -> str:
+    rows = index._conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return " ".join(row[-1] for row in rows)
+
+
+async def test_children_are_sorted_by_name(index):
+    names = [item.name for item in index.children("drive", "F")]
+
+    assert names == ["A.txt", "b.txt", "c.txt"]
+
+
+async def test_children_query_is_index_backed(index):
+    plan = _plan(
+        index,
+        "SELECT item_id FROM items WHERE drive_id = ? AND parent_id = ? ORDER BY name",
+        ("drive", "F"),
+    )
+
+    assert "items_parent_name (drive_id=? AND parent_id=?)" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_old_parent_index_is_replaced(tmp_path):
+    path = tmp_path / "index.db"
+    DriveIndex(path)
+    conn = sqlite3.connect(path)
+    conn.execute("DROP INDEX items_parent_name")
+    conn.execute("CREATE INDEX items_parent ON items (drive_id, parent_id)")
+    conn.commit()
+    conn.close()
+
+    reopened = DriveIndex(path)
+
+    names = {
+        row[0]
+        for row in reopened._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )
+    }
+    assert "items_parent_name" in names
+    assert "items_parent" not in names
+
+
+def test_revalidation_fields_round_trip(tmp_path):
+    index = DriveIndex(tmp_path / "index.db")
+    info = DriveItemInfo(
+        id="f",
+        name="a.txt",
+        size=3,
+        parent_id="root",
+        e_tag='"{E},1"',
+        c_tag='"c:{E},2"',
+        quick_xor_hash="aCgDG9jwBhDc4Q1yawMZAAAAAAA=",
+        sha1_hash="2AAE6C35C94FCFB415DBE95F408B9CE91EE846ED",
+    )
+    index.put("drive", info, "a.txt")
+
+    assert index.get("drive", "f") == info
+    assert index.get_by_path("drive", "A.TXT") == info
+
+
+def test_old_database_gains_revalidation_columns(tmp_path):
+    path = tmp_path / "index.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE items (drive_id TEXT NOT NULL, item_id TEXT NOT NULL,"
+        " name TEXT NOT NULL COLLATE NOCASE, size INTEGER, mime_type TEXT,"
+        " is_folder INTEGER NOT NULL, created_at REAL, modified_at REAL,"
+        " web_url TEXT, parent_id TEXT, path TEXT COLLATE NOCASE,"
+        " PRIMARY KEY (drive_id, item_id))"
+    )
+    conn.execute(
+        "INSERT INTO items (drive_id, item_id, name, is_folder, path)"
+        " VALUES ('drive', 'old', 'old.txt', 0, 'old.txt')"
+    )
+    conn.commit()
+    conn.close()
+
+    index = DriveIndex(path)
+    index.put("drive", DriveItemInfo(id="new", name="new.txt", c_tag="c1"), "new.txt")
+
+    assert index.get("drive", "old") == DriveItemInfo(id="old", name="old.txt")
+    assert index.get("drive", "new").c_tag == "c1"
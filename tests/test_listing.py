@@ -0,0 +1,51 @@
+"""Folder listings that span several ``@odata.nextLink`` pages."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+
+PAGES = {
+    None: (["a", "b"], "p2"),
+    "p2": (["c", "d"], "p3"),
+    "p3": (["e"], None),
+}
+
+
+class PagedGraph:
+    """Serves a folder's children in three pages linked by ``$skiptoken``."""
+
+    def __init__(self) -> None:
+        self.tokens: list[str | None] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path.endswith("/children")
+        token = request.url.params.get("$skiptoken")
+        self.tokens.append(token)
+        names, next_token = PAGES[token]
+        body = {"value": [{"id": name, "name": name} for name in names]}
+        if next_token is not None:
+            body["@odata.nextLink"] = str(
+                request.url.copy_with(params={"$skiptoken": next_token})
+            )
+        return httpx.Response(200, json=body)
+
+
+@pytest.mark.parametrize("raw_json", [False, True])
+async def test_iter_items_follows_next_links(make_client, raw_json):
+    graph = PagedGraph()
+    client = make_client(graph, raw_json=raw_json)
+
+    names = [item.name async for item in client.iter_items("drive", "folder")]
+
+    assert names == ["a", "b", "c", "d", "e"]
+    assert graph.tokens == [None, "p2", "p3"]
+
+
+async def test_list_items_collects_every_page(make_client):
+    client = make_client(PagedGraph())
+
+    items = await client.list_items("drive", "folder")
+
+    assert [item.id for item in items] == ["a", "b", "c", "d", "e"]
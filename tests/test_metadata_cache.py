@@ -0,0 +1,59 @@
+"""Metadata caching through ``OneDriveClient``."""
+
+from __future__ import annotations
+
+import httpx
+
+from src.cache import MetadataCache
+
+
+FULL = {
+    "id": "item-1",
+    "name": "report.pdf",
+    "size": 3,
+    "file": {"hashes": {"quickXorHash": "q"}},
+    "@microsoft.graph.downloadUrl": "https://download.example/item-1",
+}
+
+
+class CountingGraph:
+    """Answers item and children requests, honouring ``$select=id``."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        item = FULL
+        if request.url.params.get("$select") == "id":
+            item = {"id": FULL["id"]}
+        if request.url.path.endswith("/children"):
+            return httpx.Response(200, json={"value": [item]})
+        return httpx.Response(200, json=item)
+
+
+async def test_narrow_item_select_is_not_served_to_others(make_client):
+    graph = CountingGraph()
+    client = make_client(graph, metadata_cache=MetadataCache())
+
+    narrow = await client.get_item("drive", "item-1", select=["id"])
+    full = await client.get_item("drive", "item-1")
+    again = await client.get_item("drive", "item-1", select=["id"])
+
+    assert narrow.name == ""
+    assert full.name == "report.pdf"
+    assert full.download_url == FULL["@microsoft.graph.downloadUrl"]
+    assert again == full
+    assert graph.requests == 2
+
+
+async def test_narrow_children_select_is_not_cached(make_client):
+    graph = CountingGraph()
+    client = make_client(graph, metadata_cache=MetadataCache())
+
+    await client.list_items("drive", "folder", select=["id"])
+    children = await client.list_items("drive", "folder")
+    await client.list_items("drive", "folder")
+
+    assert children[0].quick_xor_hash == "q"
+    assert graph.requests == 2
@@ -0,0 +1,118 @@
+"""Remembered path-to-ID resolutions: ``PathIndex`` and path-based listings."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.cache import PathIndex
+
+
+def test_paths_match_case_insensitively_and_ignore_slashes():
+    index = PathIndex()
+    index.put("drive", "/Reports/2024/", "id-1")
+
+    assert index.get("drive", "reports//2024") == "id-1"
+    assert index.get("other", "Reports/2024") is None
+
+
+def test_least_recently_used_path_is_evicted():
+    index = PathIndex(max_entries_per_drive=2)
+    index.put("drive", "a", "1")
+    index.put("drive", "b", "2")
+    index.get("drive", "a")
+    index.put("drive", "c", "3")
+
+    assert index.get("drive", "b") is None
+    assert (index.get("drive", "a"), index.get("drive", "c")) == ("1", "3")
+    assert len(index) == 2
+
+
+def test_discard_drops_descendants_only():
+    index = PathIndex()
+    for path, item_id in [("a", "1"), ("a/b", "2"), ("a/b/c", "3"), ("ab", "4")]:
+        index.put("drive", path, item_id)
+
+    index.discard("drive", "A/B")
+
+    assert index.get("drive", "a") == "1"
+    assert index.get("drive", "a/b") is None
+    assert index.get("drive", "a/b/c") is None
+    assert index.get("drive", "ab") == "4"
+
+
+def test_discard_id_drops_every_path_of_the_item():
+    index = PathIndex()
+    index.put("drive", "a", "1")
+    index.put("drive", "a/b", "2")
+    index.put("drive", "alias", "1")
+
+    index.discard_id("drive", "1")
+
+    assert len(index) == 0
+
+
+def test_bound_must_be_positive():
+    with pytest.raises(ValueError):
+        PathIndex(max_entries_per_drive=0)
+
+
+def _resolves(tree) -> list[str]:
+    return [path for method, path in tree.requests if path.endswith(":")]
+
+
+@pytest.fixture
+def docs(tree):
+    docs = tree.add_folder("root", "Docs")
+    tree.add_file(docs, "a.txt")
+    reports = tree.add_folder(docs, "Reports")
+    tree.add_file(reports, "r.txt")
+    return tree
+
+
+async def test_cached_folder_id_skips_the_resolve_call(make_client, docs):
+    client = make_client(docs, path_index=PathIndex())
+
+    first = await client.list_items_by_path("drive", "Docs")
+    second = await client.list_items_by_path("drive", "docs")
+
+    assert [item.name for item in second] == [item.name for item in first]
+    assert len(_resolves(docs)) == 1
+
+
+async def test_listed_child_folders_are_indexed(make_client, docs):
+    client = make_client(docs, path_index=PathIndex())
+    await client.list_items_by_path("drive", "Docs")
+
+    items = await client.list_items_by_path("drive", "Docs/Reports")
+
+    assert [item.name for item in items] == ["r.txt"]
+    assert len(_resolves(docs)) == 1
+
+
+async def test_stale_id_is_discarded_and_resolved_again(make_client, docs):
+    paths = PathIndex()
+    client = make_client(docs, path_index=paths)
+    await client.list_items_by_path("drive", "Docs")
+    old = paths.get("drive", "Docs")
+    docs.delete(old)
+    recreated = docs.add_folder("root", "Docs")
+    docs.add_file(recreated, "new.txt")
+
+    items = await client.list_items_by_path("drive", "Docs")
+
+    assert [item.name for item in items] == ["new.txt"]
+    assert paths.get("drive", "Docs") == recreated
+    assert paths.get("drive", "Docs/Reports") is None
+    assert len(_resolves(docs)) == 2
+
+
+async def test_deleting_a_folder_forgets_its_descendants(make_client, docs):
+    paths = PathIndex()
+    client = make_client(docs, path_index=paths)
+    await client.list_items_by_path("drive", "Docs")
+    assert paths.get("drive", "Docs/Reports") is not None
+
+    await client.delete_item("drive", paths.get("drive", "Docs"))
+
+    assert paths.get("drive", "Docs") is None
+    assert paths.get("drive", "Docs/Reports") is None
@@ -0,0 +1,86 @@
+"""``skip_unchanged`` uploads: compare size, then hash, before sending."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+import src.onedrive
+from src.hashing import hash_bytes
+
+
+@pytest.fixture
+def hash_calls(monkeypatch) -> list[bool]:
+    """Record the ``with_sha1`` flag of every local hash computed for an upload."""
+    calls: list[bool] = []
+
+    def spy(content: bytes, *, with_sha1: bool = False):
+        calls.append(with_sha1)
+        return hash_bytes(content, with_sha1=with_sha1)
+
+    monkeypatch.setattr(src.onedrive, "hash_bytes", spy)
+    return calls
+
+
+def _uploads(tree) -> int:
+    return sum(1 for method, _ in tree.requests if method == "PUT")
+
+
+async def test_size_mismatch_uploads_without_hashing(make_client, tree, hash_calls):
+    tree.add_file("root", "a.txt", b"abc")
+    client = make_client(tree)
+
+    await client.upload_file("drive", "root", "a.txt", b"abcde", skip_unchanged=True)
+
+    assert hash_calls == []
+    assert _uploads(tree) == 1
+    assert tree.contents[tree.resolve("root:/a.txt:")] == b"abcde"
+
+
+async def test_matching_quick_xor_hash_skips_the_upload(make_client, tree, hash_calls):
+    item_id = tree.add_file("root", "a.txt", b"abc")
+    client = make_client(tree)
+
+    info = await client.upload_file(
+        "drive", "root", "a.txt", b"abc", skip_unchanged=True
+    )
+
+    assert info.id == item_id
+    assert hash_calls == [False]
+    assert _uploads(tree) == 0
+
+
+@pytest.mark.parametrize(("local", "uploaded"), [(b"abc", 0), (b"xyz", 1)])
+async def test_sha1_only_remote_is_compared_by_sha1(
+    make_client, tree, hash_calls, local, uploaded
+):
+    tree.add_file("root", "a.txt", b"abc", hashes=("sha1Hash",))
+    client = make_client(tree)
+
+    await client.upload_file("drive", "root", "a.txt", local, skip_unchanged=True)
+
+    assert hash_calls == [True]
+    assert _uploads(tree) == uploaded
+
+
+async def test_missing_target_is_uploaded(make_client, tree, hash_calls):
+    client = make_client(tree)
+
+    await client.upload_file("drive", "root", "a.txt", b"abc", skip_unchanged=True)
+
+    assert hash_calls == []
+    assert tree.contents[tree.resolve("root:/a.txt:")] == b"abc"
+
+
+async def test_unchanged_large_file_opens_no_session(make_client, tree):
+    content = bytes(range(256)) * 64
+    item_id = tree.add_file("root", "big.bin", content)
+    client = make_client(tree)
+
+    info = await client.upload_large_file(
+        "drive", "root", "big.bin", io.BytesIO(content), skip_unchanged=True
+    )
+
+    assert info.id == item_id
+    assert not any(path.endswith("createUploadSession") for _, path in tree.requests)
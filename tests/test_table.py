@@ -0,0 +1,40 @@
+"""The columnar in-memory item table."""
+
+from __future__ import annotations
+
+from src.onedrive import DriveItemInfo
+from src.table import DriveItemTable
+
+
+def _item(item_id: str, **kwargs) -> DriveItemInfo:
+    return DriveItemInfo(
+        id=item_id,
+        name=f"{item_id}.txt",
+        size=1,
+        parent_id="root",
+        e_tag=f'"{{{item_id}}},1"',
+        c_tag=f'"c:{{{item_id}}},1"',
+        quick_xor_hash=f"qx-{item_id}",
+        sha1_hash=f"SHA-{item_id}",
+        **kwargs,
+    )
+
+
+def test_rows_keep_revalidation_fields():
+    items = [_item("a"), _item("b")]
+    table = DriveItemTable(items)
+
+    assert list(table) == items
+    assert table.get("b") == items[1]
+
+
+def test_upsert_and_remove_carry_revalidation_fields():
+    table = DriveItemTable([_item("a"), _item("b"), _item("c")])
+    changed = DriveItemInfo(id="a", name="a.txt", c_tag="c2", sha1_hash="NEW")
+
+    table.upsert(changed)
+    assert table.remove("b")
+
+    assert table.get("a") == changed
+    assert table.get("c") == _item("c")
+    assert len(table) == 2
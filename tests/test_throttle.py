@@ -0,0 +1,194 @@
+"""Throttling: scheduler-owned retries and the adaptive concurrency limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from azure.core.credentials import AccessToken
+from msgraph_core import GraphClientFactory
+
+from src import onedrive
+from src.onedrive import OneDriveClient
+from src.throttle import AdaptiveLimiter, RequestScheduler
+
+
+class _StaticCredential:
+    async def get_token(self, *scopes, **kwargs) -> AccessToken:
+        return AccessToken("token", int(time.time()) + 3600)
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def throttled_twice(monkeypatch):
+    """Route credential-built clients to a transport that throttles twice."""
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) <= 2:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"id": "item-1", "name": "a.txt"})
+
+    create = GraphClientFactory.create_with_default_middleware
+
+    def create_with_mock(*args, **kwargs):
+        kwargs["client"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return create(*args, **kwargs)
+
+    monkeypatch.setattr(
+        onedrive.GraphClientFactory, "create_with_default_middleware", create_with_mock
+    )
+    return calls
+
+
+async def test_scheduler_sees_every_throttled_attempt(throttled_twice):
+    scheduler = RequestScheduler(default_retry_after=0)
+    client = OneDriveClient(credential=_StaticCredential(), scheduler=scheduler)
+
+    info = await client.get_item("drive", "item-1")
+
+    assert info.name == "a.txt"
+    assert len(throttled_twice) == 3
+    assert scheduler.stats("drive").throttled == 2
+
+
+async def test_sdk_retries_kept_without_scheduler(monkeypatch):
+    built: list[bool] = []
+    build = onedrive._graph_client
+
+    def spy(credential, scopes, *, sdk_retries: bool):
+        built.append(sdk_retries)
+        return build(credential, scopes, sdk_retries=sdk_retries)
+
+    monkeypatch.setattr(onedrive, "_graph_client", spy)
+    OneDriveClient(credential=_StaticCredential())
+    OneDriveClient(credential=_StaticCredential(), scheduler=RequestScheduler())
+
+    assert built == [True, False]
+
+
+class _Clock:
+    """Manually advanced time source for ``AdaptiveLimiter``."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _throttled_error() -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://download.example/blob")
+    response = httpx.Response(429, headers={"Retry-After": "1"}, request=request)
+    return httpx.HTTPStatusError("throttled", request=request, response=response)
+
+
+async def _round(limiter: AdaptiveLimiter, count: int, *, error=None, took=0.0):
+    """Run *count* calls that are all in flight together, then finish them."""
+    gate = asyncio.Event()
+    clock = limiter._clock
+
+    async def call():
+        await gate.wait()
+        if error is not None:
+            raise error
+        return None
+
+    tasks = [asyncio.ensure_future(limiter.run(call)) for _ in range(count)]
+    while limiter.stats().in_flight < min(count, limiter.limit):
+        await asyncio.sleep(0)
+    clock.now += took
+    gate.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def test_limiter_grows_only_while_saturated():
+    limiter = AdaptiveLimiter(initial=2, clock=_Clock())
+    for _ in range(10):
+        await _round(limiter, 1)
+    assert limiter.limit == 2
+
+    for _ in range(3):
+        await _round(limiter, limiter.limit)
+
+    assert limiter.limit == 3
+    assert [change.reason for change in limiter.history] == ["increase"]
+
+
+async def test_one_throttling_burst_cuts_the_limit_once():
+    clock = _Clock()
+    limiter = AdaptiveLimiter(initial=8, clock=clock)
+
+    results = await _round(limiter, 8, error=_throttled_error(), took=1.0)
+
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+    assert limiter.limit == 4
+    assert limiter.stats().throttled == 8
+    assert [(c.at, c.limit, c.reason) for c in limiter.history] == [
+        (1.0, 4, "throttled")
+    ]
+
+    clock.now += 1.0
+    await _round(limiter, 1, error=_throttled_error())
+
+    assert limiter.limit == 2
+
+
+async def test_rising_latency_cuts_the_limit():
+    clock = _Clock()
+    limiter = AdaptiveLimiter(initial=8, clock=clock)
+    for _ in range(5):
+        await _round(limiter, 1, took=1.0)
+    assert limiter.limit == 8
+
+    for _ in range(2):
+        await _round(limiter, 1, took=5.0)
+
+    assert limiter.limit == 4
+    assert limiter.history[-1].reason == "latency"
+    # The baseline follows regressions only slowly.
+    assert limiter.stats().baseline_latency < 1.01
+
+
+async def test_limit_stays_within_its_bounds():
+    clock = _Clock()
+    limiter = AdaptiveLimiter(initial=2, min_limit=2, max_limit=2, clock=clock)
+
+    await _round(limiter, 2, error=_throttled_error(), took=1.0)
+    for _ in range(5):
+        await _round(limiter, 2)
+
+    assert limiter.limit == 2
+    assert list(limiter.history) == []
+
+
+async def test_history_is_bounded():
+    clock = _Clock()
+    limiter = AdaptiveLimiter(initial=16, history_size=2, clock=clock)
+
+    for limit in (8, 4, 2):
+        clock.now += 1.0
+        await _round(limiter, 1, error=_throttled_error())
+        assert limiter.limit == limit
+
+    assert [change.limit for change in limiter.history] == [4, 2]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"initial": 0},
+        {"initial": 4, "min_limit": 5},
+        {"initial": 4, "max_limit": 3},
+        {"decrease": 1.0},
+        {"decrease": 0.0},
+    ],
+)
+def test_invalid_limiter_settings_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(**kwargs)
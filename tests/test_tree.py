@@ -0,0 +1,212 @@
+"""Whole-tree transfers against a mocked drive."""
+
+from __future__ import annotations
+
+import os
+import re
+
+import httpx
+import pytest
+
+from kiota_abstractions.api_error import APIError
+
+from src.hashing import hash_bytes
+from src.throttle import AdaptiveLimiter
+
+
+CONTENT = os.urandom(50_000)
+MODIFIED = "2024-05-02T11:30:00Z"
+
+
+def _file(download_url: str) -> dict:
+    return {
+        "id": "item-1",
+        "name": "b.bin",
+        "size": len(CONTENT),
+        "lastModifiedDateTime": MODIFIED,
+        "file": {"hashes": {"quickXorHash": hash_bytes(CONTENT)[0]}},
+        "@microsoft.graph.downloadUrl": download_url,
+    }
+
+
+class ExpiringDrive:
+    """A one-file drive whose listing hands out an already expired download URL."""
+
+    def __init__(self) -> None:
+        self.expired_requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        if "/children" in url:
+            return httpx.Response(
+                200, json={"value": [_file("https://download.example/expired")]}
+            )
+        if request.url.host == "graph.microsoft.com":
+            return httpx.Response(200, json=_file("https://download.example/fresh"))
+        if request.url.path == "/expired":
+            self.expired_requests += 1
+            return httpx.Response(403)
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers.get("Range", ""))
+        if match is None:
+            return httpx.Response(200, content=CONTENT)
+        return httpx.Response(206, content=CONTENT[int(match[1]) : int(match[2]) + 1])
+
+
+@pytest.mark.parametrize("max_connections", [1, 4])
+async def test_download_tree_refreshes_expired_urls(
+    make_client, tmp_path, max_connections
+):
+    drive = ExpiringDrive()
+    client = make_client(drive)
+
+    report = await client.download_tree(
+        "drive",
+        "root",
+        tmp_path,
+        max_connections=max_connections,
+        range_size=16_384,
+    )
+
+    assert report.failures == {}
+    assert report.files_transferred == 1
+    assert drive.expired_requests >= 1
+    assert (tmp_path / "b.bin").read_bytes() == CONTENT
+
+
+async def test_download_tree_skips_files_already_mirrored(make_client, tmp_path):
+    client = make_client(ExpiringDrive())
+    await client.download_tree("drive", "root", tmp_path)
+
+    report = await client.download_tree("drive", "root", tmp_path)
+
+    assert report.files_skipped == 1
+    assert report.files_transferred == 0
+
+
+async def test_download_tree_raises_listing_errors_plainly(make_client, tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, json={"error": {"code": "generalException"}})
+
+    client = make_client(handler)
+
+    with pytest.raises(APIError) as info:
+        await client.download_tree("drive", "root", tmp_path)
+    assert info.value.response_status_code == 500
+
+
+async def test_download_tree_routes_ranges_through_the_limiter(make_client, tmp_path):
+    limiter = AdaptiveLimiter(initial=2)
+    client = make_client(ExpiringDrive())
+
+    report = await client.download_tree(
+        "drive", "root", tmp_path, range_size=16_384, limiter=limiter
+    )
+
+    assert report.files_transferred == 1
+    assert (tmp_path / "b.bin").read_bytes() == CONTENT
+    assert limiter.stats().latency is not None
+
+
+def _write(root, files: dict[str, bytes]) -> None:
+    for path, content in files.items():
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+
+
+def _remote_files(tree) -> dict[str, bytes]:
+    return {tree.path_of(i): content for i, content in tree.contents.items()}
+
+
+async def test_upload_tree_reuses_existing_folders(make_client, tree, tmp_path):
+    backup = tree.add_folder("root", "Backup")
+    docs = tree.add_folder(backup, "Docs")
+    _write(tmp_path, {"docs/a.txt": b"a", "new/b.txt": b"bb"})
+    client = make_client(tree)
+
+    report = await client.upload_tree(tmp_path, "drive", "Backup")
+
+    assert report.ok
+    assert report.folders_created == 1
+    assert tree.child(docs, "a.txt") is not None
+    assert sorted(tree.items[i]["name"] for i in tree.parents if i != backup) == [
+        "Docs",
+        "a.txt",
+        "b.txt",
+        "new",
+    ]
+
+
+async def test_upload_tree_splits_simple_and_session_uploads(
+    make_client, tree, tmp_path
+):
+    _write(tmp_path, {"small.txt": b"12345", "big.bin": bytes(100)})
+    client = make_client(tree)
+
+    report = await client.upload_tree(tmp_path, "drive", simple_upload_max=10)
+
+    assert ("PUT", "/v1.0/drives/drive/items/root:/small.txt:/content") in (
+        tree.requests
+    )
+    assert (
+        "POST",
+        "/v1.0/drives/drive/items/root:/big.bin:/createUploadSession",
+    ) in tree.requests
+    assert _remote_files(tree) == {"small.txt": b"12345", "big.bin": bytes(100)}
+    assert report.files_transferred == 2
+    assert report.bytes_transferred == 105
+
+
+async def test_upload_tree_applies_include_and_exclude(make_client, tree, tmp_path):
+    _write(
+        tmp_path,
+        {
+            "keep.txt": b"k",
+            "notes.md": b"n",
+            "draft.tmp.txt": b"d",
+            "skip/inner.txt": b"s",
+            "sub/deep.txt": b"d",
+        },
+    )
+    client = make_client(tree)
+
+    report = await client.upload_tree(
+        tmp_path, "drive", include=["*.txt"], exclude=["skip", "*.tmp.txt"]
+    )
+
+    assert sorted(_remote_files(tree)) == ["keep.txt", "sub/deep.txt"]
+    assert tree.resolve("root:/skip:") is None
+    assert report.folders_created == 1
+
+
+async def test_upload_tree_reports_counts_and_skips_unchanged(
+    make_client, tree, tmp_path
+):
+    _write(tmp_path, {"a.txt": b"aaa", "b/c.txt": b"cc"})
+    client = make_client(tree)
+    first = await client.upload_tree(tmp_path, "drive", "Out")
+    (tmp_path / "a.txt").write_bytes(b"changed")
+
+    second = await client.upload_tree(tmp_path, "drive", "Out", skip_unchanged=True)
+
+    assert (first.files_transferred, first.bytes_transferred) == (2, 5)
+    assert first.folders_created == 1
+    assert (second.files_transferred, second.bytes_transferred) == (1, 7)
+    assert second.files_skipped == 1
+    assert second.folders_created == 0
+    assert _remote_files(tree)["Out/a.txt"] == b"changed"
+
+
+async def test_upload_tree_continues_past_a_failed_folder(make_client, tree, tmp_path):
+    tree.errors["bad"] = 403
+    _write(tmp_path, {"bad/x.txt": b"x", "bad/sub/y.txt": b"y", "good/z.txt": b"z"})
+    client = make_client(tree)
+
+    report = await client.upload_tree(tmp_path, "drive")
+
+    assert sorted(report.failures) == ["bad", "bad/sub", "bad/sub/y.txt", "bad/x.txt"]
+    assert report.failures["bad/x.txt"] is report.failures["bad"]
+    assert isinstance(report.failures["bad"], APIError)
+    assert not report.ok
+    assert _remote_files(tree) == {"good/z.txt": b"z"}
+    assert report.files_transferred == 1
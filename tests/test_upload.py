@@ -0,0 +1,109 @@
+"""Resumable upload sessions."""
+
+from __future__ import annotations
+
+import io
+
+import httpx
+import pytest
+
+
+UNIT = 320 * 1024
+UPLOAD_URL = "https://upload.example/session"
+
+
+class SessionDrive:
+    """Plays Graph's upload session, failing one chunk after storing it.
+
+    The failed chunk's bytes are kept, as when the reply is lost after the
+    server has accepted them, so the client has to ask where to resume.
+    """
+
+    def __init__(self, total: int, *, fail_at: int, failure: httpx.Response) -> None:
+        self.data = bytearray(total)
+        self.received = 0
+        self.fail_at = fail_at
+        self.failure = failure
+        self.ranges: list[str] = []
+        self.deleted = False
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/createUploadSession"):
+            return httpx.Response(200, json={"uploadUrl": UPLOAD_URL})
+        assert str(request.url) == UPLOAD_URL
+        if request.method == "GET":
+            return httpx.Response(
+                200, json={"nextExpectedRanges": [f"{self.received}-"]}
+            )
+        if request.method == "DELETE":
+            self.deleted = True
+            return httpx.Response(204)
+        content_range = request.headers["Content-Range"]
+        self.ranges.append(content_range)
+        start = int(content_range.split()[1].split("-")[0])
+        self.data[start : start + len(request.content)] = request.content
+        self.received = start + len(request.content)
+        if start == self.fail_at and self.failure is not None:
+            failure, self.failure = self.failure, None
+            return failure
+        if self.received == len(self.data):
+            return httpx.Response(201, json={"id": "item-1", "name": "big.bin"})
+        return httpx.Response(202, json={"nextExpectedRanges": [f"{self.received}-"]})
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "delay"),
+    [("1.5", 1.5), ("Wed, 21 Oct 2015 07:28:00 GMT", 2)],
+)
+async def test_upload_resumes_from_next_expected_range(
+    make_client, no_backoff, retry_after, delay
+):
+    content = bytes(range(256)) * (3 * UNIT // 256)
+    drive = SessionDrive(
+        len(content),
+        fail_at=UNIT,
+        failure=httpx.Response(503, headers={"Retry-After": retry_after}),
+    )
+    client = make_client(drive)
+
+    info = await client.upload_large_file(
+        "drive", "root", "big.bin", io.BytesIO(content), chunk_size=UNIT
+    )
+
+    assert info.id == "item-1"
+    assert bytes(drive.data) == content
+    assert drive.ranges == [
+        f"bytes 0-{UNIT - 1}/{3 * UNIT}",
+        f"bytes {UNIT}-{2 * UNIT - 1}/{3 * UNIT}",
+        f"bytes {2 * UNIT}-{3 * UNIT - 1}/{3 * UNIT}",
+    ]
+    assert no_backoff == [delay]
+
+
+async def test_upload_gives_up_on_client_errors(make_client, no_backoff):
+    drive = SessionDrive(2 * UNIT, fail_at=UNIT, failure=httpx.Response(400))
+    client = make_client(drive)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.upload_large_file(
+            "drive", "root", "big.bin", io.BytesIO(bytes(2 * UNIT)), chunk_size=UNIT
+        )
+
+    assert drive.deleted
+    assert no_backoff == []
+
+
+async def test_failed_cleanup_keeps_the_upload_error(make_client, no_backoff):
+    drive = SessionDrive(2 * UNIT, fail_at=UNIT, failure=httpx.Response(400))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "DELETE":
+            raise httpx.ConnectError("session host unreachable", request=request)
+        return drive(request)
+
+    client = make_client(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.upload_large_file(
+            "drive", "root", "big.bin", io.BytesIO(bytes(2 * UNIT)), chunk_size=UNIT
+        )
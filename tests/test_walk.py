@@ -0,0 +1,116 @@
+"""Recursive, concurrent tree walks."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from kiota_abstractions.api_error import APIError
+
+
+@pytest.fixture
+def nested(tree):
+    """``A/{x.txt, B/{y.txt, C/z.txt}}``, an empty ``D`` and ``top.txt``."""
+    a = tree.add_folder("root", "A")
+    tree.add_file(a, "x.txt")
+    b = tree.add_folder(a, "B")
+    tree.add_file(b, "y.txt")
+    c = tree.add_folder(b, "C")
+    tree.add_file(c, "z.txt")
+    tree.add_folder("root", "D")
+    tree.add_file("root", "top.txt")
+    return tree
+
+
+async def _paths(client, **kwargs) -> set[str]:
+    return {path async for path, _ in client.walk("drive", **kwargs)}
+
+
+async def test_walk_yields_every_path(make_client, nested):
+    paths = await _paths(make_client(nested), max_concurrency=3)
+
+    assert paths == {
+        "A",
+        "A/x.txt",
+        "A/B",
+        "A/B/y.txt",
+        "A/B/C",
+        "A/B/C/z.txt",
+        "D",
+        "top.txt",
+    }
+
+
+async def test_max_depth_limits_the_levels_listed(make_client, nested):
+    client = make_client(nested)
+
+    assert await _paths(client, max_depth=1) == {"A", "D", "top.txt"}
+    assert await _paths(client, max_depth=2) == {
+        "A",
+        "A/x.txt",
+        "A/B",
+        "D",
+        "top.txt",
+    }
+
+
+@pytest.mark.parametrize("max_depth", [0, -1])
+async def test_max_depth_below_one_is_rejected(make_client, nested, max_depth):
+    client = make_client(nested)
+
+    with pytest.raises(ValueError, match="max_depth"):
+        await _paths(client, max_depth=max_depth)
+
+
+async def test_pruned_folders_are_yielded_but_not_listed(make_client, nested):
+    client = make_client(nested)
+
+    paths = await _paths(client, prune=lambda path, item: path == "A/B")
+
+    assert "A/B" in paths
+    assert not any(path.startswith("A/B/") for path in paths)
+    listed = {path for method, path in nested.requests if path.endswith("/children")}
+    assert len(listed) == 3  # The root, A and D.
+
+
+async def test_listing_errors_reach_the_consumer(make_client, nested):
+    failing = nested.resolve("root:/A/B:")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith(f"/items/{failing}/children"):
+            return httpx.Response(403, json={"error": {"code": "accessDenied"}})
+        return nested(request)
+
+    client = make_client(handler)
+
+    with pytest.raises(APIError) as info:
+        await _paths(client)
+    assert info.value.response_status_code == 403
+
+
+async def test_closing_early_cancels_the_workers(make_client, nested):
+    listing_b = nested.resolve("root:/A/B:")
+    blocked = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith(f"/items/{listing_b}/children"):
+            blocked.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return nested(request)
+
+    client = make_client(handler)
+    walk = client.walk("drive")
+    async for path, _ in walk:
+        if path == "A/B":
+            break
+    await blocked.wait()
+
+    await walk.aclose()
+
+    assert cancelled.is_set()